@@ -0,0 +1,153 @@
+#!/usr/bin/python3
+
+"""Generate the falling bricks rotation tables, and share the brick code.
+
+Reads `BRICK_SHAPES` from `bricks.gs`, and writes these tables into it:
+
+    * `BRICK_POW2`, the value of each bit;
+    * `BRICK_TABLES[shape][rotation]`, `[min dx, max dx, min dy, max dy, rows]`,
+      where rows is a `[dy, bitmask]` for each row of the brick, top row
+      first, with bit 0 at the brick's `min dx` column;
+    * `BRICK_KICKS[shape][rotation]`, the `[dx, dy]` wall kick offsets to try,
+      in order, when rotating into the rotation.
+
+Then copies all of `bricks.gs` into the single player and the multiplayer
+`fallingbricks.src`, between their "Shared brick code" lines, since each game
+is built from the one source file.  Run it after changing `bricks.gs`:
+
+    brick-tables.py [--check]
+
+With `--check`, it only reports whether any of the files are out of date.
+"""
+
+from typing import List, Tuple
+import json
+import os
+import re
+import sys
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SHARED = os.path.join(HERE, "bricks.gs")
+GAMES = (
+    os.path.join(HERE, "fallingbricks.src"),
+    os.path.join(HERE, "multiplayer", "fallingbricks.src"),
+)
+TABLES_START = "// ---- Generated by brick-tables.py from BRICK_SHAPES; do not edit.\n"
+TABLES_END = "// ---- End of generated tables.\n"
+SHARED_START = "// ---- Shared brick code; copied from bricks.gs by brick-tables.py, do not edit here.\n"
+SHARED_END = "// ---- End of shared brick code.\n"
+POW2_COUNT = 31
+
+
+def read_shapes(text: str) -> List[List[List[int]]]:
+    """The BRICK_SHAPES list; 4 rotations of [x1, y1, x2, y2, ...] cell offsets per shape."""
+    match = re.search(r"^BRICK_SHAPES = (\[.*?^\])", text, re.MULTILINE | re.DOTALL)
+    if match is None:
+        raise ValueError("no BRICK_SHAPES list in bricks.gs")
+    body = re.sub(r"//[^\n]*", "", match.group(1))
+    body = re.sub(r",(\s*\])", r"\1", body)
+    return json.loads(body)
+
+
+def rotation_table(offsets: List[int]) -> Tuple[int, int, int, int, List[Tuple[int, int]]]:
+    cells = list(zip(offsets[0::2], offsets[1::2]))
+    min_x = min(x for x, _ in cells)
+    rows = {}
+    for x, y in cells:
+        rows[y] = rows.get(y, 0) | (1 << (x - min_x))
+    return (
+        min_x, max(x for x, _ in cells), min(y for _, y in cells), max(y for _, y in cells),
+        sorted(rows.items()),
+    )
+
+
+def kicks(shape: List[List[int]], rotation: int) -> List[Tuple[int, int]]:
+    """Try in place, then sideways by up to half the brick's width, then up one."""
+    table = rotation_table(shape[rotation])
+    ret = [(0, 0)]
+    if all(sorted(zip(other[0::2], other[1::2])) == sorted(zip(shape[rotation][0::2], shape[rotation][1::2])) for other in shape):
+        # Doesn't change when rotated.
+        return ret
+    width = table[1] - table[0] + 1
+    for step in range(1, (width + 1) // 2 + 1):
+        ret.extend(((-step, 0), (step, 0)))
+    ret.append((0, -1))
+    return ret
+
+
+def gs_list(value: object) -> str:
+    return json.dumps(value, separators=(", ", ": ")).replace("(", "[").replace(")", "]")
+
+
+def tables(shapes: List[List[List[int]]]) -> str:
+    lines = [TABLES_START.rstrip("\n")]
+    lines.append("BRICK_POW2 = " + gs_list([1 << bit for bit in range(POW2_COUNT)]))
+    lines.append("// Per shape, per rotation: [min dx, max dx, min dy, max dy, [[dy, row bitmask], ...]]")
+    lines.append("BRICK_TABLES = [")
+    for shape in shapes:
+        lines.append("    [")
+        for offsets in shape:
+            min_x, max_x, min_y, max_y, rows = rotation_table(offsets)
+            lines.append(f"        [{min_x}, {max_x}, {min_y}, {max_y}, {gs_list([list(row) for row in rows])}],")
+        lines.append("    ],")
+    lines.append("]")
+    lines.append("// Per shape, per rotation: the [dx, dy] offsets to try when rotating into it.")
+    lines.append("BRICK_KICKS = [")
+    for shape in shapes:
+        lines.append("    [")
+        for rotation in range(len(shape)):
+            lines.append(f"        {gs_list([list(kick) for kick in kicks(shape, rotation)])},")
+        lines.append("    ],")
+    lines.append("]")
+    lines.append(TABLES_END.rstrip("\n"))
+    return "\n".join(lines) + "\n"
+
+
+def replace_between(text: str, start: str, end: str, body: str, name: str) -> str:
+    begin = text.find(start)
+    finish = text.find(end, begin + 1)
+    if begin < 0 or finish < 0:
+        raise ValueError(f"{name} has no '{start.strip()}' ... '{end.strip()}' lines")
+    return text[:begin] + body + text[finish + len(end):]
+
+
+def usage() -> None:
+    sys.stderr.write(f"Usage: {sys.argv[0]} [--check]\n")
+    sys.exit(1)
+
+
+def main(args: List[str]) -> None:
+    check = False
+    for arg in args:
+        if arg == "--check":
+            check = True
+        else:
+            usage()
+    with open(SHARED, "r", encoding="utf-8") as fis:
+        shared = fis.read()
+    updates = {}
+    shared = replace_between(shared, TABLES_START, TABLES_END, tables(read_shapes(shared)), SHARED)
+    updates[SHARED] = shared
+    for game in GAMES:
+        with open(game, "r", encoding="utf-8") as fis:
+            text = fis.read()
+        updates[game] = replace_between(text, SHARED_START, SHARED_END, SHARED_START + shared + SHARED_END, game)
+
+    stale = []
+    for path, text in updates.items():
+        with open(path, "r", encoding="utf-8") as fis:
+            if fis.read() == text:
+                continue
+        stale.append(os.path.relpath(path, HERE))
+        if not check:
+            with open(path, "w", encoding="utf-8", newline="") as fos:
+                fos.write(text)
+    if check:
+        print("Out of date: " + ", ".join(stale) if stale else "Up to date.")
+        sys.exit(1 if stale else 0)
+    print("Updated: " + ", ".join(stale) if stale else "Already up to date.")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,469 @@
+// Falling bricks pieces, physics, and drawing.
+//
+// Shared by the single player and the multiplayer games; `brick-tables.py` copies
+// this file into both `fallingbricks.src` files, between the "Shared brick code"
+// lines, since each game is built from a single source file.
+//
+// The board is one bitmask per row, bit x for column x, and each brick rotation
+// is a list of row bitmasks (BRICK_TABLES), so collisions, landing, and full rows
+// are a few bit operations per row.
+
+BRICK_SHAPES = [
+    // Split into x1, y1, x2, y2, x3, y3, x4, y4
+    //    Per rotation.
+    // Must be centered to allow easy rotation
+    // square.  Does not rotate.
+    [
+        [0, 0, 0, 1, 1, 0, 1, 1],
+        [0, 0, 0, 1, 1, 0, 1, 1],
+        [0, 0, 0, 1, 1, 0, 1, 1],
+        [0, 0, 0, 1, 1, 0, 1, 1],
+    ],
+    // stick
+    [
+        [-2,  1, -1,  1,  0,  1,  1,  1],
+        [-1, -2, -1, -1, -1,  0, -1,  1],
+        [-2,  2, -1,  2,  0,  2,  1,  2],
+        [ 0, -2,  0, -1,  0,  0,  0,  1],
+    ],
+    // L 1
+    [
+        [-1, -1, -1,  0,  0,  0,  1,  0],
+        [ 0, -1,  1, -1,  0,  0,  0,  1],
+        [-1,  0,  0,  0,  1,  0,  1,  1],
+        [-1,  1,  0,  1,  0,  0,  0, -1],
+    ],
+    // L 2
+    [
+        [-1,  0,  0,  0,  1,  0,  1, -1],
+        [ 0, -1,  0,  0,  0,  1,  1,  1],
+        [-1,  1, -1,  0,  0,  0,  1,  0],
+        [-1, -1,  0, -1,  0,  0,  0,  1],
+    ],
+    // T
+    [
+        [-1,  0,  0, -1,  0,  0,  1,  0],
+        [ 0, -1,  0,  0,  0,  1,  1,  0],
+        [-1,  0,  0,  1,  0,  0,  1,  0],
+        [-1,  0,  0, -1,  0,  0,  0,  1],
+    ],
+    // S1
+    [
+        [-1,  0,  0,  0,  0,  1,  1,  1],
+        [ 0, -1,  0,  0, -1,  0, -1,  1],
+        [-1,  0,  0,  0,  0,  1,  1,  1],
+        [ 0, -1,  0,  0, -1,  0, -1,  1],
+    ],
+    // S2
+    [
+        [-1,  1,  0,  1,  0,  0,  1,  0],
+        [-1, -1, -1,  0,  0,  0,  0,  1],
+        [-1,  1,  0,  1,  0,  0,  1,  0],
+        [-1, -1, -1,  0,  0,  0,  0,  1],
+    ],
+]
+BRICK_SHAPE_COLOR = [
+    // square
+    "#1010ff",
+    // stick
+    "#ff1010",
+    // L 1
+    "#00c0c0",
+    // L 2
+    "#c0c000",
+    // T
+    "#406080",
+    // S1
+    "#c000c0",
+    // S2
+    "#806040",
+]
+BRICK_SHAPE_COLOR_PLACED = [
+    // square
+    "#080880",
+    // stick
+    "#800808",
+    // L 1
+    "#006060",
+    // L 2
+    "#606000",
+    // T
+    "#203040",
+    // S1
+    "#600060",
+    // S2
+    "#403020",
+]
+
+// ---- Generated by brick-tables.py from BRICK_SHAPES; do not edit.
+BRICK_POW2 = [1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768, 65536, 131072, 262144, 524288, 1048576, 2097152, 4194304, 8388608, 16777216, 33554432, 67108864, 134217728, 268435456, 536870912, 1073741824]
+// Per shape, per rotation: [min dx, max dx, min dy, max dy, [[dy, row bitmask], ...]]
+BRICK_TABLES = [
+    [
+        [0, 1, 0, 1, [[0, 3], [1, 3]]],
+        [0, 1, 0, 1, [[0, 3], [1, 3]]],
+        [0, 1, 0, 1, [[0, 3], [1, 3]]],
+        [0, 1, 0, 1, [[0, 3], [1, 3]]],
+    ],
+    [
+        [-2, 1, 1, 1, [[1, 15]]],
+        [-1, -1, -2, 1, [[-2, 1], [-1, 1], [0, 1], [1, 1]]],
+        [-2, 1, 2, 2, [[2, 15]]],
+        [0, 0, -2, 1, [[-2, 1], [-1, 1], [0, 1], [1, 1]]],
+    ],
+    [
+        [-1, 1, -1, 0, [[-1, 1], [0, 7]]],
+        [0, 1, -1, 1, [[-1, 3], [0, 1], [1, 1]]],
+        [-1, 1, 0, 1, [[0, 7], [1, 4]]],
+        [-1, 0, -1, 1, [[-1, 2], [0, 2], [1, 3]]],
+    ],
+    [
+        [-1, 1, -1, 0, [[-1, 4], [0, 7]]],
+        [0, 1, -1, 1, [[-1, 1], [0, 1], [1, 3]]],
+        [-1, 1, 0, 1, [[0, 7], [1, 1]]],
+        [-1, 0, -1, 1, [[-1, 3], [0, 2], [1, 2]]],
+    ],
+    [
+        [-1, 1, -1, 0, [[-1, 2], [0, 7]]],
+        [0, 1, -1, 1, [[-1, 1], [0, 3], [1, 1]]],
+        [-1, 1, 0, 1, [[0, 7], [1, 2]]],
+        [-1, 0, -1, 1, [[-1, 2], [0, 3], [1, 2]]],
+    ],
+    [
+        [-1, 1, 0, 1, [[0, 3], [1, 6]]],
+        [-1, 0, -1, 1, [[-1, 2], [0, 3], [1, 1]]],
+        [-1, 1, 0, 1, [[0, 3], [1, 6]]],
+        [-1, 0, -1, 1, [[-1, 2], [0, 3], [1, 1]]],
+    ],
+    [
+        [-1, 1, 0, 1, [[0, 6], [1, 3]]],
+        [-1, 0, -1, 1, [[-1, 1], [0, 3], [1, 2]]],
+        [-1, 1, 0, 1, [[0, 6], [1, 3]]],
+        [-1, 0, -1, 1, [[-1, 1], [0, 3], [1, 2]]],
+    ],
+]
+// Per shape, per rotation: the [dx, dy] offsets to try when rotating into it.
+BRICK_KICKS = [
+    [
+        [[0, 0]],
+        [[0, 0]],
+        [[0, 0]],
+        [[0, 0]],
+    ],
+    [
+        [[0, 0], [-1, 0], [1, 0], [-2, 0], [2, 0], [0, -1]],
+        [[0, 0], [-1, 0], [1, 0], [0, -1]],
+        [[0, 0], [-1, 0], [1, 0], [-2, 0], [2, 0], [0, -1]],
+        [[0, 0], [-1, 0], [1, 0], [0, -1]],
+    ],
+    [
+        [[0, 0], [-1, 0], [1, 0], [-2, 0], [2, 0], [0, -1]],
+        [[0, 0], [-1, 0], [1, 0], [0, -1]],
+        [[0, 0], [-1, 0], [1, 0], [-2, 0], [2, 0], [0, -1]],
+        [[0, 0], [-1, 0], [1, 0], [0, -1]],
+    ],
+    [
+        [[0, 0], [-1, 0], [1, 0], [-2, 0], [2, 0], [0, -1]],
+        [[0, 0], [-1, 0], [1, 0], [0, -1]],
+        [[0, 0], [-1, 0], [1, 0], [-2, 0], [2, 0], [0, -1]],
+        [[0, 0], [-1, 0], [1, 0], [0, -1]],
+    ],
+    [
+        [[0, 0], [-1, 0], [1, 0], [-2, 0], [2, 0], [0, -1]],
+        [[0, 0], [-1, 0], [1, 0], [0, -1]],
+        [[0, 0], [-1, 0], [1, 0], [-2, 0], [2, 0], [0, -1]],
+        [[0, 0], [-1, 0], [1, 0], [0, -1]],
+    ],
+    [
+        [[0, 0], [-1, 0], [1, 0], [-2, 0], [2, 0], [0, -1]],
+        [[0, 0], [-1, 0], [1, 0], [0, -1]],
+        [[0, 0], [-1, 0], [1, 0], [-2, 0], [2, 0], [0, -1]],
+        [[0, 0], [-1, 0], [1, 0], [0, -1]],
+    ],
+    [
+        [[0, 0], [-1, 0], [1, 0], [-2, 0], [2, 0], [0, -1]],
+        [[0, 0], [-1, 0], [1, 0], [0, -1]],
+        [[0, 0], [-1, 0], [1, 0], [-2, 0], [2, 0], [0, -1]],
+        [[0, 0], [-1, 0], [1, 0], [0, -1]],
+    ],
+]
+// ---- End of generated tables.
+
+// InitBrick Create a new brick at the top of the screen.
+InitBrick = function(state)
+    // Officially, the brick shape is supposed to come from
+    // a large bag, to prevent an infinite ordering of specific
+    // shapes that cause an unsolvable board.
+    // We need at least 1 item in the bag at all times, for the
+    // preview.
+    if state.future_bag.len < 2 then
+        // Fill the bag with a large number of same number items.
+        for i in range(0, BRICK_SHAPES.len - 1)
+            for j in range(0, 20)
+                state.future_bag.push(i)
+            end for
+        end for
+        // Then shuffle it.
+        for i in range(0, state.future_bag.len - 2)
+            // This math should be right...
+            j = floor(rnd() * (state.future_bag.len - i)) + i
+            // But just in case...
+            if j < i then j == i
+            if j >= state.future_bag.len then j = state.future_bag.len - 1
+            x = state.future_bag[j]
+            state.future_bag[j] = state.future_bag[i]
+            state.future_bag[i] = x
+        end for
+    end if
+
+    if state.previewBrick == null then state.previewBrick = state.future_bag.pop()
+
+    state.brickShape = state.previewBrick
+    state.previewBrick = state.future_bag.pop()
+    state.brickRotate = 0
+    state.brickX = floor(state.boardWidth / 2)
+    state.brickY = 1
+end function
+
+
+// InitGame() Initialize the map to a new game state.
+InitGame = function(state)
+    state.speed = BASE_SPEED - ((state.level - 1) * 10)
+    state.timer = 0
+
+    // One bitmask per row, and the placed brick colors.
+    state.board = []
+    state.colors = []
+    for y in range(0, state.boardHeight)
+        state.board.push(0)
+        state.colors.push(EmptyColorRow(state))
+    end for
+    state.fullRow = BRICK_POW2[state.boardWidth + 1] - 1
+
+    // Drawn rows, redrawn when the board row changes or the brick in the row moves.
+    state.rowText = []
+    state.rowSig = []
+    state.rowDirty = []
+    for y in range(0, state.boardHeight)
+        state.rowText.push("")
+        state.rowSig.push(-1)
+        state.rowDirty.push(true)
+    end for
+    state.previewLines = []
+    state.previewShown = null
+    state.lastScreen = ""
+
+    state.future_bag = []
+    state.previewBrick = null
+    InitBrick(state)
+end function
+
+// EmptyColorRow() A row of the placed brick colors, with nothing placed.
+EmptyColorRow = function(state)
+    ret = []
+    for x in range(0, state.boardWidth)
+        ret.push(null)
+    end for
+    return ret
+end function
+
+// BrickCollisionRow() The first row where the brick's rotation at (x, y) hits a wall, the floor, or a placed brick.
+//
+// Returns null if the brick fits.
+BrickCollisionRow = function(state, shape, rotate, x, y)
+    table = BRICK_TABLES[shape][rotate]
+    left = x + table[0]
+    if left < 0 or x + table[1] > state.boardWidth or y + table[2] < 0 then return y + table[2]
+    for row in table[4]
+        by = y + row[0]
+        if by > state.boardHeight then return by
+        if bitAnd(state.board[by], row[1] * BRICK_POW2[left]) != 0 then return by
+    end for
+    return null
+end function
+
+// DrawFrame() Draws one frame of the game.
+//
+// Each board row's text is kept, and only rebuilt when the row changes.  The whole
+// screen is still printed whenever anything on it changes; only a frame where nothing
+// changed, such as the frames between the brick's drops, skips the print.  So nothing
+// on the screen may change every frame, like the gravity timer.
+DrawFrame = function(state)
+    // Draw screen
+    lines = [
+        "Score: " + state.score + "   Level: " + state.level + "   Hi Score: " + state.hiscore,
+        "Debug: " + state.last + " " + state.lastAction + " " + state.brickY,
+        state.border + state.previewBorder,
+    ]
+    if state.previewShown != state.previewBrick then
+        state.previewShown = state.previewBrick
+        state.previewLines = []
+        brickAdj = BRICK_SHAPES[state.previewBrick][0]
+        color = BRICK_SHAPE_COLOR[state.previewBrick]
+        for y in range(0, 3)
+            line = "  |"
+            for x in range(0, 3)
+                val = "  "
+                for i in range(0, 3)
+                    if brickAdj[i * 2] + 1 == x and brickAdj[(i * 2) + 1] + 1 == y then
+                        val = "<mark=" + color + "ff><color=" + color + ">PP</color></mark>"
+                        break
+                    end if
+                end for
+                line = line + val
+            end for
+            state.previewLines.push(line + "|")
+        end for
+        state.previewLines.push(state.previewBorder)
+    end if
+
+    // The falling brick's bitmask for each row it's in.
+    table = BRICK_TABLES[state.brickShape][state.brickRotate]
+    left = state.brickX + table[0]
+    brickRows = {}
+    for row in table[4]
+        brickRows[state.brickY + row[0]] = row[1] * BRICK_POW2[left]
+    end for
+    color = BRICK_SHAPE_COLOR[state.brickShape]
+    for y in range(0, state.boardHeight)
+        brickMask = 0
+        if brickRows.hasIndex(y) then brickMask = brickRows[y]
+        sig = (brickMask * 8) + state.brickShape
+        if state.rowDirty[y] or sig != state.rowSig[y] then
+            mask = state.board[y]
+            colors = state.colors[y]
+            line = "<size=1em>|"
+            for x in range(0, state.boardWidth)
+                bit = BRICK_POW2[x]
+                if bitAnd(mask, bit) != 0 then
+                    line = line + "<mark=" + colors[x] + "ff><color=" + colors[x] + ">XX</color></mark>"
+                else if bitAnd(brickMask, bit) != 0 then
+                    line = line + "<mark=" + color + "ff><color=" + color + ">MM</color></mark>"
+                else
+                    line = line + "  "
+                end if
+            end for
+            state.rowText[y] = line + "|"
+            state.rowSig[y] = sig
+            state.rowDirty[y] = false
+        end if
+        line = state.rowText[y]
+        if y < state.previewLines.len then line = line + state.previewLines[y]
+        lines.push(line)
+    end for
+    lines.push(state.border)
+    screen = lines.join(char(10))
+    // Nothing moved, so leave the screen alone.
+    if screen == state.lastScreen then return
+    state.lastScreen = screen
+    //clear_screen
+    // A single print is much faster and reduces flashing.
+    print(screen, 1)
+end function
+
+// GameStep Perform one frame of physics
+GamePhysicsFrame = function(state)
+    // initial bounds checking to ensure the brick is in the game board.
+    // If the game logic was 100% sound, then this would be unneccessary.
+    table = BRICK_TABLES[state.brickShape][state.brickRotate]
+    if state.brickX + table[0] < 0 then state.brickX = -table[0]
+    if state.brickX + table[1] > state.boardWidth then state.brickX = state.boardWidth - table[1]
+    if state.brickY + table[2] < 0 then state.brickY = -table[2]
+    if state.brickY + table[3] > state.boardHeight then state.brickY = state.boardHeight - table[3]
+
+    state.collisionTop = null
+
+    // Perform gravity based on the timer.
+    state.timer = state.timer - 1
+    if state.timer < 0 then
+        state.timer = state.speed
+
+        // At this point, we check if the + 1 y causes a collision.
+        // Ignore input for left or right.
+        colY = BrickCollisionRow(state, state.brickShape, state.brickRotate, state.brickX, state.brickY + 1)
+        if colY != null then
+            state.collisionTop = colY
+            return
+        end if
+
+        // No direct collision, so keep going in physics.
+        // But make affected by gravity.
+        // There's at most 1 y change at once.
+        state.deltay = 1
+    end if
+
+    // Perform movements first on a temporary position.  This allows rotations to
+    // also happen.  A rotation that overlaps something tries the wall kick offsets,
+    // in order, and takes the first one without collisions.
+    tmpRotate = state.brickRotate + state.rotate
+    if tmpRotate < 0 then tmpRotate = 3
+    if tmpRotate > 3 then tmpRotate = 0
+    tmpX = state.brickX + state.deltax
+    tmpY = state.brickY + state.deltay
+    kicks = [[0, 0]]
+    if tmpRotate != state.brickRotate then kicks = BRICK_KICKS[state.brickShape][tmpRotate]
+    for kick in kicks
+        if BrickCollisionRow(state, state.brickShape, tmpRotate, tmpX + kick[0], tmpY + kick[1]) == null then
+            state.brickRotate = tmpRotate
+            state.brickX = tmpX + kick[0]
+            state.brickY = tmpY + kick[1]
+            return
+        end if
+    end for
+end function
+
+// GameSystems() Check the state of the game for status adjustments
+//
+// This is the rules enforcement system and scoring system.
+GameSystems = function(state)
+    if state.collisionTop != null then
+        // There was a collision.
+        if state.collisionTop <= 1 then
+            // End of game.
+            state.game = 0
+            return
+        end if
+
+        // Place the brick onto the board.
+        table = BRICK_TABLES[state.brickShape][state.brickRotate]
+        left = state.brickX + table[0]
+        for row in table[4]
+            y = state.brickY + row[0]
+            state.board[y] = bitOr(state.board[y], row[1] * BRICK_POW2[left])
+            state.rowDirty[y] = true
+        end for
+        brickAdj = BRICK_SHAPES[state.brickShape][state.brickRotate]
+        for i in range(0, 3)
+            brickX = state.brickX + brickAdj[i * 2]
+            brickY = state.brickY + brickAdj[(i * 2) + 1]
+            state.colors[brickY][brickX] = BRICK_SHAPE_COLOR_PLACED[state.brickShape]
+        end for
+
+        // Check for line removals
+        removedLines = 0
+        for y in range(1, state.boardHeight)
+            if state.board[y] == state.fullRow then
+                removedLines = removedLines + 1
+                // Drop the rows above down by one.
+                state.board.remove(y)
+                state.board.insert(0, 0)
+                state.colors.remove(y)
+                state.colors.insert(0, EmptyColorRow(state))
+                for up in range(0, y)
+                    state.rowDirty[up] = true
+                end for
+                // Because this is moving down, it doesn't
+                // need to be checked again.
+            end if
+        end for
+
+        // Adjust score + level
+        state.score = state.score + (removedLines * 4)
+        if state.score > state.hiscore then state.hiscore = state.score
+        state.level = floor(state.score / 20) + 1
+        state.speed = BASE_SPEED - ((state.level - 1) * floor(BASE_SPEED / 12))
+
+        // Create a new brick.
+        InitBrick(state)
+    end if
+end function
@@ -37,9 +37,8 @@ GameLib.New = function(context=null)
     end if
 
     ret.ctrlIdx = ""
-    ret.postId = {}
-    ret.postQueue = {}
-    ret.recvId = {}
+    ret.postLog = {}
+    ret.recvLog = {}
 
     // IsHost true if this player hosted the game; false if joined the game.
     ret.IsHost = ret.PlayerIndex == 0
@@ -99,30 +98,51 @@ end function
 // NewMessagesFrom Pull the latest messages from a single name, in the form [datetime, message, epoch].
 //
 // This is useful for pulling non-player messages, such as the host actions.
+// Only the text added since the last pull is parsed; see Post for the file format.
 GameLib.NewMessagesFrom = function(name)
     // pull all available messages from the location since the last pull.
     if self.server == null then return []
-    locStr = self.gameDir + "/" + name
-    maxRecvId = -1
-    if self.recvId.hasIndex(name) then maxRecvId = self.recvId[name]
-    prevRecvId = maxRecvId
-    file = self.server.File(locStr)
+    file = self.server.File(self.gameDir + "/" + name)
     if file == null then return []
     res = file.get_content
-    if res == null then return []
+    if res == null or res.len <= 0 or res[0] != "L" then return []
+    pos = res.indexOf(GameLib.msgSep)
+    if pos == null then pos = res.len
+    segment = res[1:pos].to_int
+    if not self.recvLog.hasIndex(name) then
+        self.recvLog[name] = {"segment": -1, "offset": 0, "seq": -1}
+    end if
+    msgLog = self.recvLog[name]
+    if segment < msgLog.segment or (segment == msgLog.segment and res.len < msgLog.offset) then
+        // The writer started over.
+        msgLog.segment = -1
+        msgLog.seq = -1
+    end if
+
     ret = []
-    for message in res.split(GameLib.msgSep)
-        p1 = message.indexOf(".")
-        if p1 == null then continue
-        idx = message[:p1].to_int
-        if idx <= prevRecvId then continue
-        if idx > maxRecvId then maxRecvId = idx
-        p2 = message.indexOf(".", p1 + 1)
-        if p2 == null then continue
-        when = message[p1+1:p2]
-        ret.push([when, message[p2+1:], GameLib.dateEpoch(when)])
-    end for
-    self.recvId[name] = maxRecvId
+    if segment == msgLog.segment then
+        GameLib.parseLog(res, msgLog.offset, msgLog, ret)
+    else
+        // Catch up on the segments archived since the last pull.
+        archived = msgLog.segment
+        if archived < segment - GameLib.keepSegments then archived = segment - GameLib.keepSegments
+        if archived < 0 then archived = 0
+        while archived < segment
+            file = self.server.File(self.gameDir + "/." + name + "." + archived)
+            if file != null then
+                content = file.get_content
+                if content != null then
+                    start = 0
+                    if archived == msgLog.segment then start = msgLog.offset
+                    GameLib.parseLog(content, start, msgLog, ret)
+                end if
+            end if
+            archived = archived + 1
+        end while
+        GameLib.parseLog(res, 0, msgLog, ret)
+    end if
+    msgLog.segment = segment
+    msgLog.offset = res.len
     return ret
 end function
 
@@ -140,33 +160,46 @@ end function
 
 // Post Post a message to the server file.
 //
+// The file holds the live segment of the message log: the header "L(segment number)",
+// followed by up to segmentLen entries, each prefixed with msgSep, in the form
+// "seq.date.message".  When the live segment fills up, it's archived to the file
+// ".(ref).(segment number)" and a new live segment starts.
+//
 // Returns a string on error, null on no error.
 GameLib.Post = function(message, ref = null)
     if self.server == null then return "not connected"
     if message.indexOf(GameLib.msgSep) != null then return "invalid message content"
     if ref == null then ref = self.PlayerName
-    idx = 0
-    if self.postId.hasIndex(ref) then idx = self.postId[ref]
-    if self.postQueue.hasIndex(ref) then
-        queue = self.postQueue[ref]
-        if queue.len > GameLib.maxQueueLen then queue.pull()
-    else
-        queue = []
-        self.postQueue[ref] = queue
+    if not self.postLog.hasIndex(ref) then
+        self.postLog[ref] = {"segment": 0, "seq": 0, "count": 0, "content": "L0"}
     end if
-    queue.push([idx, current_date, message])
-    self.postId[ref] = idx + 1
-
-    locStr = self.gameDir + "/" + ref
-    content = ""
-    for msg in queue
-        content = content + GameLib.msgSep + msg[0] + "." + msg[1] + "." + msg[2]
-    end for
-    content = content[1:]  // strip leading separator
+    msgLog = self.postLog[ref]
+    if msgLog.count >= GameLib.segmentLen then
+        // Archive the full segment and start a new one.
+        res = self.writeFile("." + ref + "." + msgLog.segment, msgLog.content)
+        if res != null then return res
+        if msgLog.segment >= GameLib.keepSegments then
+            old = self.server.File(self.gameDir + "/." + ref + "." + (msgLog.segment - GameLib.keepSegments))
+            if old != null then old.delete
+        end if
+        msgLog.segment = msgLog.segment + 1
+        msgLog.count = 0
+        msgLog.content = "L" + msgLog.segment
+    end if
+    msgLog.content = msgLog.content + GameLib.msgSep + msgLog.seq + "." + current_date + "." + message
+    msgLog.seq = msgLog.seq + 1
+    msgLog.count = msgLog.count + 1
+    return self.writeFile(ref, msgLog.content)
+end function
 
+// writeFile Replace the contents of the file in the game directory, creating it if necessary.
+//
+// Returns a string on error, null on no error.
+GameLib.writeFile = function(name, content)
+    locStr = self.gameDir + "/" + name
     file = self.server.File(locStr)
     if file == null then
-        self.server.touch(self.gameDir, ref)
+        self.server.touch(self.gameDir, name)
         file = self.server.File(locStr)
         if file == null then return "failed to access '" + locStr + "'"
     end if
@@ -190,6 +223,23 @@ GameLib.dateEpoch = function(dateStr)
     return year + month + day + dateSegments[1]
 end function
 
+// parseLog Parse the message log entries after the start position that are newer than the last seen entry.
+//
+// The header has no ".", so it's skipped along with the empty text before the first separator.
+GameLib.parseLog = function(content, start, msgLog, ret)
+    for message in content[start:].split(GameLib.msgSep)
+        p1 = message.indexOf(".")
+        if p1 == null then continue
+        idx = message[:p1].to_int
+        if idx <= msgLog.seq then continue
+        p2 = message.indexOf(".", p1 + 1)
+        if p2 == null then continue
+        msgLog.seq = idx
+        when = message[p1+1:p2]
+        ret.push([when, message[p2+1:], GameLib.dateEpoch(when)])
+    end for
+end function
+
 // quickSort Sort the list (internally) using the comparison function.
 GameLib.quickSort = function(list, comparison)
     return GameLib.quickSort__entry(list, @comparison, 0, list.len - 1)
@@ -236,4 +286,5 @@ GameLib.dateEpochMonths = {
     "Jul": "07", "Aug": "08", "Sep": "09", "Oct": "10", "Nov": "11", "Dec": "12",
 }
 GameLib.msgSep = char(1)
-GameLib.maxQueueLen = 100
\ No newline at end of file
+GameLib.segmentLen = 25
+GameLib.keepSegments = 4
\ No newline at end of file
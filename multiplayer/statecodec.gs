@@ -0,0 +1,197 @@
+// Compact Game State Codec.
+//
+// Packs a frame of game state numbers into a short, text-safe string, for games that
+// send their state to the other players every frame.
+//
+// Each field is a whole number written as a fixed number of base-64 digits, so no
+// separators are needed.  A field is defined as [width, bias]; the bias is added before
+// packing, so that fields can hold small negative values.  The first field is the frame
+// id (such as the turn number).
+//
+// Every 1 and 2 digit string and its value are in lookup tables, built once, so packing
+// or unpacking a field up to 2 digits wide is one lookup rather than a loop over its
+// digits; wider fields take one lookup per 2 digits.
+//
+// There are two message forms:
+//    "F" (all fields)
+//    "D" (base frame id) (changed field mask) (changed fields)
+// The delta form ("D") only includes the fields that differ from the base frame, which
+// must be a frame that the receiver has acknowledged, so it is known to have it.
+// The frame id field is always included.  Frame ids wrap around at the field's width,
+// so give it enough digits for the length of a game.
+
+StateCodec = {}
+
+// New Create a new codec for the list of [width, bias] fields.
+StateCodec.New = function(fields)
+    ret = new StateCodec
+    ret.fields = fields
+    ret.maskWidth = ceil(fields.len / 6)
+    ret.idWidth = fields[0][0]
+    ret.idBias = fields[0][1]
+    ret.fullLen = 1
+    for field in fields
+        ret.fullLen = ret.fullLen + field[0]
+    end for
+    // Recently sent or received frames, by frame id.
+    ret.history = {}
+    ret.historyOrder = []
+    ret.maxHistory = 8
+    // A full frame is sent at least this often, so a lost base frame can't stall the receiver.
+    ret.keyFrameEvery = 32
+    ret.sinceKeyFrame = 0
+    return ret
+end function
+
+// Encode Encode the field values into a message.
+//
+// If the base frame id is given and the frame is still in the history, then the message
+// only includes the changes from that frame.
+StateCodec.Encode = function(values, baseId = null)
+    self.remember([] + values)
+    self.sinceKeyFrame = self.sinceKeyFrame + 1
+    if baseId == null or baseId == values[0] or not self.history.hasIndex(baseId) or self.sinceKeyFrame >= self.keyFrameEvery then
+        self.sinceKeyFrame = 0
+        parts = ["F"]
+        for idx in self.fields.indexes
+            parts.push(StateCodec.pack(values[idx] + self.fields[idx][1], self.fields[idx][0]))
+        end for
+        return parts.join("")
+    end if
+
+    base = self.history[baseId]
+    mask = 1
+    parts = ["D", StateCodec.pack(baseId + self.idBias, self.idWidth), "", StateCodec.pack(values[0] + self.idBias, self.idWidth)]
+    bit = 2
+    idx = 1
+    while idx < self.fields.len
+        if values[idx] != base[idx] then
+            mask = mask + bit
+            parts.push(StateCodec.pack(values[idx] + self.fields[idx][1], self.fields[idx][0]))
+        end if
+        bit = bit * 2
+        idx = idx + 1
+    end while
+    parts[2] = StateCodec.pack(mask, self.maskWidth)
+    return parts.join("")
+end function
+
+// Decode Decode the message into the list of field values.  Returns null if the message is invalid.
+StateCodec.Decode = function(text)
+    if text == null or text.len <= 0 then return null
+    ret = []
+    values = StateCodec.DIGIT_VALUE
+    if text[0] == "F" then
+        if text.len != self.fullLen then return null
+        pos = 1
+        for field in self.fields
+            width = field[0]
+            part = text[pos:pos + width]
+            if width <= 2 then
+                // Written out, as it's most fields.
+                if not values.hasIndex(part) then return null
+                ret.push(values[part] - field[1])
+            else
+                value = StateCodec.unpack(part)
+                if value == null then return null
+                ret.push(value - field[1])
+            end if
+            pos = pos + width
+        end for
+    else if text[0] == "D" then
+        pos = 1 + self.idWidth + self.maskWidth
+        if pos > text.len then return null
+        baseId = StateCodec.unpack(text[1:1 + self.idWidth])
+        mask = StateCodec.unpack(text[1 + self.idWidth:pos])
+        if baseId == null or mask == null then return null
+        baseId = baseId - self.idBias
+        if not self.history.hasIndex(baseId) then return null
+        base = self.history[baseId]
+        for idx in self.fields.indexes
+            field = self.fields[idx]
+            if mask % 2 == 1 then
+                width = field[0]
+                if pos + width > text.len then return null
+                part = text[pos:pos + width]
+                if width <= 2 then
+                    if not values.hasIndex(part) then return null
+                    ret.push(values[part] - field[1])
+                else
+                    value = StateCodec.unpack(part)
+                    if value == null then return null
+                    ret.push(value - field[1])
+                end if
+                pos = pos + width
+            else
+                ret.push(base[idx])
+            end if
+            mask = floor(mask / 2)
+        end for
+    else
+        return null
+    end if
+    self.remember(ret)
+    return ret
+end function
+
+// remember Keep the frame in the history, dropping the oldest frame if the history is full.
+StateCodec.remember = function(values)
+    frameId = values[0]
+    if not self.history.hasIndex(frameId) then
+        self.historyOrder.push(frameId)
+        if self.historyOrder.len > self.maxHistory then self.history.remove(self.historyOrder.pull())
+    end if
+    self.history[frameId] = values
+end function
+
+// pack Static function that writes the non-negative number as a fixed width base-64 string.
+//
+// Digits past the width are dropped.
+StateCodec.pack = function(value, width)
+    if value < 0 then value = 0
+    if width == 2 then return StateCodec.PAIRS[value % 4096]
+    if width == 1 then return StateCodec.SINGLES[value % 64]
+    parts = []
+    while width >= 2
+        parts.insert(0, StateCodec.PAIRS[value % 4096])
+        value = floor(value / 4096)
+        width = width - 2
+    end while
+    if width == 1 then parts.insert(0, StateCodec.SINGLES[value % 64])
+    return parts.join("")
+end function
+
+// unpack Static function that reads a base-64 string into a number.  Returns null if it isn't one.
+StateCodec.unpack = function(text)
+    values = StateCodec.DIGIT_VALUE
+    if text.len <= 2 then
+        if not values.hasIndex(text) then return null
+        return values[text]
+    end if
+    pos = text.len % 2
+    ret = 0
+    if pos == 1 then
+        if not values.hasIndex(text[0]) then return null
+        ret = values[text[0]]
+    end if
+    while pos < text.len
+        part = text[pos:pos + 2]
+        if not values.hasIndex(part) then return null
+        ret = (ret * 4096) + values[part]
+        pos = pos + 2
+    end while
+    return ret
+end function
+
+StateCodec.DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz-_"
+// SINGLES[value] and PAIRS[value] are the 1 and 2 digit strings; DIGIT_VALUE[string] is the value of either.
+StateCodec.SINGLES = StateCodec.DIGITS.values
+StateCodec.PAIRS = []
+StateCodec.DIGIT_VALUE = {}
+for high in range(0, 63)
+    StateCodec.DIGIT_VALUE[StateCodec.SINGLES[high]] = high
+    for low in range(0, 63)
+        StateCodec.PAIRS.push(StateCodec.SINGLES[high] + StateCodec.SINGLES[low])
+        StateCodec.DIGIT_VALUE[StateCodec.SINGLES[high] + StateCodec.SINGLES[low]] = (high * 64) + low
+    end for
+end for
@@ -0,0 +1,336 @@
+#!/usr/bin/python3
+
+"""Load generator for the multiplayer message protocol.
+
+Simulates lobbies full of players chatting against the local stand-in server
+(see `localserver.py`).  Each player polls its room once per poll interval,
+like the lobby's `WAIT_TIME` loop, and posts messages at random.  The
+simulation runs on a virtual clock, so it runs as fast as the file I/O
+allows, while latency is reported in game seconds.
+
+Rooms can churn, with players leaving and rejoining at random, and can go
+quiet for part of every minute, to exercise the ChatRoom scan cache and its
+idle back off.
+
+Reports:
+    * message latency, from the post to each other player's poll that reads it;
+    * bytes re-read per poll, and how many of those were new message bytes;
+    * files read and skipped per poll, and the polls the back off skipped;
+    * throughput, in posts and deliveries per wall clock second.
+"""
+
+from typing import Dict, List, Tuple
+import argparse
+import heapq
+import os
+import random
+import tempfile
+import time
+
+from localserver import ChatRoom, LocalServer, LogClient, RewriteClient
+
+
+class SimPlayer:
+    """One simulated player in a lobby.
+
+    Each time the player joins the room starts a new session, with a new
+    connection, like leaving and re-entering the lobby.
+    """
+
+    __slots__ = (
+        "name", "room", "phase", "session", "joined", "present", "next_post",
+        "received",
+    )
+
+    def __init__(self, name: str, room: ChatRoom, phase: float) -> None:
+        self.name = name
+        self.room = room
+        self.phase = phase
+        self.session = 0
+        self.joined = 0.0
+        self.present = True
+        # Index into the posts list of the first post not yet counted for this player.
+        self.next_post = 0
+        self.received = 0
+
+
+class LoadStats:
+    """Collected measurements from a run."""
+
+    def __init__(self) -> None:
+        self.latencies: List[float] = []
+        self.posts = 0
+        self.polls = 0
+        self.new_bytes = 0
+        self.poll_seconds = 0.0
+        self.post_seconds = 0.0
+        self.expected = 0
+        self.unread_at_leave = 0
+        self.parsed_bytes = 0
+
+    @staticmethod
+    def percentile(values: List[float], pct: float) -> float:
+        if not values:
+            return 0.0
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+PROTOCOLS = ("rewrite", "log")
+
+
+def make_client(server: LocalServer, protocol: str) -> RewriteClient | LogClient:
+    """Create a player's connection for the protocol name."""
+    if protocol == "rewrite":
+        return RewriteClient(server)
+    if protocol == "log":
+        return LogClient(server)
+    raise ValueError(f"Unknown protocol '{protocol}'")
+
+
+IDLE_PERIOD = 60.0
+
+
+def is_idle(now: float, idle_fraction: float) -> bool:
+    """Is the room quiet at this time?  The end of every IDLE_PERIOD is quiet."""
+    return (now % IDLE_PERIOD) >= IDLE_PERIOD * (1.0 - idle_fraction)
+
+
+def run(
+    *,
+    root: str,
+    lobbies: int,
+    players: int,
+    duration: float,
+    poll_interval: float,
+    post_rate: float,
+    message_size: int,
+    protocol: str,
+    seed: int,
+    scan_cache: bool = False,
+    churn: float = 0.0,
+    away: float = 10.0,
+    idle_fraction: float = 0.0,
+) -> Tuple[LoadStats, List[LocalServer]]:
+    """Run the simulation.
+
+    post_rate is the posts per player per game second, and churn is the
+    chance per player per game second of leaving the room for `away` seconds.
+    """
+    rnd = random.Random(seed)
+    stats = LoadStats()
+    servers: List[LocalServer] = []
+    all_players: List[List[SimPlayer]] = []
+    # (message key) -> (post time, poster)
+    posted: Dict[str, Tuple[float, str]] = {}
+    # Per lobby, the (post time, poster, poster session) of each post, in order.
+    posts: List[List[Tuple[float, SimPlayer, int]]] = []
+    # Virtual clock event queue of (time, sequence, kind, lobby index, player)
+    events: List[Tuple[float, int, str, int, SimPlayer]] = []
+    seq = 0
+
+    for lobby_idx in range(lobbies):
+        server = LocalServer(os.path.join(root, f"server{lobby_idx}"))
+        server.init_layout()
+        servers.append(server)
+        all_players.append([])
+        posts.append([])
+        for player_idx in range(players):
+            name = f"p{player_idx}"
+            room = ChatRoom(
+                make_client(server, protocol), server.lobby_dir, name, scan_cache
+            )
+            room.join()
+            player = SimPlayer(name, room, rnd.random() * poll_interval)
+            all_players[lobby_idx].append(player)
+            heapq.heappush(events, (player.phase, seq, "poll", lobby_idx, player))
+            seq += 1
+            if post_rate > 0:
+                heapq.heappush(
+                    events,
+                    (rnd.expovariate(post_rate), seq, "post", lobby_idx, player),
+                )
+                seq += 1
+            if churn > 0:
+                heapq.heappush(
+                    events,
+                    (rnd.expovariate(churn), seq, "leave", lobby_idx, player),
+                )
+                seq += 1
+
+    # The joins aren't part of the measured load.
+    for server in servers:
+        server.stats.reset()
+    padding = "x" * max(0, message_size)
+    message_id = 0
+
+    while events:
+        now, _, kind, lobby_idx, player = heapq.heappop(events)
+        if now > duration:
+            break
+        if kind == "post":
+            if player.present and not is_idle(now, idle_fraction):
+                key = f"m{lobby_idx}-{message_id}"
+                message_id += 1
+                posted[key] = (now, player.name)
+                posts[lobby_idx].append((now, player, player.session))
+                start = time.perf_counter()
+                player.room.post(f"{key} {padding}")
+                stats.post_seconds += time.perf_counter() - start
+                stats.posts += 1
+            heapq.heappush(
+                events,
+                (now + rnd.expovariate(post_rate), seq, "post", lobby_idx, player),
+            )
+        elif kind == "leave":
+            # Posts the player's room hadn't scanned for yet; never shown.
+            for when, poster, session in posts[lobby_idx][player.next_post:]:
+                if poster is not player:
+                    stats.unread_at_leave += 1
+            player.room.disconnect()
+            player.present = False
+            heapq.heappush(events, (now + away, seq, "join", lobby_idx, player))
+        elif kind == "join":
+            server = servers[lobby_idx]
+            player.room = ChatRoom(
+                make_client(server, protocol), server.lobby_dir, player.name, scan_cache
+            )
+            player.room.join()
+            player.session += 1
+            player.joined = now
+            player.present = True
+            player.next_post = len(posts[lobby_idx])
+            heapq.heappush(
+                events,
+                (now + rnd.expovariate(churn), seq, "leave", lobby_idx, player),
+            )
+            seq += 1
+            heapq.heappush(
+                events, (now + player.phase, seq, "poll", lobby_idx, player)
+            )
+        elif player.present:
+            # Every post by another player since this player joined is expected at
+            # its next scan, including those from players who left since; their
+            # closed files keep their last messages.  An idle poll the room skips
+            # leaves them for the next scan.
+            if not player.room.scan_cache or player.room.scheduler.countdown <= 0:
+                lobby_posts = posts[lobby_idx]
+                for when, poster, session in lobby_posts[player.next_post:]:
+                    if poster is not player:
+                        stats.expected += 1
+                player.next_post = len(lobby_posts)
+            start = time.perf_counter()
+            messages = player.room.pull_messages()
+            stats.poll_seconds += time.perf_counter() - start
+            stats.polls += 1
+            for _, _, text, _ in messages:
+                key = text.split(" ", 1)[0]
+                if key in posted and posted[key][0] >= player.joined:
+                    stats.latencies.append(now - posted[key][0])
+                    stats.new_bytes += len(text)
+                    player.received += 1
+            heapq.heappush(
+                events, (now + poll_interval, seq, "poll", lobby_idx, player)
+            )
+        seq += 1
+
+    for lobby in all_players:
+        for player in lobby:
+            stats.parsed_bytes += player.room.client.parsed_bytes
+
+    return stats, servers
+
+
+def report(stats: LoadStats, servers: List[LocalServer], poll_interval: float) -> str:
+    """Format the measurements."""
+    bytes_read = sum(server.stats.bytes_read for server in servers)
+    bytes_written = sum(server.stats.bytes_written for server in servers)
+    files_read = sum(server.stats.files_read for server in servers)
+    files_skipped = sum(server.stats.files_skipped for server in servers)
+    skipped_polls = sum(server.stats.skipped_polls for server in servers)
+    dir_lists = sum(server.stats.dir_lists for server in servers)
+    wall = stats.poll_seconds + stats.post_seconds
+    polls = max(1, stats.polls)
+    posts = max(1, stats.posts)
+    lat = stats.latencies
+    lines = [
+        f"posts:                 {stats.posts}",
+        f"polls:                 {stats.polls}"
+        f"  ({skipped_polls} skipped while idle)",
+        f"deliveries:            {len(lat)} of {stats.expected} expected"
+        f"  ({stats.unread_at_leave} not yet scanned for when their reader left)",
+        f"latency (game s):      mean {sum(lat) / max(1, len(lat)):.3f}"
+        f"  p50 {LoadStats.percentile(lat, 0.5):.3f}"
+        f"  p95 {LoadStats.percentile(lat, 0.95):.3f}"
+        f"  max {max(lat, default=0.0):.3f}"
+        f"  (poll interval {poll_interval:.3f})",
+        f"bytes read per poll:   {bytes_read / polls:.1f}"
+        f"  ({stats.new_bytes / polls:.1f} new message bytes,"
+        f" {100.0 * stats.new_bytes / max(1, bytes_read):.2f}% useful)",
+        f"bytes parsed per poll: {stats.parsed_bytes / polls:.1f}",
+        f"files read per poll:   {files_read / polls:.2f}"
+        f"  (unchanged files skipped per poll {files_skipped / polls:.2f},"
+        f" directory lists per poll {dir_lists / polls:.2f})",
+        f"bytes written per post: {bytes_written / posts:.1f}",
+        f"wall time per poll:    {1000000.0 * stats.poll_seconds / polls:.1f} us",
+        f"wall time per post:    {1000000.0 * stats.post_seconds / posts:.1f} us",
+        f"throughput:            {stats.posts / max(wall, 1e-9):.0f} posts/s,"
+        f" {len(lat) / max(wall, 1e-9):.0f} deliveries/s",
+    ]
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--lobbies", type=int, default=1, help="number of lobby servers")
+    parser.add_argument("--players", type=int, default=8, help="players per lobby")
+    parser.add_argument("--duration", type=float, default=300.0, help="game seconds to simulate")
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="seconds between each player's polls")
+    parser.add_argument("--post-rate", type=float, default=0.1, help="posts per player per second")
+    parser.add_argument("--message-size", type=int, default=40, help="padding characters per message")
+    parser.add_argument(
+        "--protocol",
+        default="all",
+        choices=(*PROTOCOLS, "all"),
+        help="message protocol to measure; 'all' runs each one with the same seed",
+    )
+    parser.add_argument(
+        "--scan-cache",
+        default="both",
+        choices=("off", "on", "both"),
+        help="ChatRoom scan cache and idle back off; 'both' runs with and without it",
+    )
+    parser.add_argument("--churn", type=float, default=0.0, help="chance per player per second of leaving the room")
+    parser.add_argument("--away", type=float, default=10.0, help="seconds a player is away after leaving")
+    parser.add_argument("--idle-fraction", type=float, default=0.0, help="quiet fraction of every minute, with no posts")
+    parser.add_argument("--seed", type=int, default=1, help="random seed")
+    parser.add_argument("--dir", default=None, help="server directory (default: a temporary directory)")
+    args = parser.parse_args()
+
+    protocols = PROTOCOLS if args.protocol == "all" else (args.protocol,)
+    scan_caches = {"off": (False,), "on": (True,), "both": (False, True)}[args.scan_cache]
+    for protocol in protocols:
+        for scan_cache in scan_caches:
+            with tempfile.TemporaryDirectory(prefix="mp-load-") as tmp:
+                root = os.path.join(args.dir, protocol) if args.dir else tmp
+                stats, servers = run(
+                    root=root,
+                    lobbies=args.lobbies,
+                    players=args.players,
+                    duration=args.duration,
+                    poll_interval=args.poll_interval,
+                    post_rate=args.post_rate,
+                    message_size=args.message_size,
+                    protocol=protocol,
+                    seed=args.seed,
+                    scan_cache=scan_cache,
+                    churn=args.churn,
+                    away=args.away,
+                    idle_fraction=args.idle_fraction,
+                )
+                print(f"== protocol: {protocol}, scan cache: {'on' if scan_cache else 'off'}")
+                print(report(stats, servers, args.poll_interval))
+
+
+if __name__ == "__main__":
+    main()
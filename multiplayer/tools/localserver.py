@@ -0,0 +1,693 @@
+#!/usr/bin/python3
+
+"""Local file system stand-in for the multiplayer game server.
+
+Mirrors the directory layout and message file format used by `lobby.src`
+(`GameServer.Server`) and `gamelib.gs` (`GameLib`), so the protocol can be
+exercised and measured outside of Grey Hack.
+
+The layout, relative to the server's shared base directory:
+    about.txt                              server description
+    Lobby/(player)                         lobby chat message file per player
+    Games/(game)/about.txt, gameinfo.txt   uploaded games
+    Pending/(game)/(instance)/.host.txt    hosting player's name
+    Pending/(game)/(instance)/.chat.d/     pending game chat room
+    Pending/(game)/(instance)/(player)     player's status
+    Active/(game)/(instance)/.host.txt     ordered player list, host first
+    Active/(game)/(instance)/(player)      player's game message file
+
+Two message file protocols are supported:
+    * RewriteClient, the original protocol.  A message file holds up to
+        MAX_QUEUE_LEN messages, separated by MSG_SEP, each in the form
+        'id.date.message'.  Each post rewrites the whole queue, and each
+        pull re-reads and re-splits the whole file.
+    * LogClient, the segmented log protocol used by the lobby and GameLib.
+        See the LogClient class for the details.
+"""
+
+from typing import Dict, List, Tuple
+import os
+import shutil
+import sys
+import time
+
+
+MSG_SEP = chr(1)
+MAX_QUEUE_LEN = 100
+SEGMENT_LEN = 25
+KEEP_SEGMENTS = 4
+
+MONTHS = (
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+)
+
+
+def current_date(when: float | None = None) -> str:
+    """The Grey Hack `current_date` string, such as '27/Jan/2000 - 16:51'."""
+    tm = time.localtime(when)
+    return f"{tm.tm_mday:02d}/{MONTHS[tm.tm_mon - 1]}/{tm.tm_year} - {tm.tm_hour:02d}:{tm.tm_min:02d}"
+
+
+def date_epoch(date_str: str) -> str:
+    """Turn the current_date string into a sortable value; same as `dateEpoch`."""
+    date, clock = date_str.split(" - ")
+    day, month, year = date.split("/")
+    if month in MONTHS:
+        month = f"{MONTHS.index(month) + 1:02d}"
+    return year + month + day + clock
+
+
+class IoStats:
+    """Counters for the file operations performed against the server."""
+
+    __slots__ = (
+        "files_read",
+        "bytes_read",
+        "files_written",
+        "bytes_written",
+        "dir_lists",
+        "polls",
+        "skipped_polls",
+        "files_skipped",
+    )
+
+    def __init__(self) -> None:
+        self.files_read = 0
+        self.bytes_read = 0
+        self.files_written = 0
+        self.bytes_written = 0
+        self.dir_lists = 0
+        self.polls = 0
+        self.skipped_polls = 0
+        self.files_skipped = 0
+
+    def reset(self) -> None:
+        """Zero out all the counters."""
+        for name in IoStats.__slots__:
+            setattr(self, name, 0)
+
+    def snapshot(self) -> Dict[str, int]:
+        """The current counter values."""
+        return {name: getattr(self, name) for name in IoStats.__slots__}
+
+
+class LocalServer:
+    """The game server's shared base directory, on the local file system.
+
+    Every file access goes through this object, so the I/O is counted
+    the same way the Grey Hack `get_content` / `set_content` calls would be.
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = os.path.abspath(root)
+        self.stats = IoStats()
+
+    # ----------------------------------------------------------------
+    # Layout
+
+    @property
+    def lobby_dir(self) -> str:
+        return os.path.join(self.root, "Lobby")
+
+    def game_dir(self, game: str) -> str:
+        return os.path.join(self.root, "Games", game)
+
+    def pending_dir(self, game: str, instance: str) -> str:
+        return os.path.join(self.root, "Pending", game, instance)
+
+    def active_dir(self, game: str, instance: str) -> str:
+        return os.path.join(self.root, "Active", game, instance)
+
+    def init_layout(self, about: str = "Local Stand-In Game Server") -> None:
+        """Create the base directories, if they don't already exist."""
+        for name in ("Lobby", "Games", "Pending", "Active"):
+            os.makedirs(os.path.join(self.root, name), exist_ok=True)
+        about_file = os.path.join(self.root, "about.txt")
+        if not os.path.isfile(about_file):
+            self.write(about_file, about)
+
+    def add_game(self, game: str, info: Dict[str, str], about: str = "") -> str:
+        """Add a game's about.txt and gameinfo.txt; returns the game directory."""
+        game_dir = self.game_dir(game)
+        os.makedirs(game_dir, exist_ok=True)
+        self.write(os.path.join(game_dir, "about.txt"), about)
+        self.write(
+            os.path.join(game_dir, "gameinfo.txt"),
+            "\n".join(f"{key}={value}" for key, value in info.items()),
+        )
+        return game_dir
+
+    # ----------------------------------------------------------------
+    # File access
+
+    def read(self, path: str) -> str | None:
+        """Read the whole file contents, or None if it does not exist."""
+        try:
+            with open(path, "r", encoding="utf-8", newline="") as fis:
+                ret = fis.read()
+        except (FileNotFoundError, IsADirectoryError):
+            return None
+        self.stats.files_read += 1
+        self.stats.bytes_read += len(ret)
+        return ret
+
+    def write(self, path: str, content: str) -> None:
+        """Replace the whole file contents, creating the file if necessary."""
+        with open(path, "w", encoding="utf-8", newline="") as fos:
+            fos.write(content)
+        self.stats.files_written += 1
+        self.stats.bytes_written += len(content)
+
+    def size(self, path: str) -> int | None:
+        """The file size from its listing, or None if it does not exist."""
+        try:
+            return os.stat(path).st_size
+        except FileNotFoundError:
+            return None
+
+    def exists(self, path: str) -> bool:
+        return os.path.isfile(path)
+
+    def list_in(self, dir_path: str) -> List[str]:
+        """Names of the files in the directory; same as `Server.listIn`."""
+        self.stats.dir_lists += 1
+        try:
+            return sorted(
+                entry.name for entry in os.scandir(dir_path) if entry.is_file()
+            )
+        except FileNotFoundError:
+            return []
+
+    def list_sizes_in(self, dir_path: str) -> List[Tuple[str, int]]:
+        """Names and sizes of the files in the directory, from one listing.
+
+        `Server.listIn` returns the File objects, so the size comes with the
+        listing without reading the file.
+        """
+        self.stats.dir_lists += 1
+        try:
+            return sorted(
+                (entry.name, entry.stat().st_size)
+                for entry in os.scandir(dir_path)
+                if entry.is_file()
+            )
+        except FileNotFoundError:
+            return []
+
+    def list_dirs_in(self, dir_path: str) -> List[str]:
+        """Names of the folders in the directory; same as `Server.listDirsIn`."""
+        self.stats.dir_lists += 1
+        try:
+            return sorted(
+                entry.name for entry in os.scandir(dir_path) if entry.is_dir()
+            )
+        except FileNotFoundError:
+            return []
+
+    def rm_file(self, path: str) -> None:
+        if os.path.isfile(path):
+            os.remove(path)
+
+    def rm_tree(self, dir_path: str) -> None:
+        if os.path.isdir(dir_path):
+            shutil.rmtree(dir_path)
+
+
+class RewriteClient:
+    """One player's connection to the server, using the queue rewrite protocol.
+
+    This is the `GameServer.Server` post / pull state: each posted message is
+    added to an in-memory queue, and the whole queue is written to the file.
+    Pulls read the whole file and discard the already seen message ids.
+    """
+
+    def __init__(self, server: LocalServer) -> None:
+        self.server = server
+        self.queue: Dict[str, List[Tuple[int, str, str]]] = {}
+        self.send_id: Dict[str, int] = {}
+        self.recv_id: Dict[str, int] = {}
+        self.parsed_bytes = 0
+
+    def post(self, location: str, action: str) -> str | None:
+        """Post a message to the location file.  Returns a string on error."""
+        if MSG_SEP in action:
+            return "invalid message content"
+        queue = self.queue.setdefault(location, [])
+        if len(queue) >= MAX_QUEUE_LEN:
+            queue.pop(0)
+        self.send_id[location] = self.send_id.get(location, 0) + 1
+        queue.append((self.send_id[location], current_date(), action))
+        content = MSG_SEP.join(f"{idx}.{when}.{msg}" for idx, when, msg in queue)
+        self.server.write(location, content)
+        return None
+
+    def close_post(self, location: str) -> None:
+        """Stop posting to the location, and remove the file."""
+        self.queue.pop(location, None)
+        self.send_id.pop(location, None)
+        self.server.rm_file(location)
+
+    def forget(self, location: str) -> None:
+        """Drop the read position for the location, such as when its writer left."""
+        self.recv_id.pop(location, None)
+
+    def pull(self, location: str) -> List[Tuple[int, str, str]]:
+        """Pull the [id, date, message] entries posted since the last pull."""
+        max_recv_id = self.recv_id.get(location, -1)
+        prev_recv_id = max_recv_id
+        res = self.server.read(location)
+        if res is None:
+            return []
+        self.parsed_bytes += len(res)
+        ret: List[Tuple[int, str, str]] = []
+        for message in res.split(MSG_SEP):
+            p1 = message.find(".")
+            if p1 < 0:
+                continue
+            idx = int(message[:p1])
+            if idx <= prev_recv_id:
+                continue
+            max_recv_id = max(max_recv_id, idx)
+            p2 = message.find(".", p1 + 1)
+            if p2 < 0:
+                continue
+            ret.append((idx, message[p1 + 1:p2], message[p2 + 1:]))
+        self.recv_id[location] = max_recv_id
+        return ret
+
+
+class SendLog:
+    """The writer's state for one log location."""
+
+    __slots__ = ("segment", "seq", "count", "content")
+
+    def __init__(self) -> None:
+        self.segment = 0
+        self.seq = 0
+        self.count = 0
+        self.content = "L0"
+
+
+class RecvLog:
+    """The reader's position in one log location."""
+
+    __slots__ = ("segment", "offset", "seq")
+
+    def __init__(self) -> None:
+        self.segment = -1
+        self.offset = 0
+        self.seq = -1
+
+
+class LogClient:
+    """One player's connection to the server, using the segmented log protocol.
+
+    The location file holds the live segment: the header 'L(segment number)',
+    followed by up to SEGMENT_LEN entries, each prefixed with MSG_SEP, in the
+    form 'seq.date.message'.  Sequence numbers increase by one with each post,
+    and carry across segments.
+
+    Posting appends the entry to the live segment.  When the live segment is
+    full, it is archived to the file '.(name).(segment number)' next to the
+    location, the archive KEEP_SEGMENTS older is removed, and a new, empty
+    live segment starts.  Posting cost is bounded by the segment size rather
+    than the history size.
+
+    When the live segment rolls over, the new segment is never the same size
+    as the file it replaces (an empty entry is added if it would be), so a
+    reader may use an unchanged size to mean nothing new.
+
+    Closing the location moves the live segment to '.(name).closed', so the
+    readers can still pull the messages posted just before the writer left.
+    Like a rollover, it never leaves the closed file the same size as the
+    one from the writer's last session.
+    The archives are left for them too; a later session's posts overwrite
+    them.
+
+    A segment only ever grows, so each reader remembers the segment number
+    and the content length it last parsed, and only parses the new text after
+    that offset.  If the segment number moved on, the reader first catches
+    up from the archived segments.  A lower segment number, or a shorter
+    segment, means the writer restarted the log, and the reader starts over.
+
+    Grey Hack files can only be read and written whole, so this models the
+    `get_content` / `set_content` transfer as the whole live segment, but
+    only the new bytes are parsed.
+    """
+
+    def __init__(self, server: LocalServer) -> None:
+        self.server = server
+        self.send_log: Dict[str, SendLog] = {}
+        self.recv_log: Dict[str, RecvLog] = {}
+        self.parsed_bytes = 0
+
+    @staticmethod
+    def archive_path(location: str, segment: int) -> str:
+        parent, name = os.path.split(location)
+        return os.path.join(parent, f".{name}.{segment}")
+
+    @staticmethod
+    def closed_path(location: str) -> str:
+        parent, name = os.path.split(location)
+        return os.path.join(parent, f".{name}.closed")
+
+    def post(self, location: str, action: str) -> str | None:
+        """Post a message to the location file.  Returns a string on error."""
+        if MSG_SEP in action:
+            return "invalid message content"
+        log = self.send_log.get(location)
+        if log is None:
+            log = SendLog()
+            self.send_log[location] = log
+        rolled = 0
+        if log.count >= SEGMENT_LEN:
+            self.server.write(self.archive_path(location, log.segment), log.content)
+            if log.segment >= KEEP_SEGMENTS:
+                self.server.rm_file(
+                    self.archive_path(location, log.segment - KEEP_SEGMENTS)
+                )
+            rolled = len(log.content)
+            log.segment += 1
+            log.count = 0
+            log.content = f"L{log.segment}"
+        log.content += f"{MSG_SEP}{log.seq}.{current_date()}.{action}"
+        log.seq += 1
+        log.count += 1
+        if len(log.content) == rolled:
+            # Keep the size changed, for the readers' size check.
+            log.content += f"{MSG_SEP}{log.seq}.{current_date()}."
+            log.seq += 1
+            log.count += 1
+        self.server.write(location, log.content)
+        return None
+
+    def close_post(self, location: str) -> None:
+        """Stop posting to the location, moving the live segment to the closed file."""
+        log = self.send_log.pop(location, None)
+        if log is not None:
+            closed = self.closed_path(location)
+            if self.server.size(closed) == len(log.content):
+                # Keep the size changed from the last session's closed file.
+                log.content += f"{MSG_SEP}{log.seq}.{current_date()}."
+            self.server.write(closed, log.content)
+        self.server.rm_file(location)
+
+    def forget(self, location: str) -> None:
+        """Drop the read position for the location, such as when its writer left."""
+        self.recv_log.pop(location, None)
+
+    def pull(self, location: str, path: str | None = None) -> List[Tuple[int, str, str]]:
+        """Pull the [seq, date, message] entries posted since the last pull.
+
+        The path, if given, is the file to read for the location's live
+        segment, such as its closed file.
+        """
+        res = self.server.read(path or location)
+        if res is None or not res.startswith("L"):
+            return []
+        pos = res.find(MSG_SEP)
+        if pos < 0:
+            pos = len(res)
+        segment = int(res[1:pos])
+        log = self.recv_log.get(location)
+        if log is None:
+            log = RecvLog()
+            self.recv_log[location] = log
+        if segment < log.segment or (segment == log.segment and len(res) < log.offset):
+            # The writer started over.
+            log.segment = -1
+            log.seq = -1
+
+        ret: List[Tuple[int, str, str]] = []
+        if segment == log.segment:
+            self.parse(res, log.offset, log, ret)
+        else:
+            # Catch up on the segments archived since the last pull.
+            archived = max(log.segment, segment - KEEP_SEGMENTS, 0)
+            while archived < segment:
+                content = self.server.read(self.archive_path(location, archived))
+                if content is not None:
+                    start = log.offset if archived == log.segment else 0
+                    self.parse(content, start, log, ret)
+                archived += 1
+            self.parse(res, 0, log, ret)
+        log.segment = segment
+        log.offset = len(res)
+        return ret
+
+    def parse(
+        self, content: str, start: int, log: RecvLog, ret: List[Tuple[int, str, str]]
+    ) -> None:
+        """Parse the entries after the start offset that are newer than the last seen."""
+        self.parsed_bytes += len(content) - start
+        # The header has no '.', so it's skipped along with the empty first split.
+        for message in content[start:].split(MSG_SEP):
+            p1 = message.find(".")
+            if p1 < 0:
+                continue
+            idx = int(message[:p1])
+            if idx <= log.seq:
+                continue
+            p2 = message.find(".", p1 + 1)
+            if p2 < 0:
+                continue
+            log.seq = idx
+            ret.append((idx, message[p1 + 1:p2], message[p2 + 1:]))
+
+
+class PollScheduler:
+    """Decides when to scan again, backing off while nothing changes.
+
+    Same as `GameServer.PollScheduler`.  While scans find nothing new, the
+    number of skipped polls between scans doubles, up to max_skip.  A change,
+    or a wake, goes back to scanning on every poll.
+    """
+
+    def __init__(self, stats: IoStats, max_skip: int) -> None:
+        self.stats = stats
+        self.max_skip = max_skip
+        self.skip = 0
+        self.countdown = 0
+
+    def due(self) -> bool:
+        """Should the caller scan now?"""
+        if self.countdown > 0:
+            self.countdown -= 1
+            self.stats.skipped_polls += 1
+            return False
+        self.stats.polls += 1
+        return True
+
+    def scanned(self, changed: bool) -> None:
+        """Report whether the scan found any change."""
+        if changed:
+            self.skip = 0
+        else:
+            self.skip = min(self.max_skip, max(1, self.skip * 2))
+        self.countdown = self.skip
+
+    def wake(self) -> None:
+        """Scan on the next poll."""
+        self.skip = 0
+        self.countdown = 0
+
+
+def is_closed_name(name: str) -> bool:
+    """Is the file name a closed message file, '.(player).closed'?"""
+    return name.startswith(".") and name.endswith(".closed")
+
+
+def is_log_name(name: str) -> bool:
+    """Is the file name an archived or closed message file?"""
+    return is_closed_name(name) or (name.startswith(".") and name.rsplit(".", 1)[-1].isdigit())
+
+
+class ChatRoom:
+    """A room where players chat; same as `GameServer.ChatRoom`.
+
+    Each player in the room owns one message file, named after the player.
+
+    With the scan cache on, the room remembers each message file's size and
+    only reads the files that changed size since the last scan, and idle
+    scans back off with a PollScheduler.  Message files only grow until the
+    log rolls over to a new segment, which always changes the size.
+
+    A player who leaves leaves behind a closed file with their last messages
+    (see LogClient).  The room reads it when it notices
+    the player left, or when a closed file it hasn't read appears, for a player
+    who joined and left between scans.  So skipped scans delay messages, but
+    don't lose them.
+    """
+
+    MAX_IDLE_SKIP = 4
+
+    def __init__(
+        self,
+        client: RewriteClient | LogClient,
+        room_dir: str,
+        player: str,
+        scan_cache: bool = False,
+    ) -> None:
+        self.client = client
+        self.room_dir = room_dir
+        self.player = player
+        self.user_file = os.path.join(room_dir, player)
+        self.scan_cache = scan_cache
+        # player name -> message file size at the last scan.
+        self.known_players: Dict[str, int] = {}
+        # player name -> closed file size, when it was last read or seen.
+        self.known_closed: Dict[str, int] = {}
+        self.scheduler = PollScheduler(client.server.stats, ChatRoom.MAX_IDLE_SKIP)
+        self.first = True
+
+    def join(self) -> str | None:
+        os.makedirs(self.room_dir, exist_ok=True)
+        # Old message files left by a crashed session have no one to read them.
+        self.clear_logs()
+        # The closed files already here are from before this player joined.
+        for name, size in self.client.server.list_sizes_in(self.room_dir):
+            if is_closed_name(name):
+                self.known_closed[name[1:-7]] = size
+        return self.client.post(self.user_file, "Joins")
+
+    def disconnect(self) -> None:
+        self.client.close_post(self.user_file)
+        self.clear_logs()
+
+    def clear_logs(self) -> None:
+        """Remove the archived and closed message files, if no player is left to read them."""
+        names = self.client.server.list_in(self.room_dir)
+        if any(not name.startswith(".") for name in names):
+            return
+        for name in names:
+            if is_log_name(name):
+                self.client.server.rm_file(os.path.join(self.room_dir, name))
+
+    def post(self, message: str) -> str | None:
+        self.scheduler.wake()
+        return self.client.post(self.user_file, message)
+
+    def list_players(self) -> List[str]:
+        return [
+            name
+            for name in self.client.server.list_in(self.room_dir)
+            if name != self.player and not name.startswith(".")
+        ]
+
+    def pull_messages(self) -> List[Tuple[str, str, str, str]]:
+        """Get the latest unread messages, as (date, user, message, dateEpoch)."""
+        server = self.client.server
+        if not self.scan_cache:
+            server.stats.polls += 1
+        elif not self.scheduler.due():
+            return []
+        ret: List[Tuple[str, str, str, str]] = []
+        now = current_date()
+        now_epoch = date_epoch(now)
+        last_players = self.known_players
+        self.known_players = {}
+        listing = server.list_sizes_in(self.room_dir)
+        closed = {name[1:-7]: size for name, size in listing if is_closed_name(name)}
+        present = {name for name, _ in listing}
+        # Read what each player who left since the last scan posted before leaving,
+        # before any new session of theirs.
+        for name, size in closed.items():
+            if name == self.player:
+                continue
+            left = name in last_players and name not in present
+            if not left and self.known_closed.get(name) == size:
+                continue
+            location = os.path.join(self.room_dir, name)
+            for _, when, msg in self.client.pull(location, LogClient.closed_path(location)):
+                if msg:
+                    ret.append((when, name, msg, date_epoch(when)))
+            if name not in last_players and not self.first:
+                # Joined and left between scans.
+                ret.append((now, name, f"{name} left the room.", now_epoch))
+            self.client.forget(location)
+        self.known_closed = closed
+        for name, size in listing:
+            if name == self.player or name.startswith("."):
+                continue
+            self.known_players[name] = size
+            if name in last_players:
+                last_size = last_players.pop(name)
+                if self.scan_cache and last_size == size:
+                    server.stats.files_skipped += 1
+                    continue
+            elif not self.first:
+                ret.append((now, name, f"{name} entered the room.", now_epoch))
+            for _, when, msg in self.client.pull(os.path.join(self.room_dir, name)):
+                if msg:
+                    ret.append((when, name, msg, date_epoch(when)))
+        for name in last_players:
+            ret.append((now, name, f"{name} left the room.", now_epoch))
+            # If the player comes back, their message log starts over.
+            self.client.forget(os.path.join(self.room_dir, name))
+        self.first = False
+        if self.scan_cache:
+            self.scheduler.scanned(bool(ret))
+        ret.sort(key=lambda item: item[3])
+        return ret
+
+
+# --------------------------------------------------------------------
+# Pending and active games, as the lobby's hosting and joining creates them.
+
+
+def host_game(server: LocalServer, game: str, instance: str, player: str) -> str:
+    """Create the pending game directory; same as `GameInfo.HostGame`."""
+    pending_dir = server.pending_dir(game, instance)
+    os.makedirs(os.path.join(pending_dir, ".chat.d"), exist_ok=True)
+    server.write(os.path.join(pending_dir, ".host.txt"), player)
+    server.write(os.path.join(pending_dir, player), "hosting")
+    return pending_dir
+
+
+def join_game(server: LocalServer, game: str, instance: str, player: str) -> str:
+    """Add the player to the pending game; same as `GameInfo.JoinGame`."""
+    pending_dir = server.pending_dir(game, instance)
+    server.write(os.path.join(pending_dir, player), "joined")
+    return pending_dir
+
+
+def start_game(server: LocalServer, game: str, instance: str) -> str:
+    """Turn the pending game into an active game; same as `JoinedInstance.hostServer`."""
+    pending_dir = server.pending_dir(game, instance)
+    host = server.read(os.path.join(pending_dir, ".host.txt")) or ""
+    players = sorted(
+        name
+        for name in server.list_in(pending_dir)
+        if not name.startswith(".") and name != host
+    )
+    active_dir = server.active_dir(game, instance)
+    os.makedirs(active_dir, exist_ok=True)
+    server.write(os.path.join(active_dir, ".host.txt"), "\n".join([host, *players]))
+    server.write(os.path.join(active_dir, host), "host")
+    server.rm_file(os.path.join(pending_dir, ".host.txt"))
+    server.rm_tree(pending_dir)
+    return active_dir
+
+
+if __name__ == "__main__":
+    if "-h" in sys.argv or "--help" in sys.argv or len(sys.argv) not in (3, 4):
+        sys.stderr.write(f"Usage: {sys.argv[0]} init (server dir)\n")
+        sys.stderr.write(f"       {sys.argv[0]} dump (server dir) [room dir]\n")
+        sys.stderr.write("  'init' creates the server directory layout.\n")
+        sys.stderr.write("  'dump' prints all the messages in the room (default: the Lobby).\n")
+        sys.exit(1)
+
+    local = LocalServer(sys.argv[2])
+    if sys.argv[1] == "init":
+        local.init_layout()
+    elif sys.argv[1] == "dump":
+        room = local.lobby_dir
+        if len(sys.argv) == 4:
+            room = os.path.join(local.root, sys.argv[3])
+        reader = ChatRoom(LogClient(local), room, ".")
+        for entry in reader.pull_messages():
+            print(f"{entry[0]}  {entry[1]}: {entry[2]}")
+    else:
+        sys.stderr.write(f"Unknown command '{sys.argv[1]}'\n")
+        sys.exit(1)
@@ -0,0 +1,166 @@
+#!/usr/bin/python3
+
+"""Pack a game directory into the files to upload to the game server.
+
+The game directory holds the `about.txt` and `gameinfo.txt` files, and the
+client and host sources they name (see the multiplayer README).  Packing
+writes the ready to upload files into the output directory:
+
+    * Each `.src` / `.gs` source, with its `import_code` lines replaced by the
+      imported file's contents, so the lobby can build it with a single
+      `build` call.  Each file is inlined once, the first time it's imported.
+    * Each bundle file, as-is.
+    * `about.txt`, and `gameinfo.txt` with the source names updated.
+    * `build.txt`, the MD5 hash of each packed source and bundle file.  The
+      lobby keeps the binaries it built, keyed by these hashes, so a player
+      only rebuilds a game when its files change.
+
+Grey Hack limits the size of a file, so a packed source that's too big is an
+error; use a bundle for those games instead.
+"""
+
+from typing import Dict, List, Set, Tuple
+import hashlib
+import os
+import re
+import shutil
+import sys
+
+
+# Largest text file Grey Hack will store; bundles are split at this size, too.
+MAX_FILE_LEN = 160000
+
+IMPORT_CODE = re.compile(r'^\s*import_code\(\s*"([^"]+)"\s*\)\s*$')
+
+
+def parse_properties(contents: str) -> Dict[str, str]:
+    """Parse the property file contents; same as `ParsePropertyFile`."""
+    ret: Dict[str, str] = {}
+    for line in contents.split("\n"):
+        line = line.lstrip(" ")
+        if not line or line[0] == "#":
+            continue
+        pos = line.find("=")
+        if pos > 0:
+            ret[line[:pos]] = line[pos + 1:]
+    return ret
+
+
+def md5(content: str) -> str:
+    """The MD5 hash of the text, as hex; same as Grey Hack's `md5`."""
+    return hashlib.md5(content.encode("utf-8")).hexdigest()
+
+
+def read_text(path: str) -> str:
+    with open(path, "r", encoding="utf-8", newline="") as fis:
+        return fis.read()
+
+
+def write_text(path: str, content: str) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as fos:
+        fos.write(content)
+
+
+def inline_source(path: str, seen: Set[str] | None = None) -> str:
+    """Read the source file, replacing each `import_code` line with the imported file's contents."""
+    if seen is None:
+        seen = set()
+    path = os.path.abspath(path)
+    seen.add(path)
+    lines: List[str] = []
+    for line in read_text(path).split("\n"):
+        match = IMPORT_CODE.match(line)
+        if match is None:
+            lines.append(line)
+            continue
+        imported = os.path.abspath(os.path.join(os.path.dirname(path), match.group(1)))
+        if imported in seen:
+            lines.append(f"// (already imported {match.group(1)})")
+            continue
+        if not os.path.isfile(imported):
+            raise ValueError(f"{path}: cannot find imported file '{match.group(1)}'")
+        lines.append(f"// ---- {match.group(1)}")
+        lines.append(inline_source(imported, seen).rstrip("\n"))
+        lines.append(f"// ---- end {match.group(1)}")
+    return "\n".join(lines)
+
+
+def pack_source(game_dir: str, out_dir: str, source: str) -> Tuple[str, Dict[str, str]]:
+    """Pack one client or host source setting.
+
+    Returns the new setting value and the packed file names mapped to their hashes.
+    """
+    hashes: Dict[str, str] = {}
+    if source.startswith("bundle:"):
+        for name in source[7:].split(","):
+            shutil.copyfile(os.path.join(game_dir, name), os.path.join(out_dir, name))
+            hashes[name] = md5(read_text(os.path.join(out_dir, name)))
+        return source, hashes
+
+    stem, ext = os.path.splitext(source)
+    if ext not in (".src", ".gs"):
+        raise ValueError(f"Don't know how to pack source file '{source}'")
+    content = inline_source(os.path.join(game_dir, source))
+    if len(content) > MAX_FILE_LEN:
+        raise ValueError(
+            f"Packed '{source}' is {len(content)} characters, over the {MAX_FILE_LEN}"
+            " character file limit; use a bundle for this game"
+        )
+    name = stem + ".src"
+    write_text(os.path.join(out_dir, name), content)
+    hashes[name] = md5(content)
+    return name, hashes
+
+
+def pack_game(game_dir: str, out_dir: str) -> Dict[str, str]:
+    """Pack the game directory into the output directory; returns the file hashes."""
+    info_text = read_text(os.path.join(game_dir, "gameinfo.txt"))
+    info = parse_properties(info_text)
+    if "client" not in info:
+        raise ValueError(f"{game_dir}: gameinfo.txt has no 'client' setting")
+    os.makedirs(out_dir, exist_ok=True)
+    shutil.copyfile(os.path.join(game_dir, "about.txt"), os.path.join(out_dir, "about.txt"))
+
+    hashes: Dict[str, str] = {}
+    packed: Dict[str, str] = {}
+    for key in ("client", "host"):
+        if key in info:
+            packed[key], source_hashes = pack_source(game_dir, out_dir, info[key])
+            hashes.update(source_hashes)
+
+    # Keep the gameinfo.txt as written, other than the packed source names.
+    lines: List[str] = []
+    for line in info_text.split("\n"):
+        key = line.lstrip(" ").split("=", 1)[0]
+        if key in packed and "=" in line:
+            line = f"{key}={packed[key]}"
+        lines.append(line)
+    write_text(os.path.join(out_dir, "gameinfo.txt"), "\n".join(lines))
+    write_text(
+        os.path.join(out_dir, "build.txt"),
+        "\n".join(f"{name}={value}" for name, value in sorted(hashes.items())),
+    )
+    return hashes
+
+
+def main(game_dir: str, out_dir: str) -> None:
+    build_file = os.path.join(out_dir, "build.txt")
+    previous: Dict[str, str] = {}
+    if os.path.isfile(build_file):
+        previous = parse_properties(read_text(build_file))
+    try:
+        hashes = pack_game(game_dir, out_dir)
+    except (OSError, ValueError) as err:
+        sys.stderr.write(f"{err}\n")
+        sys.exit(1)
+    for name, value in sorted(hashes.items()):
+        size = os.path.getsize(os.path.join(out_dir, name))
+        state = "unchanged" if previous.get(name) == value else "changed"
+        print(f"{name:<32} {size:7d} bytes  {value}  {state}")
+
+
+if __name__ == "__main__":
+    if "-h" in sys.argv or "--help" in sys.argv or len(sys.argv) != 3:
+        sys.stderr.write(f"Usage: {sys.argv[0]} (game dir) (output dir)\n")
+        sys.exit(1)
+    main(sys.argv[1], sys.argv[2])
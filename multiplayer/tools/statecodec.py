@@ -0,0 +1,266 @@
+#!/usr/bin/python3
+
+"""Reference implementation and benchmark for the compact game state codec.
+
+This matches `multiplayer/statecodec.gs`.  Each field is a whole number written
+as a fixed number of base-64 digits; a field is defined as (width, bias), and
+the first field is the frame id.  Messages are either a full frame:
+    "F" (all fields)
+or a delta against a frame the receiver acknowledged:
+    "D" (base frame id) (changed field mask) (changed fields)
+
+Running this script simulates a tennis match and compares the per-frame payload
+and the encode + decode cost of the original delimited text state against the
+codec, with and without deltas.  Python's str() and int() are native code, so
+the delimited format's timings here flatter it; in Grey Hack, each `to_int` and
+`split` is interpreted, while the codec decodes a field up to 2 digits wide with
+one map lookup, from tables of every 1 and 2 digit string built once.
+"""
+
+from typing import Callable, Dict, List, Sequence, Tuple
+import math
+import random
+import sys
+import time
+
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz-_"
+# SINGLES[value] and PAIRS[value] are the 1 and 2 digit strings; DIGIT_VALUE[text] is the value of either.
+SINGLES = list(DIGITS)
+PAIRS = [high + low for high in DIGITS for low in DIGITS]
+DIGIT_VALUE: Dict[str, int] = {text: idx for idx, text in enumerate(SINGLES)}
+DIGIT_VALUE.update({text: idx for idx, text in enumerate(PAIRS)})
+MSG_SEP = chr(1)
+
+# The tennis server state: turn, ball x, ball y, paddle 0 x, paddle 1 x, score 0, score 1
+TENNIS_SERVER_FIELDS: List[Tuple[int, int]] = [
+    (3, 1), (2, 8), (1, 8), (2, 0), (2, 0), (2, 0), (2, 0),
+]
+
+
+def pack(value: int, width: int) -> str:
+    """Write the non-negative number as a fixed width base-64 string.
+
+    Digits past the width are dropped.
+    """
+    value = max(0, value)
+    if width == 2:
+        return PAIRS[value % 4096]
+    if width == 1:
+        return SINGLES[value % 64]
+    parts: List[str] = []
+    while width >= 2:
+        parts.insert(0, PAIRS[value % 4096])
+        value //= 4096
+        width -= 2
+    if width == 1:
+        parts.insert(0, SINGLES[value % 64])
+    return "".join(parts)
+
+
+def unpack(text: str) -> int | None:
+    """Read a base-64 string into a number, or None if it isn't one."""
+    if len(text) <= 2:
+        return DIGIT_VALUE.get(text)
+    pos = len(text) % 2
+    ret = 0
+    if pos == 1:
+        if text[0] not in DIGIT_VALUE:
+            return None
+        ret = DIGIT_VALUE[text[0]]
+    while pos < len(text):
+        part = text[pos:pos + 2]
+        if part not in DIGIT_VALUE:
+            return None
+        ret = ret * 4096 + DIGIT_VALUE[part]
+        pos += 2
+    return ret
+
+
+class StateCodec:
+    """Encodes and decodes frames of field values, remembering the recent frames."""
+
+    def __init__(self, fields: Sequence[Tuple[int, int]]) -> None:
+        self.fields = list(fields)
+        self.mask_width = math.ceil(len(fields) / 6)
+        self.id_width, self.id_bias = fields[0]
+        self.full_len = 1 + sum(width for width, _ in fields)
+        self.history: Dict[int, List[int]] = {}
+        self.history_order: List[int] = []
+        self.max_history = 8
+        self.key_frame_every = 32
+        self.since_key_frame = 0
+
+    def encode(self, values: Sequence[int], base_id: int | None = None) -> str:
+        """Encode the values, as a delta from the base frame if it's still known."""
+        self.remember(list(values))
+        self.since_key_frame += 1
+        if (
+            base_id is None
+            or base_id == values[0]
+            or base_id not in self.history
+            or self.since_key_frame >= self.key_frame_every
+        ):
+            self.since_key_frame = 0
+            return "F" + "".join(
+                pack(value + bias, width)
+                for value, (width, bias) in zip(values, self.fields)
+            )
+
+        base = self.history[base_id]
+        mask = 1
+        parts = ["D", pack(base_id + self.id_bias, self.id_width), "", pack(values[0] + self.id_bias, self.id_width)]
+        for idx in range(1, len(self.fields)):
+            if values[idx] != base[idx]:
+                mask |= 1 << idx
+                width, bias = self.fields[idx]
+                parts.append(pack(values[idx] + bias, width))
+        parts[2] = pack(mask, self.mask_width)
+        return "".join(parts)
+
+    def decode(self, text: str) -> List[int] | None:
+        """Decode the message into the field values, or None if it's invalid."""
+        if not text:
+            return None
+        ret: List[int] = []
+        if text[0] == "F":
+            if len(text) != self.full_len:
+                return None
+            pos = 1
+            for width, bias in self.fields:
+                value = DIGIT_VALUE.get(text[pos:pos + width]) if width <= 2 else unpack(text[pos:pos + width])
+                if value is None:
+                    return None
+                ret.append(value - bias)
+                pos += width
+        elif text[0] == "D":
+            pos = 1 + self.id_width + self.mask_width
+            if pos > len(text):
+                return None
+            base_id = unpack(text[1:1 + self.id_width])
+            mask = unpack(text[1 + self.id_width:pos])
+            if base_id is None or mask is None:
+                return None
+            base = self.history.get(base_id - self.id_bias)
+            if base is None:
+                return None
+            for idx, (width, bias) in enumerate(self.fields):
+                if mask & 1:
+                    if pos + width > len(text):
+                        return None
+                    part = text[pos:pos + width]
+                    value = DIGIT_VALUE.get(part) if width <= 2 else unpack(part)
+                    if value is None:
+                        return None
+                    ret.append(value - bias)
+                    pos += width
+                else:
+                    ret.append(base[idx])
+                mask >>= 1
+        else:
+            return None
+        self.remember(ret)
+        return ret
+
+    def remember(self, values: List[int]) -> None:
+        frame_id = values[0]
+        if frame_id not in self.history:
+            self.history_order.append(frame_id)
+            if len(self.history_order) > self.max_history:
+                del self.history[self.history_order.pop(0)]
+        self.history[frame_id] = values
+
+
+# --------------------------------------------------------------------
+# Benchmark
+
+
+def simulate_tennis(frames: int, seed: int) -> List[List[int]]:
+    """A rough tennis match: a bouncing ball, paddles that sometimes move, rare scores."""
+    rnd = random.Random(seed)
+    width, height = 80, 17
+    ball_x, ball_y = 40.0, 8.0
+    dx, dy = 0.6, 0.45
+    paddles = [34, 34]
+    score = [0, 0]
+    ret: List[List[int]] = []
+    for turn in range(frames):
+        ball_x += dx
+        ball_y += dy
+        if ball_x <= 0 or ball_x >= width - 2:
+            dx = -dx
+            ball_x = min(max(ball_x, 0.0), width - 2.0)
+        if ball_y <= 1 or ball_y >= height - 2:
+            if rnd.random() < 0.15:
+                score[0 if ball_y > 1 else 1] += 1
+                ball_x, ball_y = 40.0, 8.0
+            dy = -dy
+            ball_y = min(max(ball_y, 1.0), height - 2.0)
+        for idx in range(2):
+            if rnd.random() < 0.3:
+                paddles[idx] = min(max(paddles[idx] + rnd.choice((-2, 2)), 0), width - 12)
+        ret.append([turn, int(ball_x), int(ball_y), paddles[0], paddles[1], score[0], score[1]])
+    return ret
+
+
+def delimited_encode(values: Sequence[int]) -> str:
+    """The original `GameLib.setState` format."""
+    return MSG_SEP.join(str(value) for value in values)
+
+
+def delimited_decode(text: str) -> List[int]:
+    """The original `GameLib.getState` parsing."""
+    return [int(item) for item in text.split(MSG_SEP)]
+
+
+def measure(
+    name: str,
+    frames: List[List[int]],
+    encode: Callable[[List[int], int | None], str],
+    decode: Callable[[str], List[int] | None],
+) -> str:
+    total_chars = 0
+    start = time.perf_counter()
+    acked: int | None = None
+    for values in frames:
+        message = encode(values, acked)
+        total_chars += len(message)
+        decoded = decode(message)
+        if decoded != values:
+            raise ValueError(f"{name}: decoded {decoded} != {values}")
+        # The guest acknowledges each frame as it reads it.
+        acked = values[0]
+    elapsed = time.perf_counter() - start
+    count = max(1, len(frames))
+    return (
+        f"{name:<16} {total_chars / count:6.2f} chars/frame"
+        f"  {1000000.0 * elapsed / count:7.2f} us/frame (encode + decode)"
+    )
+
+
+def main(frames: int, seed: int) -> None:
+    states = simulate_tennis(frames, seed)
+    print(
+        measure(
+            "delimited",
+            states,
+            lambda values, _: delimited_encode(values),
+            delimited_decode,
+        )
+    )
+    sender = StateCodec(TENNIS_SERVER_FIELDS)
+    receiver = StateCodec(TENNIS_SERVER_FIELDS)
+    print(measure("codec full", states, lambda values, _: sender.encode(values), receiver.decode))
+    sender = StateCodec(TENNIS_SERVER_FIELDS)
+    receiver = StateCodec(TENNIS_SERVER_FIELDS)
+    print(measure("codec delta", states, sender.encode, receiver.decode))
+
+
+if __name__ == "__main__":
+    if "-h" in sys.argv or "--help" in sys.argv or len(sys.argv) > 3:
+        sys.stderr.write(f"Usage: {sys.argv[0]} [frame count] [seed]\n")
+        sys.exit(1)
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 20000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 1,
+    )
@@ -0,0 +1,71 @@
+#!/usr/bin/python3
+
+"""Copy the state codec into the games that use it.
+
+Each game is built from its one source file, so a game that uses
+`multiplayer/statecodec.gs` carries a copy of it, between its "Shared state
+codec" lines.  This replaces each copy with the current `statecodec.gs`.  Run
+it after changing `statecodec.gs`:
+
+    synccodec.py [--check]
+
+With `--check`, it only reports whether any of the games are out of date.
+"""
+
+from typing import List
+import os
+import sys
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(os.path.dirname(HERE))
+SHARED = os.path.join(ROOT, "multiplayer", "statecodec.gs")
+GAMES = (
+    os.path.join(ROOT, "tennis", "multiplayer", "tennis.src"),
+)
+SHARED_START = "// ---- Shared state codec; copied from multiplayer/statecodec.gs by synccodec.py, do not edit here.\n"
+SHARED_END = "// ---- End of shared state codec.\n"
+
+
+def replace_between(text: str, start: str, end: str, body: str, name: str) -> str:
+    begin = text.find(start)
+    finish = text.find(end, begin + 1)
+    if begin < 0 or finish < 0:
+        raise ValueError(f"{name} has no '{start.strip()}' ... '{end.strip()}' lines")
+    return text[:begin] + body + text[finish + len(end):]
+
+
+def usage() -> None:
+    sys.stderr.write(f"Usage: {sys.argv[0]} [--check]\n")
+    sys.exit(1)
+
+
+def main(args: List[str]) -> None:
+    check = False
+    for arg in args:
+        if arg == "--check":
+            check = True
+        else:
+            usage()
+    with open(SHARED, "r", encoding="utf-8") as fis:
+        shared = fis.read()
+
+    stale = []
+    for game in GAMES:
+        with open(game, "r", encoding="utf-8") as fis:
+            text = fis.read()
+        updated = replace_between(text, SHARED_START, SHARED_END, SHARED_START + shared + SHARED_END, game)
+        if updated == text:
+            continue
+        stale.append(os.path.relpath(game, ROOT))
+        if not check:
+            with open(game, "w", encoding="utf-8", newline="") as fos:
+                fos.write(updated)
+    if check:
+        print("Out of date: " + ", ".join(stale) if stale else "Up to date.")
+        sys.exit(1 if stale else 0)
+    print("Updated: " + ", ".join(stale) if stale else "Already up to date.")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -53,27 +53,41 @@ main = function()
     if gameInfo == null then exit("Invalid game directory setup.  See the README.md file for details.")
 
     // Need to get the source files.
-    if gameInfo.Client[-4:] != ".src" and gameInfo.Client[-7:] != ".bundle" then
-        exit("Invalid game directory setup; client source file must end with '.src' or '.bundle'")
-    end if
-    clientFile = get_shell.host_computer.File(gameInfo.gameDir + "/" + gameInfo.Client)
-    if clientFile == null or clientFile.is_binary then exit("Invalid game directory setup; client source file is invalid: '" + gameInfo.gameDir + "/" + gameInfo.Client + "'")
-    hostFile = null
+    clientFiles = SourceFiles(gameInfo.gameDir, gameInfo.Client)
+    if clientFiles isa string then exit("Invalid game directory setup; client " + clientFiles)
+    hostFiles = []
     if gameInfo.Host != null then
-        if gameInfo.Host[-4:] != ".src" and gameInfo.Host[-7:] != ".bundle" then
-            exit("Invalid game directory setup; host source file must end with '.src' or '.bundle'")
-        end if
-        hostFile = get_shell.host_computer.File(gameInfo.gameDir + "/" + gameInfo.Host)
-        if hostFile == null or hostFile.is_binary then exit("Invalid game directory setup; host source file is invalid: '" + gameInfo.gameDir + "/" + gameInfo.Host + "'")
+        hostFiles = SourceFiles(gameInfo.gameDir, gameInfo.Host)
+        if hostFiles isa string then exit("Invalid game directory setup; host " + hostFiles)
     end if
 
     remoteGameDir = server.serverRootDir + "/Games/" + gameInfo.SimpleName
     server.AddFile(remoteGameDir, "about.txt", aboutFile)
     server.AddFile(remoteGameDir, "gameinfo.txt", infoFile)
-    server.AddFile(remoteGameDir, gameInfo.Client, clientFile)
-    if hostFile != null then
-        server.AddFile(remoteGameDir, gameInfo.Host, hostFile)
+    // Record the content hash of each source file, so the lobby only rebuilds the game when it changes.
+    buildInfo = []
+    for file in clientFiles + hostFiles
+        server.AddFile(remoteGameDir, file.name, file)
+        buildInfo.push(file.name + "=" + md5(file.get_content))
+    end for
+    server.AddContent(remoteGameDir, "build.txt", buildInfo.join(char(10)))
+end function
+
+// SourceFiles Get the list of local files for the client or host source setting.  Returns a string on error.
+SourceFiles = function(gameDir, source)
+    names = [source]
+    if source[:7] == "bundle:" then
+        names = source[7:].split(",")
+    else if source[-4:] != ".src" and source[-7:] != ".bundle" then
+        return "source file must end with '.src' or '.bundle', or be a 'bundle:' list"
     end if
+    ret = []
+    for name in names
+        file = get_shell.host_computer.File(gameDir + "/" + name)
+        if file == null or file.is_binary then return "source file is invalid: '" + gameDir + "/" + name + "'"
+        ret.push(file)
+    end for
+    return ret
 end function
 
 // ---------------------------
@@ -206,6 +220,10 @@ end function
 // --------------
 // Custom stuff on top of the game server.
 GameServer.Server.AddFile = function(dirName, fileName, localFile)
+    return self.AddContent(dirName, fileName, localFile.get_content)
+end function
+
+GameServer.Server.AddContent = function(dirName, fileName, content)
     if self.server == null then return "not connected"
     print("DEBUG Getting server directory '" + dirName + "'")
     parent = self.server.host_computer.File(dirName)
@@ -240,7 +258,7 @@ GameServer.Server.AddFile = function(dirName, fileName, localFile)
     res = rfile.chmod("o+rwx")
     if res != "" and res != null then exit("Failed to update directory '" + rfile.path + "' other permissions: " + res)
 
-    rfile.set_content(localFile.get_content)
+    rfile.set_content(content)
 end function
 
 if locals == globals then main()
@@ -0,0 +1,647 @@
+#!/usr/bin/python3
+
+"""Compile a story's routines into GreyScript functions, ahead of time.
+
+The interpreter decodes and dispatches every instruction it runs.  This
+decodes the story's routines here instead, with the opcode tables from
+`src/gen_opcodes.py`, splits each routine into basic blocks, and writes each
+routine as one GreyScript function that runs the blocks' instructions
+directly against the `MachineState`:
+
+    aot-compile.py [--profile (perf dump)] [--top (count)] (story file) (output .gs file)
+
+The routines are found by following each `call` with a constant routine
+address from the start of the story.  Use `--top` to compile only that many
+of them, the most called first.  Without a profile, that's the routines
+called from the most places.  With a profile (the interpreter's `$12` dump or
+the bench dump, recorded with profiling on), it's the routines called the
+most times, including the ones only called through variables.
+
+The arithmetic, comparison, jump, variable, memory, and return instructions
+are written out in full.  The other instructions call their `Opcodes`
+handler, just like the interpreter.  A compiled routine returns to the
+interpreter when it reaches an instruction that reads input or replaces the
+machine state (`sread`, `save`, `restore`, `restart`, `quit`), or when it
+calls a routine that isn't compiled; the interpreter picks the compiled
+routine back up at the next block start.
+
+The output registers the functions in `AotStories`, keyed by the story's
+release and serial number, for `MachineState.New` to find.  Import it after
+`machine.gs`.  Only version 1 to 3 stories are supported, like the interpreter.
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+import base64
+import json
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+import gen_opcodes  # noqa: E402  # pylint: disable=wrong-import-position
+
+
+# Largest text file Grey Hack will store.
+MAX_FILE_LEN = 160000
+
+# Instructions the compiled code leaves to the interpreter.
+EXIT_MNEMONICS = {"sread_v1", "save_v1", "restore_v1", "restart_v1", "quit_v1"}
+# Instructions that end a block without falling through to the next instruction.
+NO_FALL_THROUGH = {"rtrue_v1", "rfalse_v1", "ret_v1", "ret_popped_v1", "print_ret_v1", "jump_v1", "quit_v1", "restart_v1"}
+# Instructions written out in full.
+INLINE_MNEMONICS = {
+    "add_v1", "sub_v1", "mul_v1", "div_v1", "mod_v1", "and_v1", "or_v1",
+    "je_v1", "jl_v1", "jg_v1", "jz_v1", "test_v1",
+    "inc_v1", "dec_v1", "inc_chk_v1", "dec_chk_v1",
+    "load_v1", "store_v1", "push_v1", "pull_v1",
+    "loadw_v1", "loadb_v1", "storew_v1", "storeb_v1",
+    "jump_v1", "rtrue_v1", "rfalse_v1", "ret_v1", "ret_popped_v1", "nop_v1",
+}
+OPCODE_HANDLER = re.compile(r"^Opcodes\.(\w+)\s*=")
+PROFILE_ROUTINE = re.compile(r"^routine@(\d+)=(\d+)")
+
+
+class Operand:
+    """An operand; a constant, or the value of a variable."""
+
+    __slots__ = ("is_var", "value", "size")
+
+    def __init__(self, is_var: bool, value: int, size: int) -> None:
+        self.is_var = is_var
+        self.value = value
+        self.size = size
+
+
+class Branch:
+    """Branch data; on true or false, to a return value or an address."""
+
+    __slots__ = ("on", "returns", "address")
+
+    def __init__(self, on: bool, returns: Optional[int], address: Optional[int]) -> None:
+        self.on = on
+        self.returns = returns
+        self.address = address
+
+
+class Instruction:
+    __slots__ = ("address", "mnemonic", "operands", "stores", "branch", "operand_end", "next")
+
+    def __init__(
+        self, address: int, mnemonic: str, operands: List[Operand],
+        stores: Optional[int], branch: Optional[Branch], operand_end: int, next_address: int,
+    ) -> None:
+        self.address = address
+        self.mnemonic = mnemonic
+        self.operands = operands
+        self.stores = stores
+        self.branch = branch
+        # Where the interpreter leaves the PC before running the opcode.
+        self.operand_end = operand_end
+        self.next = next_address
+
+
+class Story:
+    """The story file, and an instruction decoder that matches `MachineState.instructionAt`."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.version = data[0]
+        if self.version > 3:
+            raise ValueError(f"Only version 1 to 3 stories are supported; this is version {self.version}")
+        self.release = data[3]
+        self.serial = "".join(chr(ch) for ch in data[18:24] if 32 <= ch <= 127)
+        self.start_pc = data[6] * 256 + data[7]
+        self.static_base = data[14] * 256 + data[15]
+        std, _ = gen_opcodes.groupRows(gen_opcodes.parseLookup())
+        self.opcodes: Dict[int, Tuple[str, List[int], bool, bool]] = {}
+        for byte, rows in std.items():
+            for row in rows:
+                if row.version_start is not None and self.version >= row.version_start:
+                    self.opcodes[byte] = (
+                        row.mnemonic, json.loads(gen_opcodes.ARG_TYPE_ID_LOOKUP[row.args]),
+                        row.stores, row.branches,
+                    )
+                    break
+
+    @property
+    def story_id(self) -> str:
+        """The key for `AotStories`; the release and serial number."""
+        return f"{self.release}.{self.serial}"
+
+    def routine_address(self, packed: int) -> int:
+        return packed * 2
+
+    def string_end(self, address: int) -> int:
+        """The address after the Z-encoded string at the address."""
+        while address + 1 < len(self.data):
+            word = self.data[address] * 256 + self.data[address + 1]
+            address += 2
+            if word >= 32768:
+                return address
+        raise ValueError(f"Unterminated string @{address}")
+
+    def decode(self, address: int) -> Instruction:
+        data = self.data
+        pos = address
+        byte = data[pos]
+        pos += 1
+        if byte not in self.opcodes:
+            raise ValueError(f"Unknown opcode {byte} @{address}")
+        mnemonic, type_codes, stores, branches = self.opcodes[byte]
+        if len(type_codes) == 1 and type_codes[0] >= 3:
+            type_bytes = [data[pos]]
+            pos += 1
+            if type_codes[0] == 4:
+                type_bytes.append(data[pos])
+                pos += 1
+            type_codes = [(type_byte >> shift) & 3 for type_byte in type_bytes for shift in (6, 4, 2, 0)]
+        operands: List[Operand] = []
+        for code in type_codes:
+            if code == 0:
+                operands.append(Operand(False, data[pos] * 256 + data[pos + 1], 2))
+                pos += 2
+            elif code == 1:
+                operands.append(Operand(False, data[pos], 1))
+                pos += 1
+            elif code == 2:
+                operands.append(Operand(True, data[pos], 2))
+                pos += 1
+        store: Optional[int] = None
+        if stores:
+            store = data[pos]
+            pos += 1
+        branch: Optional[Branch] = None
+        if branches:
+            first = data[pos]
+            pos += 1
+            on = first >= 128
+            first %= 128
+            if first >= 64:
+                offset = first % 64
+            else:
+                offset = (first % 64) * 256 + data[pos]
+                pos += 1
+                if offset >= 8192:
+                    offset -= 16384
+            if offset in (0, 1):
+                branch = Branch(on, offset, None)
+            else:
+                branch = Branch(on, None, pos + offset - 2)
+        operand_end = pos
+        if mnemonic in ("print_v1", "print_ret_v1"):
+            pos = self.string_end(pos)
+        return Instruction(address, mnemonic, operands, store, branch, operand_end, pos)
+
+
+class Routine:
+    """A routine's instructions, split into basic blocks."""
+
+    def __init__(self, story: Story, address: int, is_main: bool = False) -> None:
+        self.address = address
+        if is_main:
+            # The v1-3 start PC is an instruction, not a routine; it runs with no locals.
+            self.local_count = 0
+            self.entry = address
+        else:
+            self.local_count = story.data[address]
+            if self.local_count > 15:
+                raise ValueError(f"Not a routine @{address}: {self.local_count} locals")
+            self.entry = address + 1 + 2 * self.local_count
+        self.instructions: Dict[int, Instruction] = {}
+        self.leaders: Set[int] = {self.entry}
+        self.calls: Set[int] = set()
+        pending = [self.entry]
+        while pending:
+            pc = pending.pop()
+            while pc not in self.instructions:
+                if pc < story.static_base or pc >= len(story.data):
+                    raise ValueError(f"Routine @{address} runs outside the code @{pc}")
+                instruction = story.decode(pc)
+                self.instructions[pc] = instruction
+                mnemonic = instruction.mnemonic
+                if mnemonic.startswith("call") and instruction.operands and not instruction.operands[0].is_var:
+                    if instruction.operands[0].value != 0:
+                        self.calls.add(story.routine_address(instruction.operands[0].value))
+                if instruction.branch is not None:
+                    # The instruction after a branch starts a block, as does its target.
+                    if instruction.branch.address is not None:
+                        self.leaders.add(instruction.branch.address)
+                        pending.append(instruction.branch.address)
+                    self.leaders.add(instruction.next)
+                if mnemonic == "jump_v1":
+                    target = instruction.next + signed16(instruction.operands[0].value) - 2
+                    if instruction.operands[0].is_var:
+                        raise ValueError(f"Routine @{address} has a computed jump @{pc}")
+                    self.leaders.add(target)
+                    pending.append(target)
+                if mnemonic not in INLINE_MNEMONICS:
+                    # Handler calls and interpreted instructions resume at the next instruction.
+                    self.leaders.add(instruction.next)
+                if mnemonic in NO_FALL_THROUGH:
+                    break
+                pc = instruction.next
+        self.leaders &= set(self.instructions)
+
+    def blocks(self) -> List[List[Instruction]]:
+        ret: List[List[Instruction]] = []
+        for pc in sorted(self.instructions):
+            if pc in self.leaders or not ret:
+                ret.append([])
+            ret[-1].append(self.instructions[pc])
+        return ret
+
+
+def signed16(value: int) -> int:
+    return value - 65536 if value >= 32768 else value
+
+
+def find_routines(story: Story) -> Tuple[Dict[int, Routine], Dict[int, str]]:
+    """Every routine reachable from the start through constant calls, and the ones that failed to decode."""
+    routines: Dict[int, Routine] = {}
+    failed: Dict[int, str] = {}
+    pending: List[Tuple[int, bool]] = [(story.start_pc, True)]
+    while pending:
+        address, is_main = pending.pop()
+        if address in routines or address in failed:
+            continue
+        try:
+            routine = Routine(story, address, is_main)
+        except (ValueError, IndexError) as err:
+            failed[address] = str(err)
+            continue
+        routines[address] = routine
+        pending.extend((call, False) for call in routine.calls)
+    return routines, failed
+
+
+class Writer:
+    """Writes one routine's GreyScript function."""
+
+    def __init__(self, routine: Routine, handlers: Set[str]) -> None:
+        self.routine = routine
+        self.handlers = handlers
+        self.lines: List[str] = []
+        self.inline = 0
+        self.called = 0
+        self.exits = 0
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append("  " * indent + line)
+
+    def value(self, operand: Operand) -> str:
+        """The expression for the operand's value."""
+        if not operand.is_var:
+            return str(operand.value)
+        return self.read_var(operand.value)
+
+    def address(self, array: Operand, index: Operand, scale: int) -> str:
+        """The expression for the table entry address, array + scale * index."""
+        if not array.is_var and not index.is_var:
+            return str(array.value + scale * index.value)
+        if index.is_var:
+            offset = self.value(index) if scale == 1 else f"({scale} * {self.value(index)})"
+        elif index.value == 0:
+            return self.value(array)
+        else:
+            offset = str(scale * index.value)
+        return f"{self.value(array)} + {offset}"
+
+    def read_var(self, ref: int) -> str:
+        if ref == 0:
+            return "machine.GetVariableRef(0)"
+        if ref < 16:
+            if ref <= self.routine.local_count:
+                return f"frame[{ref + 2}]"
+            return f"machine.GetVariableRef({ref})"
+        return f"gvars[{ref - 16}]"
+
+    def write_var(self, indent: int, ref: int, expr: str) -> None:
+        if ref == 0:
+            self.emit(indent, f"stack.push({expr})")
+        elif ref < 16 and ref <= self.routine.local_count:
+            self.emit(indent, f"frame[{ref + 2}] = {expr}")
+        elif ref < 16:
+            self.emit(indent, f"machine.SetVariableRef({ref}, {expr})")
+        else:
+            self.emit(indent, f"machine.setGlobalVariable({ref}, {expr})")
+
+    def signed(self, indent: int, name: str, operand: Operand) -> None:
+        """Set the local to the operand's signed value."""
+        if not operand.is_var:
+            self.emit(indent, f"{name} = {signed16(operand.value)}")
+            return
+        self.emit(indent, f"{name} = {self.value(operand)}")
+        self.emit(indent, f"if {name} >= 32768 then {name} = {name} - 65536")
+
+    def unsign(self, indent: int, name: str) -> None:
+        # Same as MachineState.Unsign16.
+        self.emit(indent, f"if {name} < 0 then {name} = 65536 + {name} else {name} = {name} % 65536")
+
+    def take_branch(self, indent: int, instruction: Instruction, cond: str) -> None:
+        """The instruction's branch on the condition; the instruction ends its block."""
+        branch = instruction.branch
+        assert branch is not None
+        test = cond if branch.on else f"not ({cond})"
+        if branch.returns is not None:
+            self.emit(indent, f"if {test} then")
+            self.emit(indent + 1, f"machine.PopStackFrame({branch.returns})")
+            self.emit(indent + 1, "return count")
+            self.emit(indent, "end if")
+            self.emit(indent, f"pc = {instruction.next}")
+        else:
+            self.emit(indent, f"pc = {instruction.next}")
+            self.emit(indent, f"if {test} then pc = {branch.address}")
+
+    def ret(self, indent: int, expr: str) -> None:
+        self.emit(indent, f"machine.PopStackFrame({expr})")
+        self.emit(indent, "return count")
+
+    def var_ref(self, operand: Operand) -> Optional[int]:
+        """The variable reference operand of inc, dec, load, store and pull, if it's a constant."""
+        return None if operand.is_var else operand.value
+
+    def write_inline(self, indent: int, ins: Instruction) -> bool:
+        """Write out the instruction; false if it must call the handler instead."""
+        name = ins.mnemonic[:-3]
+        ops = ins.operands
+        if name in ("add", "sub") and len(ops) == 2 and ins.stores is not None:
+            # The signed 16-bit sum or difference, as unsigned, is the same as the unsigned one.
+            if name == "add":
+                expr = f"({self.value(ops[0])} + {self.value(ops[1])}) % 65536"
+            else:
+                expr = f"({self.value(ops[0])} - {self.value(ops[1])} + 65536) % 65536"
+            self.write_var(indent, ins.stores, expr)
+        elif name in ("mul", "div", "mod") and len(ops) == 2 and ins.stores is not None:
+            self.signed(indent, "a", ops[0])
+            self.signed(indent, "b", ops[1])
+            if name in ("div", "mod"):
+                self.emit(indent, f"if b == 0 then exit(\"Attempted '{name}' by zero\")")
+            expr = {"mul": "a * b", "div": "floor(a / b)", "mod": "floor(a % b)"}[name]
+            self.emit(indent, f"r = {expr}")
+            self.unsign(indent, "r")
+            self.write_var(indent, ins.stores, "r")
+        elif name in ("and", "or") and len(ops) == 2 and ins.stores is not None:
+            func = "bitAnd" if name == "and" else "bitOr"
+            self.write_var(indent, ins.stores, f"{func}({self.value(ops[0])}, {self.value(ops[1])})")
+        elif name == "je" and ops and ins.branch is not None:
+            self.emit(indent, f"a = {self.value(ops[0])}")
+            tests = " or ".join(f"a == {self.value(op)}" for op in ops[1:]) or "false"
+            self.take_branch(indent, ins, tests)
+        elif name in ("jl", "jg") and len(ops) == 2 and ins.branch is not None:
+            self.signed(indent, "a", ops[0])
+            self.signed(indent, "b", ops[1])
+            self.take_branch(indent, ins, "a < b" if name == "jl" else "a > b")
+        elif name == "jz" and len(ops) == 1 and ins.branch is not None:
+            self.take_branch(indent, ins, f"{self.value(ops[0])} == 0")
+        elif name == "test" and len(ops) == 2 and ins.branch is not None:
+            self.emit(indent, f"b = {self.value(ops[1])}")
+            self.take_branch(indent, ins, f"bitAnd({self.value(ops[0])}, b) == b")
+        elif name in ("inc", "dec", "inc_chk", "dec_chk") and self.var_ref(ops[0]) is not None:
+            ref = ops[0].value
+            step = "1" if name.startswith("inc") else "65535"
+            if not name.endswith("_chk"):
+                self.write_var(indent, ref, f"({self.read_var(ref)} + {step}) % 65536")
+            elif len(ops) != 2 or ins.branch is None:
+                return False
+            else:
+                self.emit(indent, f"a = ({self.read_var(ref)} + {step}) % 65536")
+                self.write_var(indent, ref, "a")
+                self.emit(indent, "if a >= 32768 then a = a - 65536")
+                self.signed(indent, "b", ops[1])
+                self.take_branch(indent, ins, "a > b" if name == "inc_chk" else "a < b")
+        elif name == "load" and len(ops) == 1 and ins.stores is not None and self.var_ref(ops[0]) is not None:
+            self.write_var(indent, ins.stores, self.read_var(ops[0].value))
+        elif name == "store" and len(ops) == 2 and self.var_ref(ops[0]) is not None:
+            self.write_var(indent, ops[0].value, self.value(ops[1]))
+        elif name == "push" and len(ops) == 1:
+            self.emit(indent, f"stack.push({self.value(ops[0])})")
+        elif name == "pull" and len(ops) == 1 and self.var_ref(ops[0]) is not None:
+            self.emit(indent, "r = machine.GetVariableRef(0)")
+            self.emit(indent, "if r == null then exit(\"Pull on an empty stack.\")")
+            self.write_var(indent, ops[0].value, "r")
+        elif name in ("loadw", "loadb") and len(ops) == 2 and ins.stores is not None:
+            if name == "loadw":
+                expr = f"machine.ReadWord({self.address(ops[0], ops[1], 2)})"
+            else:
+                expr = f"machine.ReadByte({self.address(ops[0], ops[1], 1)})"
+            self.write_var(indent, ins.stores, expr)
+        elif name in ("storew", "storeb") and len(ops) == 3:
+            if name == "storew":
+                self.emit(indent, f"machine.SetWord({self.address(ops[0], ops[1], 2)}, {self.value(ops[2])})")
+            else:
+                self.emit(indent, f"machine.SetByte({self.address(ops[0], ops[1], 1)}, {self.value(ops[2])})")
+        elif name == "jump" and len(ops) == 1 and not ops[0].is_var:
+            self.emit(indent, f"pc = {ins.next + signed16(ops[0].value) - 2}")
+        elif name in ("rtrue", "rfalse"):
+            self.ret(indent, "1" if name == "rtrue" else "0")
+        elif name == "ret" and len(ops) == 1:
+            self.ret(indent, self.value(ops[0]))
+        elif name == "ret_popped":
+            self.ret(indent, "machine.GetVariableRef(0)")
+        elif name == "nop":
+            pass
+        else:
+            return False
+        self.inline += 1
+        return True
+
+    def write_handler(self, indent: int, ins: Instruction) -> None:
+        """Call the instruction's Opcodes handler, the same way the interpreter does."""
+        operands = []
+        for op in ins.operands:
+            if op.is_var:
+                operands.append(f'{{"t": "v", "s": 2, "v": {op.value}, "c": {self.value(op)}}}')
+            else:
+                operands.append(f'{{"t": "c", "s": {op.size}, "c": {op.value}}}')
+        branch = "null"
+        if ins.branch is not None:
+            on = "true" if ins.branch.on else "false"
+            if ins.branch.returns is not None:
+                branch = f'{{"b": {on}, "t": "r", "r": {ins.branch.returns}}}'
+            else:
+                branch = f'{{"b": {on}, "t": "a", "a": {ins.branch.address}}}'
+        stores = "null" if ins.stores is None else str(ins.stores)
+        self.emit(indent, f"frame[0] = {ins.operand_end}")
+        self.emit(indent, f"Opcodes.{ins.mnemonic}(machine, [{', '.join(operands)}], {stores}, {branch})")
+        # A call into an interpreted routine, or a return, leaves this frame.
+        self.emit(indent, "if machine.callStack.len != depth then return count")
+        self.emit(indent, "pc = frame[0]")
+        self.called += 1
+
+    def write(self, prefix: str) -> List[str]:
+        routine = self.routine
+        blocks = routine.blocks()
+        self.emit(0, f"// Routine @{routine.address}, {routine.local_count} locals, {len(blocks)} blocks, {len(routine.instructions)} instructions.")
+        self.emit(0, f"{prefix}_{routine.address:x} = function(machine, frame, pc)")
+        self.emit(1, "stack = frame[1]")
+        self.emit(1, "gvars = machine.globals")
+        self.emit(1, "depth = machine.callStack.len")
+        self.emit(1, "count = 0")
+        self.emit(1, "while true")
+        self.emit(2, "start = count")
+        for block in blocks:
+            self.emit(2, f"if pc == {block[0].address} then")
+            counted = len(block) - (1 if block[-1].mnemonic in EXIT_MNEMONICS or block[-1].mnemonic not in self.handlers else 0)
+            if counted > 0:
+                self.emit(3, f"count = count + {counted}")
+            for ins in block:
+                if ins.mnemonic in EXIT_MNEMONICS or (ins.mnemonic not in INLINE_MNEMONICS and ins.mnemonic not in self.handlers):
+                    # The interpreter runs this one.
+                    self.emit(3, f"frame[0] = {ins.address}")
+                    self.emit(3, "return count")
+                    self.exits += 1
+                    break
+                if ins.mnemonic in INLINE_MNEMONICS and self.write_inline(3, ins):
+                    continue
+                self.write_handler(3, ins)
+            else:
+                last = block[-1]
+                if last.mnemonic not in NO_FALL_THROUGH and last.branch is None and last.mnemonic in INLINE_MNEMONICS:
+                    if self.lines[-1].strip() != "pc = frame[0]":
+                        self.emit(3, f"pc = {last.next}")
+            self.emit(2, "end if")
+        self.emit(2, "// Not the start of a block; let the interpreter run it.")
+        self.emit(2, "if count == start then")
+        self.emit(3, "frame[0] = pc")
+        self.emit(3, "return count")
+        self.emit(2, "end if")
+        self.emit(1, "end while")
+        self.emit(0, "end function")
+        return self.lines
+
+
+def read_profile(path: str) -> Dict[int, int]:
+    """The routine call counts from the performance counter dump."""
+    ret: Dict[int, int] = {}
+    with open(path, "r", encoding="utf-8") as fis:
+        for line in fis:
+            match = PROFILE_ROUTINE.match(line.strip())
+            if match:
+                ret[int(match.group(1))] = int(match.group(2))
+    return ret
+
+
+def read_story(path: str) -> bytes:
+    with open(path, "rb") as fis:
+        data = fis.read()
+    if data and not 1 <= data[0] <= 8:
+        # The Ascii85 encoded form the interpreter loads.
+        data = base64.a85decode(data.strip())
+    return data
+
+
+def read_handlers(src_dir: str) -> Set[str]:
+    """The mnemonics with an Opcodes handler."""
+    ret: Set[str] = set()
+    for name in sorted(os.listdir(src_dir)):
+        if name.startswith("opcodes_v") and name.endswith(".gs"):
+            with open(os.path.join(src_dir, name), "r", encoding="utf-8") as fis:
+                for line in fis:
+                    match = OPCODE_HANDLER.match(line)
+                    if match:
+                        ret.add(match.group(1))
+    return ret
+
+
+def main(args: List[str]) -> None:
+    profile: Optional[str] = None
+    top: Optional[int] = None
+    files: List[str] = []
+    while args:
+        arg = args.pop(0)
+        if arg == "--profile" and args:
+            profile = args.pop(0)
+        elif arg == "--top" and args:
+            top = int(args.pop(0))
+        elif arg.startswith("-"):
+            usage()
+        else:
+            files.append(arg)
+    if len(files) != 2:
+        usage()
+    story_file, out_file = files
+
+    story = Story(read_story(story_file))
+    routines, failed = find_routines(story)
+    if profile is not None:
+        calls = read_profile(profile)
+        if not calls:
+            raise ValueError(f"{profile} has no routine call counts; record it with profiling on")
+        for address in calls:
+            # Routines only called through variables or tables.
+            if address not in routines and address not in failed:
+                try:
+                    routines[address] = Routine(story, address)
+                except (ValueError, IndexError) as err:
+                    failed[address] = str(err)
+    else:
+        # Without a profile, rank the routines by the number of places that call them.
+        calls = {address: 0 for address in routines}
+        for routine in routines.values():
+            for instruction in routine.instructions.values():
+                if instruction.mnemonic.startswith("call") and instruction.operands and not instruction.operands[0].is_var:
+                    address = story.routine_address(instruction.operands[0].value)
+                    if address in calls:
+                        calls[address] += 1
+    selected = sorted(
+        (address for address in routines if address in calls),
+        key=lambda address: (-calls[address], address),
+    )
+    if top is not None:
+        selected = selected[:top]
+
+    handlers = read_handlers(os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+    prefix = "Aot" + re.sub(r"[^A-Za-z0-9]", "", story.serial)
+    lines = [
+        f"// Compiled routines for story release {story.release}, serial {story.serial}.",
+        f"// Generated by aot-compile.py from {os.path.basename(story_file)}; do not edit.",
+        "",
+        'if not globals.hasIndex("AotStories") then globals.AotStories = {}',
+        "",
+    ]
+    entries: List[str] = []
+    totals = {"inline": 0, "called": 0, "exits": 0, "instructions": 0}
+    for address in sorted(selected):
+        routine = routines[address]
+        writer = Writer(routine, handlers)
+        lines.extend(writer.write(prefix))
+        lines.append("")
+        for block in routine.blocks():
+            entries.append(f"aotBlocks[{block[0].address}] = @{prefix}_{address:x}")
+        totals["inline"] += writer.inline
+        totals["called"] += writer.called
+        totals["exits"] += writer.exits
+        totals["instructions"] += len(routine.instructions)
+    lines.append("// The compiled routine for each block start address.")
+    lines.append("aotBlocks = {}")
+    lines.extend(entries)
+    lines.append(f'AotStories["{story.story_id}"] = aotBlocks')
+    content = "\n".join(lines) + "\n"
+    with open(out_file, "w", encoding="utf-8", newline="") as fos:
+        fos.write(content)
+
+    print(f"Story {story.story_id}: {len(routines)} routines found, {len(failed)} failed to decode")
+    for address, reason in sorted(failed.items()):
+        print(f"    @{address}: {reason}")
+    print(
+        f"Compiled {len(selected)} routines, {len(entries)} blocks, {totals['instructions']} instructions:"
+        f" {totals['inline']} written out, {totals['called']} handler calls, {totals['exits']} left to the interpreter"
+    )
+    print(f"Wrote {len(content)} characters to {out_file}")
+    if len(content) > MAX_FILE_LEN:
+        print(f"Warning: over the {MAX_FILE_LEN} character file limit; use --profile and --top, or a bundle")
+
+
+def usage() -> None:
+    sys.stderr.write(
+        f"Usage: {sys.argv[0]} [--profile (perf dump)] [--top (count)] (story file) (output .gs file)\n"
+    )
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    try:
+        main(sys.argv[1:])
+    except (OSError, ValueError) as err:
+        sys.stderr.write(f"Failure: {err}\n")
+        sys.exit(1)
@@ -0,0 +1,163 @@
+#!/usr/bin/python3
+
+"""Replay string lookups through the interpreter's bounded cache policies.
+
+The interpreter records each static string lookup (`address:length`) in the
+`stringTrace` line of its performance counter dump while profiling is on
+(`$13`, then `$12` to write `~/zmachine-perf.txt`, or `bench.gs --profile`).
+This plays the recorded lookups against the `BoundedCache` in `src/cache.gs`,
+for each policy and budget, and reports the hit rate, the evictions, and the
+peak size, to pick the `CACHE_BUDGETS` and `CACHE_POLICY` defaults:
+
+    cache-sim.py [--budgets (size,size,...)] [--seed (n)] [(dump file) ...]
+
+The sizes count characters the same way as the cache: the string length plus
+CACHE_ENTRY_OVERHEAD per entry.  Without a dump file, it plays a random walk
+through the rooms of a made up story, where each room's strings are looked up
+while the player stays there, and a few common messages are looked up far more
+than the rest.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import random
+import sys
+
+
+# Keep these the same as src/cache.gs.
+CACHE_ENTRY_OVERHEAD = 24
+POLICIES = ("lru", "lfu")
+DEFAULT_BUDGETS = (4096, 8192, 16384, 32768, 65536)
+
+
+class BoundedCache:
+    """The `BoundedCache` from `src/cache.gs`."""
+
+    def __init__(self, budget: int, policy: str) -> None:
+        self.budget = budget
+        self.policy = policy
+        # key -> [size, last use, use count]
+        self.entries: Dict[int, List[int]] = {}
+        self.size = 0
+        self.peak_size = 0
+        self.tick = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: int) -> bool:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False
+        self.hits += 1
+        self.tick += 1
+        entry[1] = self.tick
+        entry[2] += 1
+        return True
+
+    def put(self, key: int, size: int) -> None:
+        size += CACHE_ENTRY_OVERHEAD
+        if size > self.budget:
+            return
+        if key in self.entries:
+            self.size -= self.entries[key][0]
+        self.tick += 1
+        self.entries[key] = [size, self.tick, 1]
+        self.size += size
+        self.peak_size = max(self.peak_size, self.size)
+        if self.size > self.budget:
+            self.evict()
+
+    def evict(self) -> None:
+        target = self.budget * 3 // 4
+        weight = self.tick + 1 if self.policy == "lfu" else 0
+        order = sorted(self.entries, key=lambda key: self.entries[key][2] * weight + self.entries[key][1])
+        for key in order:
+            if self.size <= target:
+                break
+            self.size -= self.entries.pop(key)[0]
+            self.evictions += 1
+
+
+def read_trace(path: str) -> List[Tuple[int, int]]:
+    """The (address, length) string lookups from the counter dump."""
+    with open(path, "r", encoding="utf-8") as fis:
+        for line in fis:
+            line = line.strip()
+            if line.startswith("stringTrace="):
+                ret = []
+                for item in line[12:].split(","):
+                    address, length = item.split(":")
+                    ret.append((int(address), int(length)))
+                return ret
+    raise ValueError(f"{path} has no stringTrace line; write it with profiling on")
+
+
+def random_trace(turns: int, seed: int) -> List[Tuple[int, int]]:
+    """A random walk through 80 rooms, with 2000 strings.
+
+    Each turn looks up the current room's strings and a few of the messages,
+    where the first few messages are looked up far more than the rest.
+    """
+    rnd = random.Random(seed)
+    lengths = [rnd.randint(4, 300) for _ in range(2000)]
+    rooms = [rnd.sample(range(400, len(lengths)), rnd.randint(2, 6)) for _ in range(80)]
+    weights = [1.0 / (rank + 1) for rank in range(400)]
+    ret: List[Tuple[int, int]] = []
+    room = 0
+    for _ in range(turns):
+        if rnd.random() < 0.4:
+            room = (room + rnd.choice((-3, -1, 1, 3))) % len(rooms)
+        picks = rooms[room][:rnd.randint(1, len(rooms[room]))]
+        picks += rnd.choices(range(400), weights=weights, k=rnd.randint(1, 5))
+        ret.extend((0x4000 + (pick * 64), lengths[pick]) for pick in picks)
+    return ret
+
+
+def replay(trace: List[Tuple[int, int]], budget: Optional[int], policy: str) -> str:
+    cache = BoundedCache(budget if budget is not None else sys.maxsize, policy)
+    for address, length in trace:
+        if not cache.get(address):
+            cache.put(address, length)
+    lookups = max(1, cache.hits + cache.misses)
+    name = "unbounded" if budget is None else f"{policy} {budget}"
+    return (
+        f"{name:<16} {100.0 * cache.hits / lookups:5.1f}% hits  {cache.misses:6d} decodes"
+        f"  {cache.evictions:6d} evictions  {cache.peak_size:7d} peak"
+    )
+
+
+def usage() -> None:
+    sys.stderr.write(f"Usage: {sys.argv[0]} [--budgets (size,size,...)] [--seed (n)] [(dump file) ...]\n")
+    sys.exit(1)
+
+
+def main(args: List[str]) -> None:
+    budgets: List[int] = list(DEFAULT_BUDGETS)
+    seed = 1
+    files: List[str] = []
+    while args:
+        arg = args.pop(0)
+        if arg == "--budgets" and args:
+            budgets = [int(value) for value in args.pop(0).split(",")]
+        elif arg == "--seed" and args:
+            seed = int(args.pop(0))
+        elif arg.startswith("-"):
+            usage()
+        else:
+            files.append(arg)
+    traces = [(name, read_trace(name)) for name in files]
+    if not traces:
+        traces = [("random trace", random_trace(4000, seed))]
+    for name, trace in traces:
+        strings = {address: length for address, length in trace}
+        total = sum(length + CACHE_ENTRY_OVERHEAD for length in strings.values())
+        print(f"== {name}: {len(trace)} lookups of {len(strings)} strings, {total} characters cached if unbounded")
+        print(replay(trace, None, "lru"))
+        for budget in budgets:
+            for policy in POLICIES:
+                print(replay(trace, budget, policy))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
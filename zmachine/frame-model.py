@@ -0,0 +1,302 @@
+#!/usr/bin/python3
+
+"""Model the interpreter's call frame and global variable layouts.
+
+Plays the same call trace against each call frame layout, and reports the
+objects and bytes allocated per routine call, the peak memory, and the time
+per trace step (a call, return, stack push, or local variable update):
+
+    * `map`, the original `{"stack", "pc", "locals", "returnsRef"}` frame;
+    * `list`, the fixed slot `[pc, stack, returnsRef, locals...]` frame from `NewFrame`;
+    * `shared`, one value stack shared by all the frames, with a frame pointer
+      record per call.
+
+It also times the global variable lookup, between reading the two bytes
+through the sparse dynamic memory map and indexing the 240 word `globals` list.
+
+Python's allocator and dictionaries aren't MiniScript's, so the numbers are
+a guide to the relative costs, not to the in-game times.  Run:
+
+    frame-model.py [--calls (count)] [--seed (n)] [(story file) (story dump file)]
+
+With a story file and its `txd`-style dump (such as `tests/minizork.z3` and
+`tests/minizork-dump.txt`), the routines' local variable counts come from the
+story's verb action routines; otherwise they're random.
+"""
+
+from typing import Any, Dict, List, Tuple
+import random
+import re
+import sys
+import time
+import tracemalloc
+
+
+ACTION_ROUTINE = re.compile(r"^\s*\d+\.\s+([0-9a-f]+)\s+([0-9a-f]+)\s")
+
+
+def story_local_counts(story_file: str, dump_file: str) -> List[int]:
+    """The local variable count of each verb action routine in the (version 3) story."""
+    with open(story_file, "rb") as fis:
+        story = fis.read()
+    # The dump lists the routines as byte addresses; a routine starts with its local count.
+    addresses = set()
+    with open(dump_file, "r", encoding="utf-8") as fis:
+        for line in fis:
+            match = ACTION_ROUTINE.match(line)
+            if match is not None:
+                addresses.update(int(address, 16) for address in match.groups())
+    return [story[address] for address in sorted(addresses) if 0 < address < len(story)]
+
+
+def make_trace(calls: int, local_counts: List[int], seed: int) -> List[Tuple[str, int]]:
+    """A random walk of calls and returns; each call stores to locals and pushes to the stack."""
+    rnd = random.Random(seed)
+    ret: List[Tuple[str, int]] = []
+    depth = 0
+    made = 0
+    while made < calls:
+        if depth == 0 or (depth < 24 and rnd.random() < 0.52):
+            ret.append(("call", rnd.choice(local_counts)))
+            made += 1
+            depth += 1
+            for _ in range(rnd.randint(0, 3)):
+                ret.append(("push", 0))
+            for _ in range(rnd.randint(1, 6)):
+                ret.append(("local", rnd.randint(1, 15)))
+        else:
+            ret.append(("return", 0))
+            depth -= 1
+    return ret
+
+
+class MapFrames:
+    """The original frame; a map holding the stack and locals lists."""
+
+    def __init__(self) -> None:
+        self.call_stack: List[Dict[str, Any]] = []
+
+    @staticmethod
+    def new_frame(local_count: int) -> Tuple[Any, int]:
+        """A new frame, and the number of objects it allocates."""
+        return {"stack": [], "pc": 0, "locals": [0] * local_count, "returnsRef": 0}, 3
+
+    def call(self, local_count: int) -> None:
+        self.call_stack.append(self.new_frame(local_count)[0])
+
+    def ret(self) -> None:
+        self.call_stack.pop()
+
+    def push(self, value: int) -> None:
+        self.call_stack[-1]["stack"].append(value)
+
+    def local(self, ref: int) -> None:
+        call_locals = self.call_stack[-1]["locals"]
+        if ref <= len(call_locals):
+            call_locals[ref - 1] = call_locals[ref - 1] + 1
+
+
+class ListFrames:
+    """The fixed slot frame, `[pc, stack, returnsRef, local 1, local 2, ...]`."""
+
+    def __init__(self) -> None:
+        self.call_stack: List[List[Any]] = []
+
+    @staticmethod
+    def new_frame(local_count: int) -> Tuple[Any, int]:
+        return [0, [], 0] + [0] * local_count, 2
+
+    def call(self, local_count: int) -> None:
+        self.call_stack.append(self.new_frame(local_count)[0])
+
+    def ret(self) -> None:
+        self.call_stack.pop()
+
+    def push(self, value: int) -> None:
+        self.call_stack[-1][1].append(value)
+
+    def local(self, ref: int) -> None:
+        frame = self.call_stack[-1]
+        if ref + 3 <= len(frame):
+            frame[ref + 2] = frame[ref + 2] + 1
+
+
+class SharedFrames:
+    """One value stack for the locals and stack values of every frame.
+
+    Each call adds 4 words to the frame stack: pc, returnsRef, the previous
+    locals base, and the previous local count.
+    """
+
+    def __init__(self) -> None:
+        self.values: List[int] = []
+        self.frames: List[int] = []
+        self.base = 0
+        self.count = 0
+
+    @staticmethod
+    def new_frame(local_count: int) -> Tuple[Any, int]:
+        # Nothing new; just list slots, once the lists have grown.
+        return [0] * (4 + local_count), 0
+
+    def call(self, local_count: int) -> None:
+        self.frames.extend((0, 0, self.base, self.count))
+        self.base = len(self.values)
+        self.count = local_count
+        self.values.extend([0] * local_count)
+
+    def ret(self) -> None:
+        del self.values[self.base:]
+        self.count = self.frames.pop()
+        self.base = self.frames.pop()
+        del self.frames[-2:]
+
+    def push(self, value: int) -> None:
+        self.values.append(value)
+
+    def local(self, ref: int) -> None:
+        if ref <= self.count:
+            self.values[self.base + ref - 1] += 1
+
+
+LAYOUTS: Dict[str, Any] = {
+    "map": MapFrames, "list": ListFrames, "shared": SharedFrames,
+}
+
+
+def deep_size(value: Any) -> int:
+    """The bytes held by the value and the lists and maps inside it."""
+    ret = sys.getsizeof(value)
+    if isinstance(value, dict):
+        ret += sum(deep_size(item) for item in value.values() if isinstance(item, (list, dict)))
+    elif isinstance(value, list):
+        ret += sum(deep_size(item) for item in value if isinstance(item, (list, dict)))
+    return ret
+
+
+def step(layout: Any, action: str, arg: int) -> None:
+    if action == "call":
+        layout.call(arg)
+    elif action == "return":
+        layout.ret()
+    elif action == "push":
+        layout.push(arg)
+    else:
+        layout.local(arg)
+
+
+def measure_layout(name: str, trace: List[Tuple[str, int]]) -> str:
+    kind = LAYOUTS[name]
+    calls = 0
+    objects = 0
+    size = 0
+    for action, arg in trace:
+        if action == "call":
+            frame, count = kind.new_frame(arg)
+            calls += 1
+            objects += count
+            # The shared layout's slots are in lists that only grow now and then.
+            size += deep_size(frame) if count > 0 else 8 * len(frame)
+
+    layout = kind()
+    tracemalloc.start()
+    for action, arg in trace:
+        step(layout, action, arg)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    layout = kind()
+    start = time.perf_counter()
+    for action, arg in trace:
+        step(layout, action, arg)
+    elapsed = time.perf_counter() - start
+    return (
+        f"{name:<8} {objects / calls:4.1f} objects  {size / calls:6.1f} bytes per call"
+        f"  {peak / 1024:7.1f} KiB peak  {1000000.0 * elapsed / len(trace):6.3f} us per step"
+    )
+
+
+def measure_globals(reads: int, seed: int) -> List[str]:
+    rnd = random.Random(seed)
+    story = bytes(rnd.randrange(256) for _ in range(1024))
+    table = 0x40
+    dynamic: Dict[int, int] = {table + rnd.randrange(480): rnd.randrange(256) for _ in range(120)}
+    registers = []
+    for variable in range(16, 256):
+        address = table + (variable - 16) * 2
+        registers.append(
+            dynamic.get(address, story[address]) * 256 + dynamic.get(address + 1, story[address + 1])
+        )
+    variables = [rnd.randrange(16, 256) for _ in range(reads)]
+
+    def from_memory(variable: int) -> int:
+        address = table + ((variable - 16) * 2)
+        hi = story[address]
+        if address in dynamic:
+            hi = dynamic[address]
+        address = address + 1
+        lo = story[address]
+        if address in dynamic:
+            lo = dynamic[address]
+        return (hi * 256) + lo
+
+    def from_registers(variable: int) -> int:
+        return registers[variable - 16]
+
+    ret = []
+    results = []
+    for name, read in (("memory", from_memory), ("globals", from_registers)):
+        start = time.perf_counter()
+        values = [read(variable) for variable in variables]
+        elapsed = time.perf_counter() - start
+        results.append(values)
+        ret.append(f"global read from {name:<8} {1000000000.0 * elapsed / reads:7.1f} ns")
+    if results[0] != results[1]:
+        raise ValueError("the globals list disagrees with memory")
+    return ret
+
+
+def usage() -> None:
+    sys.stderr.write(
+        f"Usage: {sys.argv[0]} [--calls (count)] [--seed (n)] [(story file) (story dump file)]\n"
+    )
+    sys.exit(1)
+
+
+def main(args: List[str]) -> None:
+    calls = 50000
+    seed = 1
+    files: List[str] = []
+    while args:
+        arg = args.pop(0)
+        if arg in ("--calls", "--seed") and args:
+            value = int(args.pop(0))
+            if arg == "--calls":
+                calls = value
+            else:
+                seed = value
+        elif arg.startswith("-"):
+            usage()
+        else:
+            files.append(arg)
+    if len(files) not in (0, 2):
+        usage()
+    if files:
+        local_counts = story_local_counts(files[0], files[1])
+        source = f"{len(local_counts)} routines in {files[0]}"
+    else:
+        rnd = random.Random(seed)
+        local_counts = [rnd.randint(0, 15) for _ in range(200)]
+        source = "random routines"
+    trace = make_trace(calls, local_counts, seed)
+    print(
+        f"{calls} calls, {len(trace)} steps, mean {sum(local_counts) / len(local_counts):.1f}"
+        f" locals per routine ({source})"
+    )
+    for name in LAYOUTS:
+        print(measure_layout(name, trace))
+    print("\n".join(measure_globals(200000, seed)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -4,6 +4,7 @@ import_code("../src/logging.gs")
 import_code("../src/loadstory.gs")
 import_code("../src/zscii_unicode.gs")
 import_code("../src/opcodes_list.gs")
+import_code("../src/cache.gs")
 import_code("../src/machine.gs")
 import_code("../src/screen.gs")
 import_code("../src/opcodes_v3.gs")
@@ -11,6 +12,7 @@ import_code("../src/opcodes_v4.gs")
 import_code("../src/opcodes_v5.gs")
 import_code("../src/opcodes_v7.gs")
 import_code("../src/interpreter.gs")
+import_code("../src/streams.gs")
 import_code("../src/native.gs")
 import_code("../src/gamedata.gs")
 
@@ -20,5 +22,6 @@ native = Native.New(80, 20)
 interpreter = Interpreter.New(MINIZORK, native)
 completed = false
 while not completed
-    completed = interpreter.Run()
+    completed = interpreter.RunBatch()
 end while
+native.FlushStreams()
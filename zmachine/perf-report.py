@@ -0,0 +1,138 @@
+#!/usr/bin/python3
+
+"""Summarize the interpreter's performance counter dumps.
+
+The interpreter writes the dump to `~/zmachine-perf.txt` when the player
+enters `$12` at the input prompt, and `bench.gs` writes `~/zmachine-bench.txt`.
+Copy the file out of the game, then run:
+
+    perf-report.py (dump file) [(other dump file)]
+
+With two files, such as a `src` and a `release` bench run, it also compares
+the time per instruction.  Use `--csv` to print the per-turn rows as CSV.
+"""
+
+from typing import Dict, List, Sequence
+import sys
+
+
+class PerfDump:
+    """The parsed counter dump."""
+
+    def __init__(self, name: str, text: str) -> None:
+        self.name = name
+        self.totals: Dict[str, float] = {}
+        # Calls per routine address, when recorded with profiling on.
+        self.routines: Dict[int, int] = {}
+        self.columns: List[str] = []
+        self.turns: List[Dict[str, float]] = []
+        for line in text.splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if "=" in line:
+                key, value = line.split("=", 1)
+                if key == "columns":
+                    self.columns = value.split(",")
+                elif key == "stringTrace":
+                    # The string lookups, for cache-sim.py.
+                    continue
+                elif key.startswith("routine@"):
+                    self.routines[int(key[8:])] = int(value)
+                else:
+                    self.totals[key] = float(value)
+            elif self.columns:
+                values = [float(value) for value in line.split(",")]
+                self.turns.append(dict(zip(self.columns, values)))
+
+    def total(self, key: str) -> float:
+        return self.totals.get(key, 0.0)
+
+    def us_per_instruction(self) -> float:
+        return 1000000.0 * self.total("runTime") / max(1.0, self.total("instructions"))
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def report(dump: PerfDump) -> List[str]:
+    instructions = dump.total("instructions")
+    run_time = dump.total("runTime")
+    ret = [
+        f"== {dump.name}",
+        f"instructions:       {instructions:.0f}"
+        f"  ({instructions / max(run_time, 1e-9):.0f} per second,"
+        f" {dump.us_per_instruction():.2f} us each)",
+        f"run time:           {run_time:.3f} s  (input wait {dump.total('inputTime'):.3f} s)",
+        f"turns:              {dump.total('turns'):.0f}",
+        f"compiled:           {dump.total('compiledInstructions'):.0f} instructions"
+        f"  ({100.0 * dump.total('compiledInstructions') / max(instructions, 1.0):.1f}%)",
+        f"routine calls:      {dump.total('routineCalls'):.0f}",
+        f"string decodes:     {dump.total('stringDecodes'):.0f}"
+        f"  ({dump.total('stringCacheHits'):.0f} cache hits)",
+    ]
+    decode = dump.total("decodeTime")
+    execute = dump.total("executeTime")
+    if decode + execute > 0:
+        ret.append(
+            f"decode / execute:   {decode:.3f} / {execute:.3f} s"
+            f"  ({100.0 * decode / (decode + execute):.1f}% decoding)"
+        )
+    if dump.routines:
+        busy = sorted(dump.routines.items(), key=lambda item: item[1], reverse=True)
+        ret.append(
+            "most called:        "
+            + ", ".join(f"@{address} ({calls})" for address, calls in busy[:5])
+        )
+    if dump.turns:
+        ret.append("per turn:           mean     p50     p95     max")
+        for column in ("instructions", "routineCalls", "stringDecodes", "runTime"):
+            values = [turn.get(column, 0.0) for turn in dump.turns]
+            ret.append(
+                f"  {column:<16} {sum(values) / len(values):7.1f} {percentile(values, 0.5):7.1f}"
+                f" {percentile(values, 0.95):7.1f} {max(values):7.1f}"
+            )
+        heavy = sorted(dump.turns, key=lambda turn: turn.get("instructions", 0.0), reverse=True)
+        ret.append(
+            "heaviest turns:     "
+            + ", ".join(
+                f"#{turn.get('turn', 0):.0f} ({turn.get('instructions', 0):.0f})"
+                for turn in heavy[:5]
+            )
+        )
+    return ret
+
+
+def main(args: List[str]) -> None:
+    as_csv = "--csv" in args
+    names = [arg for arg in args if arg != "--csv"]
+    dumps = []
+    for name in names:
+        with open(name, "r", encoding="utf-8") as fis:
+            dumps.append(PerfDump(name, fis.read()))
+    if as_csv:
+        for dump in dumps:
+            print(",".join(["file"] + dump.columns))
+            for turn in dump.turns:
+                print(",".join([dump.name] + [f"{turn.get(col, 0):g}" for col in dump.columns]))
+        return
+    for dump in dumps:
+        print("\n".join(report(dump)))
+    if len(dumps) == 2:
+        before, after = dumps
+        saved = before.us_per_instruction() - after.us_per_instruction()
+        print(
+            f"== {after.name} vs {before.name}: {saved:+.2f} us per instruction saved"
+            f" ({100.0 * saved / max(before.us_per_instruction(), 1e-9):.1f}%)"
+        )
+
+
+if __name__ == "__main__":
+    if "-h" in sys.argv or "--help" in sys.argv or len([a for a in sys.argv[1:] if a != "--csv"]) not in (1, 2):
+        sys.stderr.write(f"Usage: {sys.argv[0]} [--csv] (dump file) [(other dump file)]\n")
+        sys.exit(1)
+    main(sys.argv[1:])
@@ -0,0 +1,158 @@
+#!/usr/bin/python3
+
+"""Create a release build of the interpreter sources, with the low level logging removed.
+
+The interpreter checks the logger's level before building each log message
+(`if self.log.IsTrace then self.log.Trace(...)`), but the check itself still
+runs on every instruction.  This copies the `src` directory into the output
+directory, removing:
+
+    * the log calls below the minimum level, guarded or not, including
+      `LogWith(Logger.(LEVEL), ...)` calls;
+    * the `if MACHINE_LOG ...` machine progress log lines and blocks;
+    * the bare `MachineLog` / `MachineLogln` calls.
+
+Build the release with `zmachine-release.bundle.json`, or compile
+`release/main.gs` directly.  The `bench.gs` program in the output directory
+times the instructions, to compare against the `src` build.
+"""
+
+from typing import Dict, List, Tuple
+import os
+import re
+import sys
+
+
+LEVELS = ("trace", "debug", "verbose", "info", "warn", "error")
+LEVEL_METHODS = {
+    "trace": "Trace", "debug": "Debug", "verbose": "Verbose",
+    "info": "Info", "warn": "Warn", "error": "Error",
+}
+# The Logger level constants, by level.
+LEVEL_CONSTANTS = {
+    "trace": "TRACE", "debug": "DEBUG", "verbose": "VERBOSE",
+    "info": "INFO", "warn": "WARNING", "error": "ERROR",
+}
+# The Logger Is* flags, by level.
+LEVEL_FLAGS = {
+    "trace": "IsTrace", "debug": "IsDebug", "verbose": "IsVerbose", "info": "IsInfo",
+}
+LOGGER = r"(?:self\.log|ret\.log|machine\.log|OpCodeLogger)"
+BLOCK_IF = re.compile(r"^\s*if\s.*\sthen\s*(?://.*)?$")
+END_IF = re.compile(r"^\s*end if\b")
+ELSE = re.compile(r"^\s*else\b")
+FUNCTION = re.compile(r"^(\S+)\s*=\s*function\b")
+
+
+def strip_patterns(min_level: str) -> Tuple[re.Pattern[str], re.Pattern[str]]:
+    """Patterns for the lines to drop, and for the guarded blocks to drop."""
+    dropped = LEVELS[:LEVELS.index(min_level)]
+    methods = "|".join(LEVEL_METHODS[level] for level in dropped)
+    flags = "|".join(LEVEL_FLAGS[level] for level in dropped if level in LEVEL_FLAGS)
+    guards = ["MACHINE_LOG"]
+    if flags:
+        guards.append(rf"{LOGGER}\.(?:{flags})")
+    guard = "|".join(guards)
+    lines: List[str] = [
+        # A guarded single line statement; the guard may be and-ed with a condition.
+        rf"^\s*if\s(?:.*\sand\s)?(?:{guard})(?:\sand\s.*)?\sthen\s+\S.*$",
+        r"^\s*MachineLog(?:ln)?\(.*\)\s*$",
+    ]
+    if methods:
+        lines.append(rf"^\s*{LOGGER}\.(?:{methods})\(.*\)\s*$")
+        constants = "|".join(LEVEL_CONSTANTS[level] for level in dropped)
+        lines.append(rf"^\s*{LOGGER}\.LogWith\(Logger\.(?:{constants}),.*\)\s*$")
+    return (
+        re.compile("|".join(lines)),
+        re.compile(rf"^\s*if\s(?:{guard})\sthen\s*$"),
+    )
+
+
+def strip_source(
+    name: str, text: str, min_level: str
+) -> Tuple[str, Dict[str, int]]:
+    """Strip the logging from the source text.
+
+    Returns the stripped text and the number of removed lines per function.
+    """
+    drop_line, drop_block = strip_patterns(min_level)
+    ret: List[str] = []
+    removed: Dict[str, int] = {}
+    function = "(top)"
+    lines = text.split("\n")
+    idx = 0
+    while idx < len(lines):
+        line = lines[idx]
+        match = FUNCTION.match(line)
+        if match:
+            function = match.group(1)
+        if drop_block.match(line):
+            # Skip to the matching "end if".
+            depth = 1
+            start = idx
+            while depth > 0:
+                idx += 1
+                if idx >= len(lines):
+                    raise ValueError(f"{name}:{start + 1}: unterminated log block")
+                if BLOCK_IF.match(lines[idx]):
+                    depth += 1
+                elif END_IF.match(lines[idx]):
+                    depth -= 1
+                elif depth == 1 and ELSE.match(lines[idx]):
+                    raise ValueError(f"{name}:{idx + 1}: log block has an else branch")
+            removed[function] = removed.get(function, 0) + idx - start + 1
+            idx += 1
+            continue
+        if drop_line.match(line) and not line.lstrip().startswith("//"):
+            if " else " in line:
+                raise ValueError(f"{name}:{idx + 1}: log line has an else branch")
+            removed[function] = removed.get(function, 0) + 1
+            idx += 1
+            continue
+        ret.append(line)
+        idx += 1
+    return "\n".join(ret), removed
+
+
+def main(src_dir: str, out_dir: str, min_level: str) -> None:
+    os.makedirs(out_dir, exist_ok=True)
+    total = 0
+    for name in sorted(os.listdir(src_dir)):
+        if not name.endswith(".gs"):
+            continue
+        with open(os.path.join(src_dir, name), "r", encoding="utf-8", newline="") as fis:
+            text = fis.read()
+        stripped, removed = strip_source(name, text, min_level)
+        with open(os.path.join(out_dir, name), "w", encoding="utf-8", newline="") as fos:
+            fos.write(stripped)
+        count = sum(removed.values())
+        total += count
+        if count > 0:
+            print(f"{name}: removed {count} lines, {len(text) - len(stripped)} characters")
+            for function, lines in sorted(removed.items()):
+                print(f"    {function:<40} {lines:4d}")
+    print(f"Removed {total} logging lines below the {min_level} level into {out_dir}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    level = "info"
+    if args and args[0].startswith("--min-level="):
+        level = args.pop(0)[12:]
+    if "-h" in args or "--help" in args or len(args) > 1 or level not in LEVELS:
+        sys.stderr.write(
+            f"Usage: {sys.argv[0]} [--min-level=(level)] [output dir]\n"
+            f"  Levels are {', '.join(LEVELS)}; the default is 'info', which keeps the info,\n"
+            "  warn, and error logging.  The output dir defaults to 'release'.\n"
+        )
+        sys.exit(1)
+    here = os.path.dirname(os.path.abspath(__file__))
+    try:
+        main(
+            os.path.join(here, "src"),
+            os.path.abspath(args[0]) if args else os.path.join(here, "release"),
+            level,
+        )
+    except ValueError as err:
+        sys.stderr.write(f"Failure: {err}\n")
+        sys.exit(1)
@@ -0,0 +1,3857 @@
+// Compiled routines for story release 34, serial 871124.
+// Generated by aot-compile.py from minizork.z3; do not edit.
+
+if not globals.hasIndex("AotStories") then globals.AotStories = {}
+
+// Routine @14964, 7 locals, 37 blocks, 50 instructions.
+Aot871124_3a74 = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 14979 then
+      count = count + 4
+      frame[7] = gvars[75]
+      frame[8] = gvars[59]
+      frame[9] = gvars[126]
+      a = 48
+      pc = 14994
+      if not (a == frame[5] or a == frame[4]) then pc = 15007
+    end if
+    if pc == 14994 then
+      count = count + 1
+      frame[0] = 15000
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 15672}, {"t": "v", "s": 2, "v": 138, "c": gvars[122]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 15000 then
+      count = count + 1
+      pc = 15003
+      if not (machine.GetVariableRef(0) == 0) then pc = 15007
+    end if
+    if pc == 15003 then
+      count = count + 1
+      frame[0] = 15005
+      Opcodes.print_paddr_v1(machine, [{"t": "v", "s": 2, "v": 50, "c": gvars[34]}], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 15005 then
+      count = count + 1
+      machine.PopStackFrame(2)
+      return count
+    end if
+    if pc == 15007 then
+      count = count + 1
+      a = frame[4]
+      pc = 15011
+      if not (a == 48) then pc = 15014
+    end if
+    if pc == 15011 then
+      count = count + 1
+      frame[4] = gvars[122]
+      pc = 15014
+    end if
+    if pc == 15014 then
+      count = count + 1
+      a = frame[5]
+      pc = 15018
+      if not (a == 48) then pc = 15021
+    end if
+    if pc == 15018 then
+      count = count + 1
+      frame[5] = gvars[122]
+      pc = 15021
+    end if
+    if pc == 15021 then
+      count = count + 3
+      machine.setGlobalVariable(91, frame[3])
+      machine.setGlobalVariable(75, frame[4])
+      pc = 15030
+      if gvars[59] == 0 then pc = 15041
+    end if
+    if pc == 15030 then
+      count = count + 1
+      a = gvars[126]
+      pc = 15034
+      if a == 48 then pc = 15041
+    end if
+    if pc == 15034 then
+      count = count + 1
+      a = gvars[75]
+      pc = 15038
+      if a == 102 then pc = 15041
+    end if
+    if pc == 15038 then
+      count = count + 1
+      machine.setGlobalVariable(138, gvars[59])
+      pc = 15041
+    end if
+    if pc == 15041 then
+      count = count + 2
+      machine.setGlobalVariable(142, frame[5])
+      a = 130
+      pc = 15050
+      if not (a == gvars[59] or a == gvars[126]) then pc = 15059
+    end if
+    if pc == 15050 then
+      count = count + 1
+      frame[0] = 15055
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 15082}], 4, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 15055 then
+      count = count + 1
+      pc = 15059
+      if not (frame[6] == 0) then pc = 15147
+    end if
+    if pc == 15059 then
+      count = count + 3
+      frame[4] = gvars[59]
+      frame[5] = gvars[126]
+      frame[0] = 15069
+      Opcodes.get_prop_v1(machine, [{"t": "v", "s": 2, "v": 131, "c": gvars[115]}, {"t": "c", "s": 1, "c": 18}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 15069 then
+      count = count + 1
+      frame[0] = 15073
+      Opcodes.call_v1(machine, [{"t": "v", "s": 2, "v": 0, "c": machine.GetVariableRef(0)}], 4, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 15073 then
+      count = count + 1
+      pc = 15077
+      if not (frame[6] == 0) then pc = 15147
+    end if
+    if pc == 15077 then
+      count = count + 1
+      frame[0] = 15080
+      Opcodes.get_parent_v1(machine, [{"t": "v", "s": 2, "v": 131, "c": gvars[115]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 15080 then
+      count = count + 1
+      frame[0] = 15084
+      Opcodes.get_prop_v1(machine, [{"t": "v", "s": 2, "v": 0, "c": machine.GetVariableRef(0)}, {"t": "c", "s": 1, "c": 18}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 15084 then
+      count = count + 1
+      frame[0] = 15089
+      Opcodes.call_v1(machine, [{"t": "v", "s": 2, "v": 0, "c": machine.GetVariableRef(0)}, {"t": "c", "s": 1, "c": 1}], 4, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 15089 then
+      count = count + 1
+      pc = 15093
+      if not (frame[6] == 0) then pc = 15147
+    end if
+    if pc == 15093 then
+      count = count + 2
+      stack.push(machine.ReadWord(gvars[135] + (2 * frame[3])))
+      frame[0] = 15101
+      Opcodes.call_v1(machine, [{"t": "v", "s": 2, "v": 0, "c": machine.GetVariableRef(0)}], 4, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 15101 then
+      count = count + 1
+      pc = 15104
+      if not (frame[6] == 0) then pc = 15147
+    end if
+    if pc == 15104 then
+      count = count + 1
+      pc = 15107
+      if frame[5] == 0 then pc = 15118
+    end if
+    if pc == 15107 then
+      count = count + 1
+      frame[0] = 15111
+      Opcodes.get_prop_v1(machine, [{"t": "v", "s": 2, "v": 3, "c": frame[5]}, {"t": "c", "s": 1, "c": 18}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 15111 then
+      count = count + 1
+      frame[0] = 15115
+      Opcodes.call_v1(machine, [{"t": "v", "s": 2, "v": 0, "c": machine.GetVariableRef(0)}], 4, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 15115 then
+      count = count + 1
+      pc = 15118
+      if not (frame[6] == 0) then pc = 15147
+    end if
+    if pc == 15118 then
+      count = count + 1
+      pc = 15121
+      if frame[4] == 0 then pc = 15136
+    end if
+    if pc == 15121 then
+      count = count + 1
+      a = frame[3]
+      pc = 15125
+      if a == 102 then pc = 15136
+    end if
+    if pc == 15125 then
+      count = count + 1
+      frame[0] = 15129
+      Opcodes.get_prop_v1(machine, [{"t": "v", "s": 2, "v": 2, "c": frame[4]}, {"t": "c", "s": 1, "c": 18}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 15129 then
+      count = count + 1
+      frame[0] = 15133
+      Opcodes.call_v1(machine, [{"t": "v", "s": 2, "v": 0, "c": machine.GetVariableRef(0)}], 4, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 15133 then
+      count = count + 1
+      pc = 15136
+      if not (frame[6] == 0) then pc = 15147
+    end if
+    if pc == 15136 then
+      count = count + 2
+      stack.push(machine.ReadWord(gvars[134] + (2 * frame[3])))
+      frame[0] = 15144
+      Opcodes.call_v1(machine, [{"t": "v", "s": 2, "v": 0, "c": machine.GetVariableRef(0)}], 4, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 15144 then
+      count = count + 1
+      pc = 15147
+      if frame[6] == 0 then pc = 15147
+    end if
+    if pc == 15147 then
+      count = count + 4
+      machine.setGlobalVariable(91, frame[7])
+      machine.setGlobalVariable(75, frame[8])
+      machine.setGlobalVariable(142, frame[9])
+      machine.PopStackFrame(frame[6])
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @15158, 3 locals, 2 blocks, 3 instructions.
+Aot871124_3b36 = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 15165 then
+      count = count + 1
+      frame[0] = 15171
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 7589}, {"t": "v", "s": 2, "v": 1, "c": frame[3]}], 3, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 15171 then
+      count = count + 2
+      machine.SetWord(frame[5] + 2, frame[4])
+      machine.PopStackFrame(frame[5])
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @16838, 6 locals, 3 blocks, 17 instructions.
+Aot871124_41c6 = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 16851 then
+      count = count + 4
+      stack.push(machine.ReadByte(frame[3]))
+      machine.SetByte(frame[4], machine.GetVariableRef(0))
+      stack.push(machine.ReadByte(frame[3] + 1))
+      machine.SetByte(frame[4] + 1, machine.GetVariableRef(0))
+      pc = 16869
+    end if
+    if pc == 16869 then
+      count = count + 12
+      stack.push(machine.ReadWord(frame[3] + (2 * frame[6])))
+      machine.SetWord(frame[4] + (2 * frame[6]), machine.GetVariableRef(0))
+      a = frame[6]
+      if a >= 32768 then a = a - 65536
+      b = 2
+      r = a * b
+      if r < 0 then r = 65536 + r else r = r % 65536
+      stack.push(r)
+      frame[8] = (machine.GetVariableRef(0) + 2) % 65536
+      stack.push(machine.ReadByte(frame[3] + frame[8]))
+      machine.SetByte(frame[4] + frame[8], machine.GetVariableRef(0))
+      a = frame[6]
+      if a >= 32768 then a = a - 65536
+      b = 2
+      r = a * b
+      if r < 0 then r = 65536 + r else r = r % 65536
+      stack.push(r)
+      frame[8] = (machine.GetVariableRef(0) + 3) % 65536
+      stack.push(machine.ReadByte(frame[3] + frame[8]))
+      machine.SetByte(frame[4] + frame[8], machine.GetVariableRef(0))
+      frame[6] = (frame[6] + 2) % 65536
+      a = (frame[7] + 1) % 65536
+      frame[7] = a
+      if a >= 32768 then a = a - 65536
+      b = frame[5]
+      if b >= 32768 then b = b - 65536
+      pc = 16921
+      if not (a > b) then pc = 16869
+    end if
+    if pc == 16921 then
+      count = count + 1
+      machine.PopStackFrame(1)
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @16922, 3 locals, 3 blocks, 6 instructions.
+Aot871124_421a = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 16929 then
+      count = count + 2
+      stack.push(machine.ReadByte(frame[3]))
+      frame[5] = (machine.GetVariableRef(0) - 1 + 65536) % 65536
+      pc = 16937
+    end if
+    if pc == 16937 then
+      count = count + 3
+      stack.push(machine.ReadByte(frame[3] + frame[5]))
+      machine.SetByte(frame[4] + frame[5], machine.GetVariableRef(0))
+      a = (frame[5] + 65535) % 65536
+      frame[5] = a
+      if a >= 32768 then a = a - 65536
+      b = 0
+      pc = 16951
+      if not (a < b) then pc = 16937
+    end if
+    if pc == 16951 then
+      count = count + 1
+      machine.PopStackFrame(1)
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @17048, 5 locals, 5 blocks, 8 instructions.
+Aot871124_4298 = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 17059 then
+      count = count + 2
+      frame[7] = machine.ReadByte(frame[3] + 4)
+      b = frame[4]
+      if not (bitAnd(frame[7], b) == b) then
+        machine.PopStackFrame(0)
+        return count
+      end if
+      pc = 17067
+    end if
+    if pc == 17067 then
+      count = count + 1
+      a = frame[5]
+      if a >= 32768 then a = a - 65536
+      b = 4
+      if a > b then
+        machine.PopStackFrame(1)
+        return count
+      end if
+      pc = 17071
+    end if
+    if pc == 17071 then
+      count = count + 2
+      frame[7] = bitAnd(frame[7], 3)
+      a = frame[7]
+      pc = 17079
+      if a == frame[5] then pc = 17081
+    end if
+    if pc == 17079 then
+      count = count + 1
+      frame[6] = (frame[6] + 1) % 65536
+      pc = 17081
+    end if
+    if pc == 17081 then
+      count = count + 2
+      stack.push(machine.ReadByte(frame[3] + frame[6]))
+      machine.PopStackFrame(machine.GetVariableRef(0))
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @17560, 7 locals, 16 blocks, 31 instructions.
+Aot871124_4498 = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 17575 then
+      count = count + 6
+      a = frame[3]
+      if a >= 32768 then a = a - 65536
+      b = 2
+      r = a * b
+      if r < 0 then r = 65536 + r else r = r % 65536
+      stack.push(r)
+      stack.push((gvars[55] + machine.GetVariableRef(0)) % 65536)
+      frame[4] = machine.ReadByte(machine.GetVariableRef(0) + 2)
+      a = frame[3]
+      if a >= 32768 then a = a - 65536
+      b = 2
+      r = a * b
+      if r < 0 then r = 65536 + r else r = r % 65536
+      stack.push(r)
+      stack.push((gvars[55] + machine.GetVariableRef(0)) % 65536)
+      frame[5] = machine.ReadByte(machine.GetVariableRef(0) + 3)
+      pc = 17599
+    end if
+    if pc == 17599 then
+      count = count + 1
+      a = (frame[4] + 65535) % 65536
+      frame[4] = a
+      if a >= 32768 then a = a - 65536
+      b = 0
+      pc = 17603
+      if a < b then pc = 17651
+    end if
+    if pc == 17603 then
+      count = count + 2
+      frame[6] = machine.ReadByte(gvars[87] + frame[5])
+      a = frame[6]
+      pc = 17611
+      if not (a == 58) then pc = 17620
+    end if
+    if pc == 17611 then
+      count = count + 3
+      frame[8] = frame[7]
+      frame[7] = 0
+      pc = 17646
+    end if
+    if pc == 17620 then
+      count = count + 1
+      a = frame[7]
+      if a >= 32768 then a = a - 65536
+      b = 10000
+      if a > b then
+        machine.PopStackFrame(0)
+        return count
+      end if
+      pc = 17626
+    end if
+    if pc == 17626 then
+      count = count + 1
+      a = frame[6]
+      if a >= 32768 then a = a - 65536
+      b = 58
+      if not (a < b) then
+        machine.PopStackFrame(0)
+        return count
+      end if
+      pc = 17630
+    end if
+    if pc == 17630 then
+      count = count + 1
+      a = frame[6]
+      if a >= 32768 then a = a - 65536
+      b = 47
+      if not (a > b) then
+        machine.PopStackFrame(0)
+        return count
+      end if
+      pc = 17634
+    end if
+    if pc == 17634 then
+      count = count + 3
+      a = frame[7]
+      if a >= 32768 then a = a - 65536
+      b = 10
+      r = a * b
+      if r < 0 then r = 65536 + r else r = r % 65536
+      frame[9] = r
+      stack.push((frame[6] - 48 + 65536) % 65536)
+      frame[7] = (frame[9] + machine.GetVariableRef(0)) % 65536
+      pc = 17646
+    end if
+    if pc == 17646 then
+      count = count + 2
+      frame[5] = (frame[5] + 1) % 65536
+      pc = 17599
+    end if
+    if pc == 17651 then
+      count = count + 2
+      machine.SetWord(gvars[55] + (2 * frame[3]), 11954)
+      a = frame[7]
+      if a >= 32768 then a = a - 65536
+      b = 1000
+      if a > b then
+        machine.PopStackFrame(0)
+        return count
+      end if
+      pc = 17663
+    end if
+    if pc == 17663 then
+      count = count + 1
+      pc = 17666
+      if frame[8] == 0 then pc = 17689
+    end if
+    if pc == 17666 then
+      count = count + 1
+      a = frame[8]
+      if a >= 32768 then a = a - 65536
+      b = 8
+      pc = 17670
+      if not (a < b) then pc = 17677
+    end if
+    if pc == 17670 then
+      count = count + 2
+      frame[8] = (frame[8] + 12) % 65536
+      pc = 17681
+    end if
+    if pc == 17677 then
+      count = count + 1
+      a = frame[8]
+      if a >= 32768 then a = a - 65536
+      b = 23
+      if a > b then
+        machine.PopStackFrame(0)
+        return count
+      end if
+      pc = 17681
+    end if
+    if pc == 17681 then
+      count = count + 2
+      a = frame[8]
+      if a >= 32768 then a = a - 65536
+      b = 60
+      r = a * b
+      if r < 0 then r = 65536 + r else r = r % 65536
+      stack.push(r)
+      frame[7] = (frame[7] + machine.GetVariableRef(0)) % 65536
+      pc = 17689
+    end if
+    if pc == 17689 then
+      count = count + 2
+      machine.setGlobalVariable(128, frame[7])
+      machine.PopStackFrame(11954)
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @18190, 1 locals, 4 blocks, 14 instructions.
+Aot871124_470e = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 18193 then
+      count = count + 9
+      stack.push(machine.ReadWord(gvars[20]))
+      machine.SetWord(gvars[100], machine.GetVariableRef(0))
+      machine.SetWord(gvars[54], gvars[10])
+      stack.push((gvars[10] + 1) % 65536)
+      machine.SetWord(gvars[54] + 2, machine.GetVariableRef(0))
+      machine.SetWord(gvars[54] + 4, gvars[10])
+      stack.push((gvars[10] + 1) % 65536)
+      machine.SetWord(gvars[54] + 6, machine.GetVariableRef(0))
+      frame[0] = 18238
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 9717}, {"t": "v", "s": 2, "v": 36, "c": gvars[20]}, {"t": "v", "s": 2, "v": 36, "c": gvars[20]}, {"t": "v", "s": 2, "v": 1, "c": frame[3]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 18238 then
+      count = count + 2
+      stack.push(machine.ReadWord(gvars[20] + 16))
+      pc = 18245
+      if machine.GetVariableRef(0) == 0 then pc = 18248
+    end if
+    if pc == 18245 then
+      count = count + 1
+      machine.setGlobalVariable(148, 2)
+      pc = 18248
+    end if
+    if pc == 18248 then
+      count = count + 2
+      machine.setGlobalVariable(26, 0)
+      machine.PopStackFrame(1)
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @18298, 2 locals, 3 blocks, 5 instructions.
+Aot871124_477a = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 18303 then
+      count = count + 1
+      a = (frame[3] + 65535) % 65536
+      frame[3] = a
+      if a >= 32768 then a = a - 65536
+      b = 0
+      if a < b then
+        machine.PopStackFrame(1)
+        return count
+      end if
+      pc = 18307
+    end if
+    if pc == 18307 then
+      count = count + 2
+      stack.push(machine.ReadByte(gvars[87] + frame[4]))
+      frame[0] = 18314
+      Opcodes.print_char_v1(machine, [{"t": "v", "s": 2, "v": 0, "c": machine.GetVariableRef(0)}], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 18314 then
+      count = count + 2
+      frame[4] = (frame[4] + 1) % 65536
+      pc = 18303
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @18320, 3 locals, 8 blocks, 16 instructions.
+Aot871124_4790 = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 18327 then
+      count = count + 2
+      machine.SetWord(gvars[26], frame[3])
+      a = gvars[75]
+      pc = 18336
+      if not (a == 85) then pc = 18339
+    end if
+    if pc == 18336 then
+      count = count + 1
+      frame[0] = 18338
+      Opcodes.print_paddr_v1(machine, [{"t": "v", "s": 2, "v": 135, "c": gvars[119]}], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 18338 then
+      count = count + 1
+      machine.PopStackFrame(0)
+      return count
+    end if
+    if pc == 18339 then
+      count = count + 1
+      frame[0] = 18340
+      Opcodes.print_v1(machine, [], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 18354 then
+      count = count + 6
+      a = frame[3]
+      if a >= 32768 then a = a - 65536
+      b = 2
+      r = a * b
+      if r < 0 then r = 65536 + r else r = r % 65536
+      frame[4] = r
+      stack.push((gvars[55] + frame[4]) % 65536)
+      frame[5] = machine.ReadByte(machine.GetVariableRef(0) + 2)
+      stack.push((gvars[55] + frame[4]) % 65536)
+      stack.push(machine.ReadByte(machine.GetVariableRef(0) + 3))
+      frame[0] = 18381
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 9149}, {"t": "v", "s": 2, "v": 3, "c": frame[5]}, {"t": "v", "s": 2, "v": 0, "c": machine.GetVariableRef(0)}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 18381 then
+      count = count + 1
+      frame[0] = 18382
+      Opcodes.print_v1(machine, [], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 18388 then
+      count = count + 1
+      frame[0] = 18389
+      Opcodes.new_line_v1(machine, [], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 18389 then
+      count = count + 3
+      machine.setGlobalVariable(118, 0)
+      machine.setGlobalVariable(130, 0)
+      machine.PopStackFrame(gvars[114])
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @18398, 3 locals, 8 blocks, 15 instructions.
+Aot871124_47de = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 18405 then
+      count = count + 1
+      a = gvars[75]
+      pc = 18409
+      if not (a == 85) then pc = 18412
+    end if
+    if pc == 18409 then
+      count = count + 1
+      frame[0] = 18411
+      Opcodes.print_paddr_v1(machine, [{"t": "v", "s": 2, "v": 135, "c": gvars[119]}], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 18411 then
+      count = count + 1
+      machine.PopStackFrame(0)
+      return count
+    end if
+    if pc == 18412 then
+      count = count + 1
+      frame[0] = 18413
+      Opcodes.print_v1(machine, [], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 18427 then
+      count = count + 6
+      a = frame[3]
+      if a >= 32768 then a = a - 65536
+      b = 2
+      r = a * b
+      if r < 0 then r = 65536 + r else r = r % 65536
+      frame[4] = r
+      stack.push((gvars[55] + frame[4]) % 65536)
+      frame[5] = machine.ReadByte(machine.GetVariableRef(0) + 2)
+      stack.push((gvars[55] + frame[4]) % 65536)
+      stack.push(machine.ReadByte(machine.GetVariableRef(0) + 3))
+      frame[0] = 18454
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 9149}, {"t": "v", "s": 2, "v": 3, "c": frame[5]}, {"t": "v", "s": 2, "v": 0, "c": machine.GetVariableRef(0)}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 18454 then
+      count = count + 1
+      frame[0] = 18455
+      Opcodes.print_v1(machine, [], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 18479 then
+      count = count + 1
+      frame[0] = 18480
+      Opcodes.new_line_v1(machine, [], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 18480 then
+      count = count + 3
+      machine.setGlobalVariable(118, 0)
+      machine.setGlobalVariable(130, 0)
+      machine.PopStackFrame(gvars[114])
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @18488, 3 locals, 5 blocks, 8 instructions.
+Aot871124_4838 = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 18495 then
+      count = count + 1
+      a = frame[4]
+      pc = 18499
+      if not (a == 1) then pc = 18506
+    end if
+    if pc == 18499 then
+      count = count + 2
+      frame[5] = machine.ReadByte(frame[3])
+      pc = 18510
+    end if
+    if pc == 18506 then
+      count = count + 1
+      frame[5] = machine.ReadByte(frame[3] + 4)
+      pc = 18510
+    end if
+    if pc == 18510 then
+      count = count + 2
+      frame[5] = bitAnd(frame[5], 63)
+      if frame[5] == 0 then
+        machine.PopStackFrame(0)
+        return count
+      end if
+      pc = 18517
+    end if
+    if pc == 18517 then
+      count = count + 2
+      stack.push((frame[5] + 192) % 65536)
+      machine.PopStackFrame(machine.GetVariableRef(0))
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @19008, 0 locals, 3 blocks, 3 instructions.
+Aot871124_4a40 = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 19009 then
+      count = count + 1
+      frame[0] = 19010
+      Opcodes.print_v1(machine, [], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19042 then
+      count = count + 1
+      frame[0] = 19043
+      Opcodes.new_line_v1(machine, [], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19043 then
+      count = count + 1
+      machine.PopStackFrame(0)
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @19044, 3 locals, 15 blocks, 34 instructions.
+Aot871124_4a64 = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 19051 then
+      count = count + 1
+      pc = 19054
+      if not (gvars[61] == 0) then pc = 19059
+    end if
+    if pc == 19054 then
+      count = count + 1
+      machine.SetWord(gvars[67] + (2 * gvars[13]), 0)
+      pc = 19059
+    end if
+    if pc == 19059 then
+      count = count + 6
+      stack.push(machine.ReadWord(gvars[41]))
+      machine.SetWord(gvars[96], machine.GetVariableRef(0))
+      stack.push(machine.ReadByte(gvars[41] + 2))
+      machine.SetByte(gvars[96] + 2, machine.GetVariableRef(0))
+      stack.push(machine.ReadByte(gvars[41] + 3))
+      machine.SetByte(gvars[96] + 3, machine.GetVariableRef(0))
+      pc = 19086
+    end if
+    if pc == 19086 then
+      count = count + 1
+      a = (frame[5] + 1) % 65536
+      frame[5] = a
+      if a >= 32768 then a = a - 65536
+      b = 9
+      pc = 19090
+      if a > b then pc = 19102
+    end if
+    if pc == 19090 then
+      count = count + 3
+      stack.push(machine.ReadWord(gvars[100] + (2 * frame[5])))
+      machine.SetWord(gvars[20] + (2 * frame[5]), machine.GetVariableRef(0))
+      pc = 19086
+    end if
+    if pc == 19102 then
+      count = count + 1
+      a = gvars[132]
+      pc = 19106
+      if not (a == 2) then pc = 19133
+    end if
+    if pc == 19106 then
+      count = count + 5
+      machine.SetWord(gvars[54], 8)
+      machine.SetWord(gvars[54] + 2, 9)
+      machine.SetWord(gvars[54] + 4, 8)
+      machine.SetWord(gvars[54] + 6, 9)
+      frame[0] = 19133
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 9717}, {"t": "v", "s": 2, "v": 116, "c": gvars[100]}, {"t": "v", "s": 2, "v": 36, "c": gvars[20]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19133 then
+      count = count + 1
+      a = gvars[132]
+      if a >= 32768 then a = a - 65536
+      b = 1
+      pc = 19137
+      if a < b then pc = 19164
+    end if
+    if pc == 19137 then
+      count = count + 5
+      machine.SetWord(gvars[54], 6)
+      machine.SetWord(gvars[54] + 2, 7)
+      machine.SetWord(gvars[54] + 4, 6)
+      machine.SetWord(gvars[54] + 6, 7)
+      frame[0] = 19164
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 9717}, {"t": "v", "s": 2, "v": 116, "c": gvars[100]}, {"t": "v", "s": 2, "v": 36, "c": gvars[20]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19164 then
+      count = count + 1
+      pc = 19167
+      if frame[3] == 0 then pc = 19185
+    end if
+    if pc == 19167 then
+      count = count + 1
+      frame[0] = 19174
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 9244}, {"t": "v", "s": 2, "v": 1, "c": frame[3]}, {"t": "c", "s": 1, "c": 1}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19174 then
+      count = count + 3
+      machine.SetWord(gvars[20] + 4, machine.GetVariableRef(0))
+      machine.SetWord(gvars[20] + 12, 1)
+      machine.PopStackFrame(1)
+      return count
+    end if
+    if pc == 19185 then
+      count = count + 1
+      if frame[4] == 0 then
+        machine.PopStackFrame(0)
+        return count
+      end if
+      pc = 19188
+    end if
+    if pc == 19188 then
+      count = count + 1
+      frame[0] = 19195
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 9244}, {"t": "v", "s": 2, "v": 2, "c": frame[4]}, {"t": "c", "s": 1, "c": 2}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19195 then
+      count = count + 3
+      machine.SetWord(gvars[20] + 8, machine.GetVariableRef(0))
+      machine.SetWord(gvars[20] + 16, 1)
+      machine.PopStackFrame(1)
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @19206, 4 locals, 5 blocks, 8 instructions.
+Aot871124_4b06 = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 19215 then
+      count = count + 1
+      pc = 19218
+      if frame[3] == 0 then pc = 19229
+    end if
+    if pc == 19218 then
+      count = count + 3
+      frame[5] = machine.ReadWord(gvars[100] + 12)
+      frame[6] = machine.ReadWord(gvars[100] + 14)
+      pc = 19237
+    end if
+    if pc == 19229 then
+      count = count + 2
+      frame[5] = machine.ReadWord(gvars[100] + 16)
+      frame[6] = machine.ReadWord(gvars[100] + 18)
+      pc = 19237
+    end if
+    if pc == 19237 then
+      count = count + 1
+      frame[0] = 19245
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 9623}, {"t": "v", "s": 2, "v": 3, "c": frame[5]}, {"t": "v", "s": 2, "v": 4, "c": frame[6]}, {"t": "v", "s": 2, "v": 2, "c": frame[4]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19245 then
+      count = count + 1
+      machine.PopStackFrame(machine.GetVariableRef(0))
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @19246, 9 locals, 31 blocks, 39 instructions.
+Aot871124_4b2e = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 19265 then
+      count = count + 1
+      a = frame[3]
+      if a == frame[4] then
+        machine.PopStackFrame(1)
+        return count
+      end if
+      pc = 19269
+    end if
+    if pc == 19269 then
+      count = count + 2
+      frame[7] = machine.ReadWord(frame[3])
+      a = frame[7]
+      pc = 19279
+      if not (a == 10351) then pc = 19285
+    end if
+    if pc == 19279 then
+      count = count + 1
+      frame[0] = 19280
+      Opcodes.print_v1(machine, [], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19282 then
+      count = count + 1
+      pc = 19297
+    end if
+    if pc == 19285 then
+      count = count + 1
+      pc = 19288
+      if frame[6] == 0 then pc = 19294
+    end if
+    if pc == 19288 then
+      count = count + 2
+      frame[6] = 0
+      pc = 19297
+    end if
+    if pc == 19294 then
+      count = count + 1
+      frame[0] = 19297
+      Opcodes.print_char_v1(machine, [{"t": "c", "s": 1, "c": 32}], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19297 then
+      count = count + 1
+      a = frame[7]
+      pc = 19305
+      if not (a == 10344 or a == 10351) then pc = 19311
+    end if
+    if pc == 19305 then
+      count = count + 2
+      frame[6] = 1
+      pc = 19406
+    end if
+    if pc == 19311 then
+      count = count + 1
+      a = frame[7]
+      pc = 19317
+      if not (a == 12360) then pc = 19330
+    end if
+    if pc == 19317 then
+      count = count + 1
+      frame[0] = 19318
+      Opcodes.print_v1(machine, [], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19324 then
+      count = count + 2
+      frame[9] = 1
+      pc = 19406
+    end if
+    if pc == 19330 then
+      count = count + 1
+      a = frame[7]
+      pc = 19336
+      if not (a == 11954) then pc = 19345
+    end if
+    if pc == 19336 then
+      count = count + 1
+      frame[0] = 19339
+      Opcodes.print_num_v1(machine, [{"t": "v", "s": 2, "v": 128, "c": gvars[112]}], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19339 then
+      count = count + 2
+      frame[9] = 1
+      pc = 19406
+    end if
+    if pc == 19345 then
+      count = count + 1
+      pc = 19348
+      if frame[8] == 0 then pc = 19357
+    end if
+    if pc == 19348 then
+      count = count + 1
+      pc = 19351
+      if not (frame[9] == 0) then pc = 19357
+    end if
+    if pc == 19351 then
+      count = count + 1
+      pc = 19354
+      if frame[5] == 0 then pc = 19357
+    end if
+    if pc == 19354 then
+      count = count + 1
+      frame[0] = 19355
+      Opcodes.print_v1(machine, [], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19357 then
+      count = count + 1
+      pc = 19360
+      if not (gvars[114] == 0) then pc = 19363
+    end if
+    if pc == 19360 then
+      count = count + 1
+      pc = 19363
+      if gvars[61] == 0 then pc = 19368
+    end if
+    if pc == 19363 then
+      count = count + 1
+      frame[0] = 19365
+      Opcodes.print_addr_v1(machine, [{"t": "v", "s": 2, "v": 5, "c": frame[7]}], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19365 then
+      count = count + 1
+      pc = 19403
+    end if
+    if pc == 19368 then
+      count = count + 1
+      a = frame[7]
+      pc = 19374
+      if not (a == 11996) then pc = 19388
+    end if
+    if pc == 19374 then
+      count = count + 1
+      frame[0] = 19380
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 15672}, {"t": "v", "s": 2, "v": 138, "c": gvars[122]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19380 then
+      count = count + 1
+      pc = 19383
+      if machine.GetVariableRef(0) == 0 then pc = 19388
+    end if
+    if pc == 19383 then
+      count = count + 1
+      frame[0] = 19385
+      Opcodes.print_obj_v1(machine, [{"t": "v", "s": 2, "v": 138, "c": gvars[122]}], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19385 then
+      count = count + 1
+      pc = 19403
+    end if
+    if pc == 19388 then
+      count = count + 3
+      frame[11] = machine.ReadByte(frame[3] + 2)
+      stack.push(machine.ReadByte(frame[3] + 3))
+      frame[0] = 19403
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 9149}, {"t": "v", "s": 2, "v": 9, "c": frame[11]}, {"t": "v", "s": 2, "v": 0, "c": machine.GetVariableRef(0)}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19403 then
+      count = count + 1
+      frame[8] = 0
+      pc = 19406
+    end if
+    if pc == 19406 then
+      count = count + 2
+      frame[3] = (frame[3] + 4) % 65536
+      pc = 19265
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @19434, 6 locals, 8 blocks, 26 instructions.
+Aot871124_4bea = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 19447 then
+      count = count + 10
+      stack.push(machine.ReadWord(gvars[54]))
+      frame[6] = machine.ReadWord(frame[3] + (2 * machine.GetVariableRef(0)))
+      stack.push(machine.ReadWord(gvars[54] + 2))
+      frame[7] = machine.ReadWord(frame[3] + (2 * machine.GetVariableRef(0)))
+      frame[8] = machine.ReadWord(gvars[54] + 4)
+      stack.push(machine.ReadWord(gvars[67] + (2 * gvars[13])))
+      a = machine.GetVariableRef(0)
+      if a >= 32768 then a = a - 65536
+      b = 2
+      r = a * b
+      if r < 0 then r = 65536 + r else r = r % 65536
+      stack.push(r)
+      stack.push((machine.GetVariableRef(0) + 2) % 65536)
+      stack.push((gvars[67] + machine.GetVariableRef(0)) % 65536)
+      machine.SetWord(frame[4] + (2 * frame[8]), machine.GetVariableRef(0))
+      pc = 19488
+    end if
+    if pc == 19488 then
+      count = count + 1
+      a = frame[6]
+      pc = 19492
+      if not (a == frame[7]) then pc = 19518
+    end if
+    if pc == 19492 then
+      count = count + 7
+      frame[8] = machine.ReadWord(gvars[54] + 6)
+      stack.push(machine.ReadWord(gvars[67] + (2 * gvars[13])))
+      a = machine.GetVariableRef(0)
+      if a >= 32768 then a = a - 65536
+      b = 2
+      r = a * b
+      if r < 0 then r = 65536 + r else r = r % 65536
+      stack.push(r)
+      stack.push((machine.GetVariableRef(0) + 2) % 65536)
+      stack.push((gvars[67] + machine.GetVariableRef(0)) % 65536)
+      machine.SetWord(frame[4] + (2 * frame[8]), machine.GetVariableRef(0))
+      machine.PopStackFrame(1)
+      return count
+    end if
+    if pc == 19518 then
+      count = count + 1
+      pc = 19521
+      if frame[5] == 0 then pc = 19535
+    end if
+    if pc == 19521 then
+      count = count + 2
+      stack.push(machine.ReadWord(frame[6]))
+      a = gvars[28]
+      pc = 19529
+      if not (a == machine.GetVariableRef(0)) then pc = 19535
+    end if
+    if pc == 19529 then
+      count = count + 1
+      frame[0] = 19535
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 9776}, {"t": "v", "s": 2, "v": 3, "c": frame[5]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19535 then
+      count = count + 2
+      stack.push(machine.ReadWord(frame[6]))
+      frame[0] = 19545
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 9776}, {"t": "v", "s": 2, "v": 0, "c": machine.GetVariableRef(0)}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19545 then
+      count = count + 2
+      frame[6] = (frame[6] + 4) % 65536
+      pc = 19488
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @19552, 2 locals, 1 blocks, 7 instructions.
+Aot871124_4c60 = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 19557 then
+      count = count + 7
+      stack.push(machine.ReadWord(gvars[67] + (2 * gvars[13])))
+      frame[4] = (machine.GetVariableRef(0) + 2) % 65536
+      stack.push((frame[4] - 1 + 65536) % 65536)
+      machine.SetWord(gvars[67] + (2 * machine.GetVariableRef(0)), frame[3])
+      machine.SetWord(gvars[67] + (2 * frame[4]), 0)
+      machine.SetWord(gvars[67] + (2 * gvars[13]), frame[4])
+      machine.PopStackFrame(1)
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @19586, 3 locals, 4 blocks, 8 instructions.
+Aot871124_4c82 = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 19593 then
+      count = count + 2
+      stack.push(machine.ReadWord(gvars[133]))
+      a = machine.GetVariableRef(0)
+      if a >= 32768 then a = a - 65536
+      b = 2
+      r = a * b
+      if r < 0 then r = 65536 + r else r = r % 65536
+      frame[5] = r
+      pc = 19601
+    end if
+    if pc == 19601 then
+      count = count + 1
+      a = (frame[4] + 1) % 65536
+      frame[4] = a
+      if a >= 32768 then a = a - 65536
+      b = frame[5]
+      if b >= 32768 then b = b - 65536
+      if a > b then
+        machine.PopStackFrame(0)
+        return count
+      end if
+      pc = 19605
+    end if
+    if pc == 19605 then
+      count = count + 2
+      stack.push(machine.ReadWord(gvars[133] + (2 * frame[4])))
+      a = machine.GetVariableRef(0)
+      pc = 19614
+      if not (a == frame[3]) then pc = 19601
+    end if
+    if pc == 19614 then
+      count = count + 3
+      stack.push((frame[4] - 1 + 65536) % 65536)
+      stack.push(machine.ReadWord(gvars[133] + (2 * machine.GetVariableRef(0))))
+      machine.PopStackFrame(machine.GetVariableRef(0))
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @19624, 1 locals, 1 blocks, 3 instructions.
+Aot871124_4ca8 = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 19627 then
+      count = count + 3
+      machine.setGlobalVariable(85, frame[3])
+      machine.setGlobalVariable(91, machine.ReadByte(frame[3] + 1))
+      machine.PopStackFrame(gvars[75])
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @19636, 4 locals, 26 blocks, 33 instructions.
+Aot871124_4cb4 = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 19645 then
+      count = count + 1
+      a = frame[3]
+      pc = 19649
+      if not (a == 24) then pc = 19651
+    end if
+    if pc == 19649 then
+      count = count + 1
+      machine.PopStackFrame(27)
+      return count
+    end if
+    if pc == 19651 then
+      count = count + 4
+      machine.setGlobalVariable(78, frame[3])
+      machine.setGlobalVariable(28, frame[4])
+      machine.SetWord(gvars[89] + (2 * gvars[13]), 0)
+      frame[0] = 19669
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 10137}, {"t": "v", "s": 2, "v": 105, "c": gvars[89]}, {"t": "c", "s": 1, "c": 0}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19669 then
+      count = count + 1
+      pc = 19673
+      if machine.GetVariableRef(0) == 0 then pc = 19750
+    end if
+    if pc == 19673 then
+      count = count + 3
+      machine.setGlobalVariable(78, 0)
+      stack.push(machine.ReadWord(gvars[89] + (2 * gvars[13])))
+      a = machine.GetVariableRef(0)
+      if not (a == 1) then
+        machine.PopStackFrame(0)
+        return count
+      end if
+      pc = 19684
+    end if
+    if pc == 19684 then
+      count = count + 2
+      frame[6] = machine.ReadWord(gvars[89] + 2)
+      frame[0] = 19691
+      Opcodes.print_char_v1(machine, [{"t": "c", "s": 1, "c": 91}], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19691 then
+      count = count + 1
+      pc = 19694
+      if frame[5] == 0 then pc = 19742
+    end if
+    if pc == 19694 then
+      count = count + 1
+      pc = 19697
+      if not (gvars[3] == 0) then pc = 19742
+    end if
+    if pc == 19697 then
+      count = count + 1
+      frame[0] = 19703
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 9793}, {"t": "v", "s": 2, "v": 3, "c": frame[5]}], 3, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19703 then
+      count = count + 1
+      frame[0] = 19705
+      Opcodes.print_addr_v1(machine, [{"t": "v", "s": 2, "v": 3, "c": frame[5]}], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19705 then
+      count = count + 1
+      a = frame[5]
+      pc = 19711
+      if not (a == 12584) then pc = 19714
+    end if
+    if pc == 19711 then
+      count = count + 1
+      frame[0] = 19712
+      Opcodes.print_v1(machine, [], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19714 then
+      count = count + 1
+      frame[0] = 19717
+      Opcodes.print_char_v1(machine, [{"t": "c", "s": 1, "c": 32}], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19717 then
+      count = count + 1
+      a = frame[6]
+      pc = 19721
+      if not (a == 4) then pc = 19731
+    end if
+    if pc == 19721 then
+      count = count + 1
+      frame[0] = 19722
+      Opcodes.print_v1(machine, [], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19728 then
+      count = count + 1
+      pc = 19736
+    end if
+    if pc == 19731 then
+      count = count + 1
+      frame[0] = 19732
+      Opcodes.print_v1(machine, [], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19734 then
+      count = count + 1
+      frame[0] = 19736
+      Opcodes.print_obj_v1(machine, [{"t": "v", "s": 2, "v": 4, "c": frame[6]}], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19736 then
+      count = count + 1
+      frame[0] = 19739
+      Opcodes.print_char_v1(machine, [{"t": "c", "s": 1, "c": 93}], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19739 then
+      count = count + 1
+      frame[0] = 19740
+      Opcodes.new_line_v1(machine, [], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19740 then
+      count = count + 1
+      machine.PopStackFrame(frame[6])
+      return count
+    end if
+    if pc == 19742 then
+      count = count + 1
+      frame[0] = 19744
+      Opcodes.print_obj_v1(machine, [{"t": "v", "s": 2, "v": 4, "c": frame[6]}], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19744 then
+      count = count + 1
+      frame[0] = 19747
+      Opcodes.print_char_v1(machine, [{"t": "c", "s": 1, "c": 93}], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19747 then
+      count = count + 1
+      frame[0] = 19748
+      Opcodes.new_line_v1(machine, [], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19748 then
+      count = count + 1
+      machine.PopStackFrame(frame[6])
+      return count
+    end if
+    if pc == 19750 then
+      count = count + 2
+      machine.setGlobalVariable(78, 0)
+      machine.PopStackFrame(0)
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @19860, 7 locals, 7 blocks, 15 instructions.
+Aot871124_4d94 = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 19875 then
+      count = count + 2
+      frame[4] = machine.ReadWord(frame[3] + (2 * gvars[13]))
+      machine.SetWord(gvars[89] + (2 * gvars[13]), 0)
+      pc = 19884
+    end if
+    if pc == 19884 then
+      count = count + 1
+      a = (frame[4] + 65535) % 65536
+      frame[4] = a
+      if a >= 32768 then a = a - 65536
+      b = 0
+      pc = 19888
+      if a < b then pc = 19918
+    end if
+    if pc == 19888 then
+      count = count + 2
+      frame[8] = machine.ReadWord(frame[3] + (2 * frame[6]))
+      frame[0] = 19899
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 10776}, {"t": "v", "s": 2, "v": 6, "c": frame[8]}, {"t": "v", "s": 2, "v": 20, "c": gvars[4]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19899 then
+      count = count + 1
+      pc = 19902
+      if not (machine.GetVariableRef(0) == 0) then pc = 19913
+    end if
+    if pc == 19902 then
+      count = count + 3
+      stack.push((frame[7] + 1) % 65536)
+      machine.SetWord(gvars[89] + (2 * machine.GetVariableRef(0)), frame[8])
+      frame[7] = (frame[7] + 1) % 65536
+      pc = 19913
+    end if
+    if pc == 19913 then
+      count = count + 2
+      frame[6] = (frame[6] + 1) % 65536
+      pc = 19884
+    end if
+    if pc == 19918 then
+      count = count + 4
+      machine.SetWord(gvars[89] + (2 * gvars[13]), frame[7])
+      frame[9] = gvars[89]
+      machine.setGlobalVariable(105, frame[3])
+      machine.PopStackFrame(frame[9])
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @19932, 9 locals, 58 blocks, 82 instructions.
+Aot871124_4ddc = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 19951 then
+      count = count + 2
+      machine.setGlobalVariable(97, 0)
+      a = gvars[104]
+      pc = 19958
+      if not (a == 1) then pc = 19961
+    end if
+    if pc == 19958 then
+      count = count + 1
+      frame[11] = 1
+      pc = 19961
+    end if
+    if pc == 19961 then
+      count = count + 3
+      machine.setGlobalVariable(120, 0)
+      machine.SetWord(frame[5] + (2 * gvars[13]), 0)
+      frame[9] = machine.ReadWord(frame[3])
+      pc = 19973
+    end if
+    if pc == 19973 then
+      count = count + 1
+      a = frame[3]
+      pc = 19977
+      if not (a == frame[4]) then pc = 20005
+    end if
+    if pc == 19977 then
+      count = count + 1
+      pc = 19980
+      if frame[6] == 0 then pc = 19986
+    end if
+    if pc == 19980 then
+      count = count + 2
+      stack.push(frame[6])
+      pc = 19989
+    end if
+    if pc == 19986 then
+      count = count + 1
+      stack.push(frame[5])
+      pc = 19989
+    end if
+    if pc == 19989 then
+      count = count + 1
+      frame[0] = 19995
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 10137}, {"t": "v", "s": 2, "v": 0, "c": machine.GetVariableRef(0)}], 6, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 19995 then
+      count = count + 1
+      pc = 19998
+      if not (frame[11] == 0) then pc = 20000
+    end if
+    if pc == 19998 then
+      count = count + 1
+      machine.PopStackFrame(frame[8])
+      return count
+    end if
+    if pc == 20000 then
+      count = count + 2
+      machine.setGlobalVariable(120, 1)
+      machine.PopStackFrame(frame[8])
+      return count
+    end if
+    if pc == 20005 then
+      count = count + 2
+      stack.push((frame[3] + 4) % 65536)
+      a = frame[4]
+      pc = 20013
+      if not (a == machine.GetVariableRef(0)) then pc = 20019
+    end if
+    if pc == 20013 then
+      count = count + 2
+      frame[10] = 0
+      pc = 20023
+    end if
+    if pc == 20019 then
+      count = count + 1
+      frame[10] = machine.ReadWord(frame[3] + 4)
+      pc = 20023
+    end if
+    if pc == 20023 then
+      count = count + 1
+      a = frame[9]
+      pc = 20029
+      if not (a == 10449) then pc = 20046
+    end if
+    if pc == 20029 then
+      count = count + 2
+      machine.setGlobalVariable(120, 1)
+      a = frame[10]
+      pc = 20039
+      if not (a == 12514) then pc = 20259
+    end if
+    if pc == 20039 then
+      count = count + 2
+      frame[3] = (frame[3] + 4) % 65536
+      pc = 20259
+    end if
+    if pc == 20046 then
+      count = count + 1
+      a = frame[9]
+      pc = 20054
+      if not (a == 10890 or a == 11394) then pc = 20086
+    end if
+    if pc == 20054 then
+      count = count + 1
+      pc = 20057
+      if frame[6] == 0 then pc = 20063
+    end if
+    if pc == 20057 then
+      count = count + 2
+      stack.push(frame[6])
+      pc = 20066
+    end if
+    if pc == 20063 then
+      count = count + 1
+      stack.push(frame[5])
+      pc = 20066
+    end if
+    if pc == 20066 then
+      count = count + 1
+      frame[0] = 20072
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 10137}, {"t": "v", "s": 2, "v": 0, "c": machine.GetVariableRef(0)}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20072 then
+      count = count + 1
+      if machine.GetVariableRef(0) == 0 then
+        machine.PopStackFrame(0)
+        return count
+      end if
+      pc = 20075
+    end if
+    if pc == 20075 then
+      count = count + 3
+      frame[6] = gvars[4]
+      machine.SetWord(frame[6] + (2 * gvars[13]), 0)
+      pc = 20259
+    end if
+    if pc == 20086 then
+      count = count + 1
+      a = frame[9]
+      pc = 20094
+      if not (a == 10393 or a == 12549) then pc = 20143
+    end if
+    if pc == 20094 then
+      count = count + 1
+      pc = 20097
+      if not (gvars[47] == 0) then pc = 20114
+    end if
+    if pc == 20097 then
+      count = count + 2
+      machine.setGlobalVariable(120, 2)
+      a = frame[10]
+      pc = 20107
+      if not (a == 12514) then pc = 20259
+    end if
+    if pc == 20107 then
+      count = count + 2
+      frame[3] = (frame[3] + 4) % 65536
+      pc = 20259
+    end if
+    if pc == 20114 then
+      count = count + 2
+      machine.setGlobalVariable(37, gvars[82])
+      pc = 20120
+      if frame[6] == 0 then pc = 20126
+    end if
+    if pc == 20120 then
+      count = count + 2
+      stack.push(frame[6])
+      pc = 20129
+    end if
+    if pc == 20126 then
+      count = count + 1
+      stack.push(frame[5])
+      pc = 20129
+    end if
+    if pc == 20129 then
+      count = count + 1
+      frame[0] = 20135
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 10137}, {"t": "v", "s": 2, "v": 0, "c": machine.GetVariableRef(0)}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20135 then
+      count = count + 1
+      if machine.GetVariableRef(0) == 0 then
+        machine.PopStackFrame(0)
+        return count
+      end if
+      pc = 20138
+    end if
+    if pc == 20138 then
+      count = count + 1
+      pc = 20142
+      if not (frame[10] == 0) then pc = 20259
+    end if
+    if pc == 20142 then
+      count = count + 1
+      machine.PopStackFrame(1)
+      return count
+    end if
+    if pc == 20143 then
+      count = count + 1
+      a = frame[9]
+      pc = 20151
+      if not (a == 10477 or a == 10351) then pc = 20185
+    end if
+    if pc == 20151 then
+      count = count + 1
+      a = frame[10]
+      pc = 20159
+      if a == 10477 or a == 10351 then pc = 20185
+    end if
+    if pc == 20159 then
+      count = count + 2
+      machine.setGlobalVariable(97, 1)
+      pc = 20165
+      if frame[6] == 0 then pc = 20171
+    end if
+    if pc == 20165 then
+      count = count + 2
+      stack.push(frame[6])
+      pc = 20174
+    end if
+    if pc == 20171 then
+      count = count + 1
+      stack.push(frame[5])
+      pc = 20174
+    end if
+    if pc == 20174 then
+      count = count + 1
+      frame[0] = 20180
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 10137}, {"t": "v", "s": 2, "v": 0, "c": machine.GetVariableRef(0)}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20180 then
+      count = count + 1
+      pc = 20184
+      if not (machine.GetVariableRef(0) == 0) then pc = 20259
+    end if
+    if pc == 20184 then
+      count = count + 1
+      machine.PopStackFrame(0)
+      return count
+    end if
+    if pc == 20185 then
+      count = count + 1
+      frame[0] = 20192
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 8524}, {"t": "v", "s": 2, "v": 7, "c": frame[9]}, {"t": "c", "s": 1, "c": 4}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20192 then
+      count = count + 1
+      pc = 20196
+      if not (machine.GetVariableRef(0) == 0) then pc = 20259
+    end if
+    if pc == 20196 then
+      count = count + 1
+      a = frame[9]
+      pc = 20204
+      if a == 10477 or a == 10351 then pc = 20259
+    end if
+    if pc == 20204 then
+      count = count + 1
+      a = frame[9]
+      pc = 20210
+      if not (a == 12514) then pc = 20219
+    end if
+    if pc == 20210 then
+      count = count + 1
+      pc = 20213
+      if not (gvars[104] == 0) then pc = 20259
+    end if
+    if pc == 20213 then
+      count = count + 2
+      machine.setGlobalVariable(120, 4)
+      pc = 20259
+    end if
+    if pc == 20219 then
+      count = count + 1
+      frame[0] = 20227
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 8524}, {"t": "v", "s": 2, "v": 7, "c": frame[9]}, {"t": "c", "s": 1, "c": 32}, {"t": "c", "s": 1, "c": 2}], 6, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20227 then
+      count = count + 1
+      pc = 20230
+      if frame[8] == 0 then pc = 20242
+    end if
+    if pc == 20230 then
+      count = count + 1
+      pc = 20233
+      if not (gvars[47] == 0) then pc = 20242
+    end if
+    if pc == 20233 then
+      count = count + 3
+      machine.setGlobalVariable(63, frame[8])
+      machine.setGlobalVariable(133, frame[9])
+      pc = 20259
+    end if
+    if pc == 20242 then
+      count = count + 1
+      frame[0] = 20250
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 8524}, {"t": "v", "s": 2, "v": 7, "c": frame[9]}, {"t": "c", "s": 1, "c": 128}, {"t": "c", "s": 1, "c": 0}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20250 then
+      count = count + 1
+      pc = 20253
+      if machine.GetVariableRef(0) == 0 then pc = 20259
+    end if
+    if pc == 20253 then
+      count = count + 2
+      machine.setGlobalVariable(37, frame[9])
+      machine.setGlobalVariable(98, frame[9])
+      pc = 20259
+    end if
+    if pc == 20259 then
+      count = count + 1
+      a = frame[3]
+      pc = 20264
+      if a == frame[4] then pc = 19973
+    end if
+    if pc == 20264 then
+      count = count + 3
+      frame[3] = (frame[3] + 4) % 65536
+      frame[9] = frame[10]
+      pc = 19973
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @20274, 9 locals, 68 blocks, 101 instructions.
+Aot871124_4f32 = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 20293 then
+      count = count + 3
+      frame[7] = gvars[12]
+      frame[8] = machine.ReadWord(frame[3] + (2 * gvars[13]))
+      b = 4
+      if bitAnd(gvars[104], b) == b then
+        machine.PopStackFrame(1)
+        return count
+      end if
+      pc = 20304
+    end if
+    if pc == 20304 then
+      count = count + 1
+      pc = 20307
+      if not (gvars[21] == 0) then pc = 20327
+    end if
+    if pc == 20307 then
+      count = count + 1
+      pc = 20310
+      if gvars[47] == 0 then pc = 20327
+    end if
+    if pc == 20310 then
+      count = count + 1
+      frame[0] = 20318
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 8524}, {"t": "v", "s": 2, "v": 133, "c": gvars[117]}, {"t": "c", "s": 1, "c": 128}, {"t": "c", "s": 1, "c": 0}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20318 then
+      count = count + 1
+      pc = 20321
+      if machine.GetVariableRef(0) == 0 then pc = 20327
+    end if
+    if pc == 20321 then
+      count = count + 2
+      machine.setGlobalVariable(37, gvars[117])
+      machine.setGlobalVariable(63, 0)
+      pc = 20327
+    end if
+    if pc == 20327 then
+      count = count + 1
+      pc = 20330
+      if not (gvars[21] == 0) then pc = 20346
+    end if
+    if pc == 20330 then
+      count = count + 1
+      pc = 20333
+      if not (gvars[47] == 0) then pc = 20346
+    end if
+    if pc == 20333 then
+      count = count + 1
+      a = gvars[104]
+      pc = 20337
+      if a == 1 then pc = 20346
+    end if
+    if pc == 20337 then
+      count = count + 1
+      pc = 20340
+      if not (gvars[62] == 0) then pc = 20346
+    end if
+    if pc == 20340 then
+      count = count + 1
+      if frame[4] == 0 then
+        machine.PopStackFrame(0)
+        return count
+      end if
+      pc = 20343
+    end if
+    if pc == 20343 then
+      count = count + 1
+      frame[0] = 20345
+      Opcodes.print_paddr_v1(machine, [{"t": "v", "s": 2, "v": 55, "c": gvars[39]}], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20345 then
+      count = count + 1
+      machine.PopStackFrame(0)
+      return count
+    end if
+    if pc == 20346 then
+      count = count + 1
+      a = gvars[104]
+      pc = 20350
+      if not (a == 1) then pc = 20353
+    end if
+    if pc == 20350 then
+      count = count + 1
+      pc = 20353
+      if not (gvars[12] == 0) then pc = 20358
+    end if
+    if pc == 20353 then
+      count = count + 1
+      machine.setGlobalVariable(28, 65535)
+      pc = 20358
+    end if
+    if pc == 20358 then
+      count = count + 1
+      machine.setGlobalVariable(119, frame[3])
+      pc = 20361
+    end if
+    if pc == 20361 then
+      count = count + 1
+      pc = 20364
+      if frame[9] == 0 then pc = 20373
+    end if
+    if pc == 20364 then
+      count = count + 1
+      frame[0] = 20370
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 10394}, {"t": "v", "s": 2, "v": 1, "c": frame[3]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20370 then
+      count = count + 1
+      pc = 20398
+    end if
+    if pc == 20373 then
+      count = count + 1
+      pc = 20376
+      if gvars[38] == 0 then pc = 20390
+    end if
+    if pc == 20376 then
+      count = count + 1
+      frame[0] = 20379
+      Opcodes.clear_attr_v1(machine, [{"t": "c", "s": 1, "c": 30}, {"t": "c", "s": 1, "c": 8}], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20379 then
+      count = count + 1
+      frame[0] = 20387
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 10497}, {"t": "v", "s": 2, "v": 16, "c": gvars[0]}, {"t": "c", "s": 1, "c": 16}, {"t": "c", "s": 1, "c": 32}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20387 then
+      count = count + 1
+      frame[0] = 20390
+      Opcodes.set_attr_v1(machine, [{"t": "c", "s": 1, "c": 30}, {"t": "c", "s": 1, "c": 8}], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20390 then
+      count = count + 1
+      frame[0] = 20398
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 10497}, {"t": "c", "s": 1, "c": 30}, {"t": "c", "s": 1, "c": 128}, {"t": "c", "s": 1, "c": 64}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20398 then
+      count = count + 3
+      stack.push(machine.ReadWord(frame[3] + (2 * gvars[13])))
+      frame[6] = (machine.GetVariableRef(0) - frame[8] + 65536) % 65536
+      b = 1
+      pc = 20411
+      if bitAnd(gvars[104], b) == b then pc = 20581
+    end if
+    if pc == 20411 then
+      count = count + 1
+      b = 2
+      pc = 20415
+      if not (bitAnd(gvars[104], b) == b) then pc = 20464
+    end if
+    if pc == 20415 then
+      count = count + 1
+      pc = 20418
+      if frame[6] == 0 then pc = 20464
+    end if
+    if pc == 20418 then
+      count = count + 1
+      a = frame[6]
+      pc = 20422
+      if a == 1 then pc = 20456
+    end if
+    if pc == 20422 then
+      count = count + 1
+      frame[0] = 20426
+      Opcodes.random_v1(machine, [{"t": "v", "s": 2, "v": 4, "c": frame[6]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20426 then
+      count = count + 3
+      stack.push(machine.ReadWord(frame[3] + (2 * machine.GetVariableRef(0))))
+      machine.SetWord(frame[3] + 2, machine.GetVariableRef(0))
+      frame[0] = 20436
+      Opcodes.print_v1(machine, [], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20444 then
+      count = count + 2
+      stack.push(machine.ReadWord(frame[3] + 2))
+      frame[0] = 20450
+      Opcodes.print_obj_v1(machine, [{"t": "v", "s": 2, "v": 0, "c": machine.GetVariableRef(0)}], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20450 then
+      count = count + 1
+      frame[0] = 20451
+      Opcodes.print_v1(machine, [], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20455 then
+      count = count + 1
+      frame[0] = 20456
+      Opcodes.new_line_v1(machine, [], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20456 then
+      count = count + 2
+      machine.SetWord(frame[3] + (2 * gvars[13]), 1)
+      pc = 20581
+    end if
+    if pc == 20464 then
+      count = count + 1
+      a = frame[6]
+      if a >= 32768 then a = a - 65536
+      b = 1
+      pc = 20468
+      if a > b then pc = 20479
+    end if
+    if pc == 20468 then
+      count = count + 1
+      pc = 20472
+      if not (frame[6] == 0) then pc = 20581
+    end if
+    if pc == 20472 then
+      count = count + 1
+      a = gvars[12]
+      pc = 20479
+      if a == 65535 then pc = 20581
+    end if
+    if pc == 20479 then
+      count = count + 1
+      a = gvars[12]
+      pc = 20485
+      if not (a == 65535) then pc = 20507
+    end if
+    if pc == 20485 then
+      count = count + 6
+      machine.setGlobalVariable(28, frame[7])
+      frame[10] = frame[6]
+      stack.push(machine.ReadWord(frame[3] + (2 * gvars[13])))
+      stack.push((machine.GetVariableRef(0) - frame[6] + 65536) % 65536)
+      machine.SetWord(frame[3] + (2 * gvars[13]), machine.GetVariableRef(0))
+      pc = 20361
+    end if
+    if pc == 20507 then
+      count = count + 1
+      pc = 20510
+      if not (frame[6] == 0) then pc = 20513
+    end if
+    if pc == 20510 then
+      count = count + 1
+      frame[6] = frame[10]
+      pc = 20513
+    end if
+    if pc == 20513 then
+      count = count + 1
+      a = gvars[115]
+      pc = 20517
+      if a == 30 then pc = 20523
+    end if
+    if pc == 20517 then
+      count = count + 1
+      frame[0] = 20522
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 9504}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20522 then
+      count = count + 1
+      machine.PopStackFrame(0)
+      return count
+    end if
+    if pc == 20523 then
+      count = count + 1
+      pc = 20526
+      if frame[4] == 0 then pc = 20569
+    end if
+    if pc == 20526 then
+      count = count + 1
+      pc = 20529
+      if gvars[21] == 0 then pc = 20569
+    end if
+    if pc == 20529 then
+      count = count + 1
+      frame[0] = 20537
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 10327}, {"t": "v", "s": 2, "v": 6, "c": frame[8]}, {"t": "v", "s": 2, "v": 4, "c": frame[6]}, {"t": "v", "s": 2, "v": 1, "c": frame[3]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20537 then
+      count = count + 1
+      a = frame[3]
+      pc = 20541
+      if not (a == gvars[78]) then pc = 20547
+    end if
+    if pc == 20541 then
+      count = count + 2
+      machine.setGlobalVariable(26, 6)
+      pc = 20550
+    end if
+    if pc == 20547 then
+      count = count + 1
+      machine.setGlobalVariable(26, 8)
+      pc = 20550
+    end if
+    if pc == 20550 then
+      count = count + 3
+      machine.setGlobalVariable(89, gvars[47])
+      machine.setGlobalVariable(44, gvars[21])
+      frame[0] = 20563
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 9522}, {"t": "c", "s": 1, "c": 0}, {"t": "c", "s": 1, "c": 0}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20563 then
+      count = count + 2
+      machine.setGlobalVariable(130, 1)
+      pc = 20574
+    end if
+    if pc == 20569 then
+      count = count + 1
+      pc = 20572
+      if frame[4] == 0 then pc = 20574
+    end if
+    if pc == 20572 then
+      count = count + 1
+      frame[0] = 20574
+      Opcodes.print_paddr_v1(machine, [{"t": "v", "s": 2, "v": 55, "c": gvars[39]}], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20574 then
+      count = count + 3
+      machine.setGlobalVariable(37, 0)
+      machine.setGlobalVariable(63, 0)
+      machine.PopStackFrame(0)
+      return count
+    end if
+    if pc == 20581 then
+      count = count + 1
+      pc = 20584
+      if not (frame[6] == 0) then pc = 20635
+    end if
+    if pc == 20584 then
+      count = count + 1
+      pc = 20587
+      if frame[9] == 0 then pc = 20635
+    end if
+    if pc == 20587 then
+      count = count + 1
+      pc = 20590
+      if frame[4] == 0 then pc = 20628
+    end if
+    if pc == 20590 then
+      count = count + 2
+      machine.setGlobalVariable(28, frame[7])
+      pc = 20596
+      if not (gvars[38] == 0) then pc = 20600
+    end if
+    if pc == 20596 then
+      count = count + 1
+      a = gvars[75]
+      pc = 20600
+      if not (a == 84) then pc = 20626
+    end if
+    if pc == 20600 then
+      count = count + 1
+      frame[0] = 20607
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 10575}, {"t": "c", "s": 1, "c": 130}, {"t": "v", "s": 2, "v": 1, "c": frame[3]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20607 then
+      count = count + 7
+      machine.setGlobalVariable(40, gvars[21])
+      machine.setGlobalVariable(86, gvars[47])
+      machine.setGlobalVariable(58, gvars[117])
+      machine.setGlobalVariable(37, 0)
+      machine.setGlobalVariable(63, 0)
+      machine.setGlobalVariable(133, 0)
+      machine.PopStackFrame(1)
+      return count
+    end if
+    if pc == 20626 then
+      count = count + 1
+      frame[0] = 20628
+      Opcodes.print_paddr_v1(machine, [{"t": "v", "s": 2, "v": 73, "c": gvars[57]}], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 20628 then
+      count = count + 3
+      machine.setGlobalVariable(37, 0)
+      machine.setGlobalVariable(63, 0)
+      machine.PopStackFrame(0)
+      return count
+    end if
+    if pc == 20635 then
+      count = count + 1
+      pc = 20638
+      if not (frame[6] == 0) then pc = 20644
+    end if
+    if pc == 20638 then
+      count = count + 2
+      frame[9] = 1
+      pc = 20361
+    end if
+    if pc == 20644 then
+      count = count + 4
+      machine.setGlobalVariable(28, frame[7])
+      machine.setGlobalVariable(37, 0)
+      machine.setGlobalVariable(63, 0)
+      machine.PopStackFrame(1)
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @20994, 4 locals, 9 blocks, 10 instructions.
+Aot871124_5202 = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 21003 then
+      count = count + 2
+      stack.push((frame[4] + frame[5]) % 65536)
+      b = machine.GetVariableRef(0)
+      pc = 21011
+      if not (bitAnd(gvars[12], b) == b) then pc = 21020
+    end if
+    if pc == 21011 then
+      count = count + 1
+      frame[0] = 21019
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 10523}, {"t": "v", "s": 2, "v": 1, "c": frame[3]}, {"t": "v", "s": 2, "v": 119, "c": gvars[103]}, {"t": "c", "s": 1, "c": 1}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 21019 then
+      count = count + 1
+      machine.PopStackFrame(machine.GetVariableRef(0))
+      return count
+    end if
+    if pc == 21020 then
+      count = count + 1
+      b = frame[4]
+      pc = 21024
+      if not (bitAnd(gvars[12], b) == b) then pc = 21033
+    end if
+    if pc == 21024 then
+      count = count + 1
+      frame[0] = 21032
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 10523}, {"t": "v", "s": 2, "v": 1, "c": frame[3]}, {"t": "v", "s": 2, "v": 119, "c": gvars[103]}, {"t": "c", "s": 1, "c": 0}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 21032 then
+      count = count + 1
+      machine.PopStackFrame(machine.GetVariableRef(0))
+      return count
+    end if
+    if pc == 21033 then
+      count = count + 1
+      b = frame[5]
+      if not (bitAnd(gvars[12], b) == b) then
+        machine.PopStackFrame(1)
+        return count
+      end if
+      pc = 21037
+    end if
+    if pc == 21037 then
+      count = count + 1
+      frame[0] = 21045
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 10523}, {"t": "v", "s": 2, "v": 1, "c": frame[3]}, {"t": "v", "s": 2, "v": 119, "c": gvars[103]}, {"t": "c", "s": 1, "c": 2}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 21045 then
+      count = count + 1
+      machine.PopStackFrame(machine.GetVariableRef(0))
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @21046, 5 locals, 21 blocks, 23 instructions.
+Aot871124_5236 = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 21057 then
+      count = count + 1
+      frame[0] = 21061
+      Opcodes.get_child_v1(machine, [{"t": "v", "s": 2, "v": 1, "c": frame[3]}], 1, {"b": false, "t": "r", "r": 0})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 21061 then
+      count = count + 1
+      a = frame[5]
+      pc = 21065
+      if a == 2 then pc = 21089
+    end if
+    if pc == 21065 then
+      count = count + 1
+      frame[0] = 21069
+      Opcodes.get_prop_addr_v1(machine, [{"t": "v", "s": 2, "v": 1, "c": frame[3]}, {"t": "c", "s": 1, "c": 17}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 21069 then
+      count = count + 1
+      pc = 21072
+      if machine.GetVariableRef(0) == 0 then pc = 21089
+    end if
+    if pc == 21072 then
+      count = count + 1
+      frame[0] = 21079
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 10866}, {"t": "v", "s": 2, "v": 1, "c": frame[3]}, {"t": "v", "s": 2, "v": 2, "c": frame[4]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 21079 then
+      count = count + 1
+      pc = 21082
+      if machine.GetVariableRef(0) == 0 then pc = 21089
+    end if
+    if pc == 21082 then
+      count = count + 1
+      frame[0] = 21089
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 10575}, {"t": "v", "s": 2, "v": 1, "c": frame[3]}, {"t": "v", "s": 2, "v": 2, "c": frame[4]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 21089 then
+      count = count + 1
+      pc = 21092
+      if not (frame[5] == 0) then pc = 21100
+    end if
+    if pc == 21092 then
+      count = count + 1
+      frame[0] = 21096
+      Opcodes.test_attr_v1(machine, [{"t": "v", "s": 2, "v": 1, "c": frame[3]}, {"t": "c", "s": 1, "c": 9}], null, {"b": true, "t": "a", "a": 21100})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 21096 then
+      count = count + 1
+      frame[0] = 21100
+      Opcodes.test_attr_v1(machine, [{"t": "v", "s": 2, "v": 1, "c": frame[3]}, {"t": "c", "s": 1, "c": 12}], null, {"b": false, "t": "a", "a": 21143})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 21100 then
+      count = count + 1
+      frame[0] = 21104
+      Opcodes.get_child_v1(machine, [{"t": "v", "s": 2, "v": 1, "c": frame[3]}], 5, {"b": false, "t": "a", "a": 21143})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 21104 then
+      count = count + 1
+      frame[0] = 21108
+      Opcodes.test_attr_v1(machine, [{"t": "v", "s": 2, "v": 1, "c": frame[3]}, {"t": "c", "s": 1, "c": 10}], null, {"b": true, "t": "a", "a": 21112})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 21108 then
+      count = count + 1
+      frame[0] = 21112
+      Opcodes.test_attr_v1(machine, [{"t": "v", "s": 2, "v": 1, "c": frame[3]}, {"t": "c", "s": 1, "c": 8}], null, {"b": false, "t": "a", "a": 21143})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 21112 then
+      count = count + 1
+      frame[0] = 21116
+      Opcodes.test_attr_v1(machine, [{"t": "v", "s": 2, "v": 1, "c": frame[3]}, {"t": "c", "s": 1, "c": 12}], null, {"b": false, "t": "a", "a": 21122})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 21116 then
+      count = count + 2
+      stack.push(1)
+      pc = 21135
+    end if
+    if pc == 21122 then
+      count = count + 1
+      frame[0] = 21126
+      Opcodes.test_attr_v1(machine, [{"t": "v", "s": 2, "v": 1, "c": frame[3]}, {"t": "c", "s": 1, "c": 9}], null, {"b": false, "t": "a", "a": 21132})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 21126 then
+      count = count + 2
+      stack.push(1)
+      pc = 21135
+    end if
+    if pc == 21132 then
+      count = count + 1
+      stack.push(0)
+      pc = 21135
+    end if
+    if pc == 21135 then
+      count = count + 1
+      frame[0] = 21143
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 10523}, {"t": "v", "s": 2, "v": 1, "c": frame[3]}, {"t": "v", "s": 2, "v": 2, "c": frame[4]}, {"t": "v", "s": 2, "v": 0, "c": machine.GetVariableRef(0)}], 4, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 21143 then
+      count = count + 1
+      frame[0] = 21148
+      Opcodes.get_sibling_v1(machine, [{"t": "v", "s": 2, "v": 1, "c": frame[3]}], 1, {"b": true, "t": "a", "a": 21061})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 21148 then
+      count = count + 1
+      machine.PopStackFrame(1)
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @21150, 3 locals, 1 blocks, 6 instructions.
+Aot871124_529e = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 21157 then
+      count = count + 6
+      frame[5] = machine.ReadWord(frame[4] + (2 * gvars[13]))
+      stack.push((frame[5] + 1) % 65536)
+      machine.SetWord(frame[4] + (2 * machine.GetVariableRef(0)), frame[3])
+      stack.push((frame[5] + 1) % 65536)
+      machine.SetWord(frame[4] + (2 * gvars[13]), machine.GetVariableRef(0))
+      machine.PopStackFrame(1)
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @27926, 10 locals, 62 blocks, 68 instructions.
+Aot871124_6d16 = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 27947 then
+      count = count + 1
+      frame[0] = 27951
+      Opcodes.get_child_v1(machine, [{"t": "v", "s": 2, "v": 1, "c": frame[3]}], 4, {"b": false, "t": "r", "r": 1})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 27951 then
+      count = count + 1
+      frame[0] = 27955
+      Opcodes.jin_v1(machine, [{"t": "c", "s": 1, "c": 30}, {"t": "c", "s": 1, "c": 143}], null, {"b": false, "t": "a", "a": 27958})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 27955 then
+      count = count + 1
+      frame[0] = 27958
+      Opcodes.get_parent_v1(machine, [{"t": "v", "s": 2, "v": 131, "c": gvars[115]}], 7, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 27958 then
+      count = count + 3
+      frame[7] = 1
+      frame[8] = 1
+      frame[0] = 27967
+      Opcodes.get_parent_v1(machine, [{"t": "v", "s": 2, "v": 1, "c": frame[3]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 27967 then
+      count = count + 1
+      a = gvars[115]
+      pc = 27973
+      if not (a == frame[3] or a == machine.GetVariableRef(0)) then pc = 28011
+    end if
+    if pc == 27973 then
+      count = count + 1
+      frame[12] = 1
+      pc = 27976
+    end if
+    if pc == 27976 then
+      count = count + 1
+      frame[0] = 27980
+      Opcodes.get_child_v1(machine, [{"t": "v", "s": 2, "v": 1, "c": frame[3]}], 4, {"b": true, "t": "a", "a": 27980})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 27980 then
+      count = count + 1
+      pc = 27984
+      if not (frame[6] == 0) then pc = 28101
+    end if
+    if pc == 27984 then
+      count = count + 1
+      pc = 27987
+      if frame[11] == 0 then pc = 28004
+    end if
+    if pc == 27987 then
+      count = count + 1
+      pc = 27990
+      if frame[9] == 0 then pc = 28004
+    end if
+    if pc == 27990 then
+      count = count + 1
+      frame[0] = 27994
+      Opcodes.get_child_v1(machine, [{"t": "v", "s": 2, "v": 7, "c": frame[9]}], 0, {"b": false, "t": "a", "a": 28004})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 27994 then
+      count = count + 2
+      frame[5] = (frame[5] + 1) % 65536
+      frame[0] = 28004
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 13963}, {"t": "v", "s": 2, "v": 7, "c": frame[9]}, {"t": "v", "s": 2, "v": 2, "c": frame[4]}, {"t": "v", "s": 2, "v": 3, "c": frame[5]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28004 then
+      count = count + 1
+      if frame[7] == 0 then
+        machine.PopStackFrame(1)
+        return count
+      end if
+      pc = 28007
+    end if
+    if pc == 28007 then
+      count = count + 1
+      if not (frame[8] == 0) then
+        machine.PopStackFrame(0)
+        return count
+      end if
+      pc = 28010
+    end if
+    if pc == 28010 then
+      count = count + 1
+      machine.PopStackFrame(1)
+      return count
+    end if
+    if pc == 28011 then
+      count = count + 1
+      pc = 28015
+      if frame[6] == 0 then pc = 27976
+    end if
+    if pc == 28015 then
+      count = count + 1
+      a = frame[6]
+      pc = 28019
+      if not (a == frame[9]) then pc = 28025
+    end if
+    if pc == 28019 then
+      count = count + 2
+      frame[11] = 1
+      pc = 28093
+    end if
+    if pc == 28025 then
+      count = count + 1
+      a = frame[6]
+      pc = 28030
+      if a == gvars[115] then pc = 28093
+    end if
+    if pc == 28030 then
+      count = count + 1
+      frame[0] = 28035
+      Opcodes.test_attr_v1(machine, [{"t": "v", "s": 2, "v": 4, "c": frame[6]}, {"t": "c", "s": 1, "c": 14}], null, {"b": true, "t": "a", "a": 28093})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28035 then
+      count = count + 1
+      frame[0] = 28039
+      Opcodes.test_attr_v1(machine, [{"t": "v", "s": 2, "v": 4, "c": frame[6]}, {"t": "c", "s": 1, "c": 13}], null, {"b": true, "t": "a", "a": 28093})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28039 then
+      count = count + 1
+      frame[0] = 28043
+      Opcodes.get_prop_v1(machine, [{"t": "v", "s": 2, "v": 4, "c": frame[6]}, {"t": "c", "s": 1, "c": 10}], 8, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28043 then
+      count = count + 1
+      pc = 28046
+      if frame[10] == 0 then pc = 28093
+    end if
+    if pc == 28046 then
+      count = count + 1
+      frame[0] = 28050
+      Opcodes.test_attr_v1(machine, [{"t": "v", "s": 2, "v": 4, "c": frame[6]}, {"t": "c", "s": 1, "c": 6}], null, {"b": true, "t": "a", "a": 28056})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28050 then
+      count = count + 1
+      frame[0] = 28052
+      Opcodes.print_paddr_v1(machine, [{"t": "v", "s": 2, "v": 8, "c": frame[10]}], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28052 then
+      count = count + 1
+      frame[0] = 28053
+      Opcodes.new_line_v1(machine, [], null, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28053 then
+      count = count + 1
+      frame[8] = 0
+      pc = 28056
+    end if
+    if pc == 28056 then
+      count = count + 1
+      frame[0] = 28062
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 14154}, {"t": "v", "s": 2, "v": 4, "c": frame[6]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28062 then
+      count = count + 1
+      pc = 28065
+      if machine.GetVariableRef(0) == 0 then pc = 28093
+    end if
+    if pc == 28065 then
+      count = count + 1
+      frame[0] = 28068
+      Opcodes.get_parent_v1(machine, [{"t": "v", "s": 2, "v": 4, "c": frame[6]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28068 then
+      count = count + 1
+      frame[0] = 28072
+      Opcodes.get_prop_v1(machine, [{"t": "v", "s": 2, "v": 0, "c": machine.GetVariableRef(0)}, {"t": "c", "s": 1, "c": 6}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28072 then
+      count = count + 1
+      pc = 28075
+      if not (machine.GetVariableRef(0) == 0) then pc = 28093
+    end if
+    if pc == 28075 then
+      count = count + 1
+      frame[0] = 28079
+      Opcodes.get_child_v1(machine, [{"t": "v", "s": 2, "v": 4, "c": frame[6]}], 0, {"b": false, "t": "a", "a": 28093})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28079 then
+      count = count + 1
+      frame[0] = 28087
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 13963}, {"t": "v", "s": 2, "v": 4, "c": frame[6]}, {"t": "v", "s": 2, "v": 2, "c": frame[4]}, {"t": "c", "s": 1, "c": 0}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28087 then
+      count = count + 1
+      pc = 28090
+      if machine.GetVariableRef(0) == 0 then pc = 28093
+    end if
+    if pc == 28090 then
+      count = count + 1
+      frame[7] = 0
+      pc = 28093
+    end if
+    if pc == 28093 then
+      count = count + 1
+      frame[0] = 28098
+      Opcodes.get_sibling_v1(machine, [{"t": "v", "s": 2, "v": 4, "c": frame[6]}], 4, {"b": true, "t": "a", "a": 28011})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28098 then
+      count = count + 1
+      pc = 28011
+    end if
+    if pc == 28101 then
+      count = count + 1
+      a = frame[6]
+      pc = 28108
+      if a == frame[9] or a == 30 then pc = 28200
+    end if
+    if pc == 28108 then
+      count = count + 1
+      frame[0] = 28113
+      Opcodes.test_attr_v1(machine, [{"t": "v", "s": 2, "v": 4, "c": frame[6]}, {"t": "c", "s": 1, "c": 14}], null, {"b": true, "t": "a", "a": 28200})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28113 then
+      count = count + 1
+      pc = 28116
+      if not (frame[12] == 0) then pc = 28128
+    end if
+    if pc == 28116 then
+      count = count + 1
+      frame[0] = 28120
+      Opcodes.test_attr_v1(machine, [{"t": "v", "s": 2, "v": 4, "c": frame[6]}, {"t": "c", "s": 1, "c": 13}], null, {"b": true, "t": "a", "a": 28128})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28120 then
+      count = count + 1
+      frame[0] = 28124
+      Opcodes.get_prop_v1(machine, [{"t": "v", "s": 2, "v": 4, "c": frame[6]}, {"t": "c", "s": 1, "c": 10}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28124 then
+      count = count + 1
+      pc = 28128
+      if not (machine.GetVariableRef(0) == 0) then pc = 28200
+    end if
+    if pc == 28128 then
+      count = count + 1
+      frame[0] = 28132
+      Opcodes.test_attr_v1(machine, [{"t": "v", "s": 2, "v": 4, "c": frame[6]}, {"t": "c", "s": 1, "c": 6}], null, {"b": true, "t": "a", "a": 28175})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28132 then
+      count = count + 1
+      pc = 28135
+      if frame[7] == 0 then pc = 28157
+    end if
+    if pc == 28135 then
+      count = count + 1
+      frame[0] = 28142
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 14104}, {"t": "v", "s": 2, "v": 1, "c": frame[3]}, {"t": "v", "s": 2, "v": 3, "c": frame[5]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28142 then
+      count = count + 1
+      pc = 28145
+      if machine.GetVariableRef(0) == 0 then pc = 28152
+    end if
+    if pc == 28145 then
+      count = count + 1
+      a = frame[5]
+      if a >= 32768 then a = a - 65536
+      b = 0
+      pc = 28149
+      if not (a < b) then pc = 28152
+    end if
+    if pc == 28149 then
+      count = count + 1
+      frame[5] = 0
+      pc = 28152
+    end if
+    if pc == 28152 then
+      count = count + 2
+      frame[5] = (frame[5] + 1) % 65536
+      frame[7] = 0
+      pc = 28157
+    end if
+    if pc == 28157 then
+      count = count + 1
+      a = frame[5]
+      if a >= 32768 then a = a - 65536
+      b = 0
+      pc = 28161
+      if not (a < b) then pc = 28164
+    end if
+    if pc == 28161 then
+      count = count + 1
+      frame[5] = 0
+      pc = 28164
+    end if
+    if pc == 28164 then
+      count = count + 1
+      frame[0] = 28172
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 13850}, {"t": "v", "s": 2, "v": 4, "c": frame[6]}, {"t": "v", "s": 2, "v": 2, "c": frame[4]}, {"t": "v", "s": 2, "v": 3, "c": frame[5]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28172 then
+      count = count + 1
+      pc = 28200
+    end if
+    if pc == 28175 then
+      count = count + 1
+      frame[0] = 28179
+      Opcodes.get_child_v1(machine, [{"t": "v", "s": 2, "v": 4, "c": frame[6]}], 0, {"b": false, "t": "a", "a": 28200})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28179 then
+      count = count + 1
+      frame[0] = 28185
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 14154}, {"t": "v", "s": 2, "v": 4, "c": frame[6]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28185 then
+      count = count + 1
+      pc = 28188
+      if machine.GetVariableRef(0) == 0 then pc = 28200
+    end if
+    if pc == 28188 then
+      count = count + 2
+      frame[5] = (frame[5] + 1) % 65536
+      frame[0] = 28198
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 13963}, {"t": "v", "s": 2, "v": 4, "c": frame[6]}, {"t": "v", "s": 2, "v": 2, "c": frame[4]}, {"t": "v", "s": 2, "v": 3, "c": frame[5]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28198 then
+      count = count + 1
+      frame[5] = (frame[5] + 65535) % 65536
+      pc = 28200
+    end if
+    if pc == 28200 then
+      count = count + 1
+      frame[0] = 28205
+      Opcodes.get_sibling_v1(machine, [{"t": "v", "s": 2, "v": 4, "c": frame[6]}], 4, {"b": true, "t": "a", "a": 27980})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28205 then
+      count = count + 1
+      pc = 27980
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @28308, 1 locals, 4 blocks, 4 instructions.
+Aot871124_6e94 = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 28311 then
+      count = count + 1
+      frame[0] = 28315
+      Opcodes.test_attr_v1(machine, [{"t": "v", "s": 2, "v": 1, "c": frame[3]}, {"t": "c", "s": 1, "c": 14}], null, {"b": true, "t": "r", "r": 0})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28315 then
+      count = count + 1
+      frame[0] = 28319
+      Opcodes.test_attr_v1(machine, [{"t": "v", "s": 2, "v": 1, "c": frame[3]}, {"t": "c", "s": 1, "c": 8}], null, {"b": true, "t": "r", "r": 1})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28319 then
+      count = count + 1
+      frame[0] = 28323
+      Opcodes.test_attr_v1(machine, [{"t": "v", "s": 2, "v": 1, "c": frame[3]}, {"t": "c", "s": 1, "c": 10}], null, {"b": true, "t": "r", "r": 1})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 28323 then
+      count = count + 1
+      machine.PopStackFrame(0)
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @29816, 3 locals, 5 blocks, 7 instructions.
+Aot871124_7478 = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 29823 then
+      count = count + 1
+      frame[0] = 29827
+      Opcodes.get_child_v1(machine, [{"t": "v", "s": 2, "v": 1, "c": frame[3]}], 2, {"b": false, "t": "a", "a": 29842})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 29827 then
+      count = count + 1
+      frame[0] = 29833
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 14908}, {"t": "v", "s": 2, "v": 2, "c": frame[4]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 29833 then
+      count = count + 2
+      frame[5] = (frame[5] + machine.GetVariableRef(0)) % 65536
+      frame[0] = 29842
+      Opcodes.get_sibling_v1(machine, [{"t": "v", "s": 2, "v": 2, "c": frame[4]}], 2, {"b": true, "t": "a", "a": 29827})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 29842 then
+      count = count + 1
+      frame[0] = 29846
+      Opcodes.get_prop_v1(machine, [{"t": "v", "s": 2, "v": 1, "c": frame[3]}, {"t": "c", "s": 1, "c": 13}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 29846 then
+      count = count + 2
+      stack.push((frame[5] + machine.GetVariableRef(0)) % 65536)
+      machine.PopStackFrame(machine.GetVariableRef(0))
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// Routine @31344, 3 locals, 16 blocks, 16 instructions.
+Aot871124_7a70 = function(machine, frame, pc)
+  stack = frame[1]
+  gvars = machine.globals
+  depth = machine.callStack.len
+  count = 0
+  while true
+    start = count
+    if pc == 31351 then
+      count = count + 1
+      frame[0] = 31354
+      Opcodes.get_parent_v1(machine, [{"t": "v", "s": 2, "v": 1, "c": frame[3]}], 2, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 31354 then
+      count = count + 1
+      frame[0] = 31358
+      Opcodes.test_attr_v1(machine, [{"t": "v", "s": 2, "v": 1, "c": frame[3]}, {"t": "c", "s": 1, "c": 14}], null, {"b": true, "t": "r", "r": 0})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 31358 then
+      count = count + 1
+      if frame[4] == 0 then
+        machine.PopStackFrame(0)
+        return count
+      end if
+      pc = 31361
+    end if
+    if pc == 31361 then
+      count = count + 1
+      a = frame[4]
+      if a == 45 then
+        machine.PopStackFrame(1)
+        return count
+      end if
+      pc = 31365
+    end if
+    if pc == 31365 then
+      count = count + 1
+      a = frame[4]
+      pc = 31369
+      if not (a == 36) then pc = 31378
+    end if
+    if pc == 31369 then
+      count = count + 1
+      frame[0] = 31375
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 15643}, {"t": "v", "s": 2, "v": 1, "c": frame[3]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 31375 then
+      count = count + 1
+      if not (machine.GetVariableRef(0) == 0) then
+        machine.PopStackFrame(1)
+        return count
+      end if
+      pc = 31378
+    end if
+    if pc == 31378 then
+      count = count + 1
+      frame[0] = 31384
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 15709}, {"t": "v", "s": 2, "v": 1, "c": frame[3]}], 3, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 31384 then
+      count = count + 1
+      frame[0] = 31387
+      Opcodes.get_parent_v1(machine, [{"t": "v", "s": 2, "v": 131, "c": gvars[115]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 31387 then
+      count = count + 1
+      a = frame[5]
+      if not (a == gvars[0] or a == machine.GetVariableRef(0)) then
+        machine.PopStackFrame(0)
+        return count
+      end if
+      pc = 31393
+    end if
+    if pc == 31393 then
+      count = count + 1
+      frame[0] = 31396
+      Opcodes.get_parent_v1(machine, [{"t": "v", "s": 2, "v": 131, "c": gvars[115]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 31396 then
+      count = count + 1
+      a = frame[4]
+      if a == gvars[115] or a == gvars[0] or a == machine.GetVariableRef(0) then
+        machine.PopStackFrame(1)
+        return count
+      end if
+      pc = 31403
+    end if
+    if pc == 31403 then
+      count = count + 1
+      frame[0] = 31407
+      Opcodes.test_attr_v1(machine, [{"t": "v", "s": 2, "v": 2, "c": frame[4]}, {"t": "c", "s": 1, "c": 10}], null, {"b": false, "t": "r", "r": 0})
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 31407 then
+      count = count + 1
+      frame[0] = 31413
+      Opcodes.call_v1(machine, [{"t": "c", "s": 2, "c": 15672}, {"t": "v", "s": 2, "v": 2, "c": frame[4]}], 0, null)
+      if machine.callStack.len != depth then return count
+      pc = frame[0]
+    end if
+    if pc == 31413 then
+      count = count + 1
+      if machine.GetVariableRef(0) == 0 then
+        machine.PopStackFrame(0)
+        return count
+      end if
+      pc = 31416
+    end if
+    if pc == 31416 then
+      count = count + 1
+      machine.PopStackFrame(1)
+      return count
+    end if
+    // Not the start of a block; let the interpreter run it.
+    if count == start then
+      frame[0] = pc
+      return count
+    end if
+  end while
+end function
+
+// The compiled routine for each block start address.
+aotBlocks = {}
+aotBlocks[14979] = @Aot871124_3a74
+aotBlocks[14994] = @Aot871124_3a74
+aotBlocks[15000] = @Aot871124_3a74
+aotBlocks[15003] = @Aot871124_3a74
+aotBlocks[15005] = @Aot871124_3a74
+aotBlocks[15007] = @Aot871124_3a74
+aotBlocks[15011] = @Aot871124_3a74
+aotBlocks[15014] = @Aot871124_3a74
+aotBlocks[15018] = @Aot871124_3a74
+aotBlocks[15021] = @Aot871124_3a74
+aotBlocks[15030] = @Aot871124_3a74
+aotBlocks[15034] = @Aot871124_3a74
+aotBlocks[15038] = @Aot871124_3a74
+aotBlocks[15041] = @Aot871124_3a74
+aotBlocks[15050] = @Aot871124_3a74
+aotBlocks[15055] = @Aot871124_3a74
+aotBlocks[15059] = @Aot871124_3a74
+aotBlocks[15069] = @Aot871124_3a74
+aotBlocks[15073] = @Aot871124_3a74
+aotBlocks[15077] = @Aot871124_3a74
+aotBlocks[15080] = @Aot871124_3a74
+aotBlocks[15084] = @Aot871124_3a74
+aotBlocks[15089] = @Aot871124_3a74
+aotBlocks[15093] = @Aot871124_3a74
+aotBlocks[15101] = @Aot871124_3a74
+aotBlocks[15104] = @Aot871124_3a74
+aotBlocks[15107] = @Aot871124_3a74
+aotBlocks[15111] = @Aot871124_3a74
+aotBlocks[15115] = @Aot871124_3a74
+aotBlocks[15118] = @Aot871124_3a74
+aotBlocks[15121] = @Aot871124_3a74
+aotBlocks[15125] = @Aot871124_3a74
+aotBlocks[15129] = @Aot871124_3a74
+aotBlocks[15133] = @Aot871124_3a74
+aotBlocks[15136] = @Aot871124_3a74
+aotBlocks[15144] = @Aot871124_3a74
+aotBlocks[15147] = @Aot871124_3a74
+aotBlocks[15165] = @Aot871124_3b36
+aotBlocks[15171] = @Aot871124_3b36
+aotBlocks[16851] = @Aot871124_41c6
+aotBlocks[16869] = @Aot871124_41c6
+aotBlocks[16921] = @Aot871124_41c6
+aotBlocks[16929] = @Aot871124_421a
+aotBlocks[16937] = @Aot871124_421a
+aotBlocks[16951] = @Aot871124_421a
+aotBlocks[17059] = @Aot871124_4298
+aotBlocks[17067] = @Aot871124_4298
+aotBlocks[17071] = @Aot871124_4298
+aotBlocks[17079] = @Aot871124_4298
+aotBlocks[17081] = @Aot871124_4298
+aotBlocks[17575] = @Aot871124_4498
+aotBlocks[17599] = @Aot871124_4498
+aotBlocks[17603] = @Aot871124_4498
+aotBlocks[17611] = @Aot871124_4498
+aotBlocks[17620] = @Aot871124_4498
+aotBlocks[17626] = @Aot871124_4498
+aotBlocks[17630] = @Aot871124_4498
+aotBlocks[17634] = @Aot871124_4498
+aotBlocks[17646] = @Aot871124_4498
+aotBlocks[17651] = @Aot871124_4498
+aotBlocks[17663] = @Aot871124_4498
+aotBlocks[17666] = @Aot871124_4498
+aotBlocks[17670] = @Aot871124_4498
+aotBlocks[17677] = @Aot871124_4498
+aotBlocks[17681] = @Aot871124_4498
+aotBlocks[17689] = @Aot871124_4498
+aotBlocks[18193] = @Aot871124_470e
+aotBlocks[18238] = @Aot871124_470e
+aotBlocks[18245] = @Aot871124_470e
+aotBlocks[18248] = @Aot871124_470e
+aotBlocks[18303] = @Aot871124_477a
+aotBlocks[18307] = @Aot871124_477a
+aotBlocks[18314] = @Aot871124_477a
+aotBlocks[18327] = @Aot871124_4790
+aotBlocks[18336] = @Aot871124_4790
+aotBlocks[18338] = @Aot871124_4790
+aotBlocks[18339] = @Aot871124_4790
+aotBlocks[18354] = @Aot871124_4790
+aotBlocks[18381] = @Aot871124_4790
+aotBlocks[18388] = @Aot871124_4790
+aotBlocks[18389] = @Aot871124_4790
+aotBlocks[18405] = @Aot871124_47de
+aotBlocks[18409] = @Aot871124_47de
+aotBlocks[18411] = @Aot871124_47de
+aotBlocks[18412] = @Aot871124_47de
+aotBlocks[18427] = @Aot871124_47de
+aotBlocks[18454] = @Aot871124_47de
+aotBlocks[18479] = @Aot871124_47de
+aotBlocks[18480] = @Aot871124_47de
+aotBlocks[18495] = @Aot871124_4838
+aotBlocks[18499] = @Aot871124_4838
+aotBlocks[18506] = @Aot871124_4838
+aotBlocks[18510] = @Aot871124_4838
+aotBlocks[18517] = @Aot871124_4838
+aotBlocks[19009] = @Aot871124_4a40
+aotBlocks[19042] = @Aot871124_4a40
+aotBlocks[19043] = @Aot871124_4a40
+aotBlocks[19051] = @Aot871124_4a64
+aotBlocks[19054] = @Aot871124_4a64
+aotBlocks[19059] = @Aot871124_4a64
+aotBlocks[19086] = @Aot871124_4a64
+aotBlocks[19090] = @Aot871124_4a64
+aotBlocks[19102] = @Aot871124_4a64
+aotBlocks[19106] = @Aot871124_4a64
+aotBlocks[19133] = @Aot871124_4a64
+aotBlocks[19137] = @Aot871124_4a64
+aotBlocks[19164] = @Aot871124_4a64
+aotBlocks[19167] = @Aot871124_4a64
+aotBlocks[19174] = @Aot871124_4a64
+aotBlocks[19185] = @Aot871124_4a64
+aotBlocks[19188] = @Aot871124_4a64
+aotBlocks[19195] = @Aot871124_4a64
+aotBlocks[19215] = @Aot871124_4b06
+aotBlocks[19218] = @Aot871124_4b06
+aotBlocks[19229] = @Aot871124_4b06
+aotBlocks[19237] = @Aot871124_4b06
+aotBlocks[19245] = @Aot871124_4b06
+aotBlocks[19265] = @Aot871124_4b2e
+aotBlocks[19269] = @Aot871124_4b2e
+aotBlocks[19279] = @Aot871124_4b2e
+aotBlocks[19282] = @Aot871124_4b2e
+aotBlocks[19285] = @Aot871124_4b2e
+aotBlocks[19288] = @Aot871124_4b2e
+aotBlocks[19294] = @Aot871124_4b2e
+aotBlocks[19297] = @Aot871124_4b2e
+aotBlocks[19305] = @Aot871124_4b2e
+aotBlocks[19311] = @Aot871124_4b2e
+aotBlocks[19317] = @Aot871124_4b2e
+aotBlocks[19324] = @Aot871124_4b2e
+aotBlocks[19330] = @Aot871124_4b2e
+aotBlocks[19336] = @Aot871124_4b2e
+aotBlocks[19339] = @Aot871124_4b2e
+aotBlocks[19345] = @Aot871124_4b2e
+aotBlocks[19348] = @Aot871124_4b2e
+aotBlocks[19351] = @Aot871124_4b2e
+aotBlocks[19354] = @Aot871124_4b2e
+aotBlocks[19357] = @Aot871124_4b2e
+aotBlocks[19360] = @Aot871124_4b2e
+aotBlocks[19363] = @Aot871124_4b2e
+aotBlocks[19365] = @Aot871124_4b2e
+aotBlocks[19368] = @Aot871124_4b2e
+aotBlocks[19374] = @Aot871124_4b2e
+aotBlocks[19380] = @Aot871124_4b2e
+aotBlocks[19383] = @Aot871124_4b2e
+aotBlocks[19385] = @Aot871124_4b2e
+aotBlocks[19388] = @Aot871124_4b2e
+aotBlocks[19403] = @Aot871124_4b2e
+aotBlocks[19406] = @Aot871124_4b2e
+aotBlocks[19447] = @Aot871124_4bea
+aotBlocks[19488] = @Aot871124_4bea
+aotBlocks[19492] = @Aot871124_4bea
+aotBlocks[19518] = @Aot871124_4bea
+aotBlocks[19521] = @Aot871124_4bea
+aotBlocks[19529] = @Aot871124_4bea
+aotBlocks[19535] = @Aot871124_4bea
+aotBlocks[19545] = @Aot871124_4bea
+aotBlocks[19557] = @Aot871124_4c60
+aotBlocks[19593] = @Aot871124_4c82
+aotBlocks[19601] = @Aot871124_4c82
+aotBlocks[19605] = @Aot871124_4c82
+aotBlocks[19614] = @Aot871124_4c82
+aotBlocks[19627] = @Aot871124_4ca8
+aotBlocks[19645] = @Aot871124_4cb4
+aotBlocks[19649] = @Aot871124_4cb4
+aotBlocks[19651] = @Aot871124_4cb4
+aotBlocks[19669] = @Aot871124_4cb4
+aotBlocks[19673] = @Aot871124_4cb4
+aotBlocks[19684] = @Aot871124_4cb4
+aotBlocks[19691] = @Aot871124_4cb4
+aotBlocks[19694] = @Aot871124_4cb4
+aotBlocks[19697] = @Aot871124_4cb4
+aotBlocks[19703] = @Aot871124_4cb4
+aotBlocks[19705] = @Aot871124_4cb4
+aotBlocks[19711] = @Aot871124_4cb4
+aotBlocks[19714] = @Aot871124_4cb4
+aotBlocks[19717] = @Aot871124_4cb4
+aotBlocks[19721] = @Aot871124_4cb4
+aotBlocks[19728] = @Aot871124_4cb4
+aotBlocks[19731] = @Aot871124_4cb4
+aotBlocks[19734] = @Aot871124_4cb4
+aotBlocks[19736] = @Aot871124_4cb4
+aotBlocks[19739] = @Aot871124_4cb4
+aotBlocks[19740] = @Aot871124_4cb4
+aotBlocks[19742] = @Aot871124_4cb4
+aotBlocks[19744] = @Aot871124_4cb4
+aotBlocks[19747] = @Aot871124_4cb4
+aotBlocks[19748] = @Aot871124_4cb4
+aotBlocks[19750] = @Aot871124_4cb4
+aotBlocks[19875] = @Aot871124_4d94
+aotBlocks[19884] = @Aot871124_4d94
+aotBlocks[19888] = @Aot871124_4d94
+aotBlocks[19899] = @Aot871124_4d94
+aotBlocks[19902] = @Aot871124_4d94
+aotBlocks[19913] = @Aot871124_4d94
+aotBlocks[19918] = @Aot871124_4d94
+aotBlocks[19951] = @Aot871124_4ddc
+aotBlocks[19958] = @Aot871124_4ddc
+aotBlocks[19961] = @Aot871124_4ddc
+aotBlocks[19973] = @Aot871124_4ddc
+aotBlocks[19977] = @Aot871124_4ddc
+aotBlocks[19980] = @Aot871124_4ddc
+aotBlocks[19986] = @Aot871124_4ddc
+aotBlocks[19989] = @Aot871124_4ddc
+aotBlocks[19995] = @Aot871124_4ddc
+aotBlocks[19998] = @Aot871124_4ddc
+aotBlocks[20000] = @Aot871124_4ddc
+aotBlocks[20005] = @Aot871124_4ddc
+aotBlocks[20013] = @Aot871124_4ddc
+aotBlocks[20019] = @Aot871124_4ddc
+aotBlocks[20023] = @Aot871124_4ddc
+aotBlocks[20029] = @Aot871124_4ddc
+aotBlocks[20039] = @Aot871124_4ddc
+aotBlocks[20046] = @Aot871124_4ddc
+aotBlocks[20054] = @Aot871124_4ddc
+aotBlocks[20057] = @Aot871124_4ddc
+aotBlocks[20063] = @Aot871124_4ddc
+aotBlocks[20066] = @Aot871124_4ddc
+aotBlocks[20072] = @Aot871124_4ddc
+aotBlocks[20075] = @Aot871124_4ddc
+aotBlocks[20086] = @Aot871124_4ddc
+aotBlocks[20094] = @Aot871124_4ddc
+aotBlocks[20097] = @Aot871124_4ddc
+aotBlocks[20107] = @Aot871124_4ddc
+aotBlocks[20114] = @Aot871124_4ddc
+aotBlocks[20120] = @Aot871124_4ddc
+aotBlocks[20126] = @Aot871124_4ddc
+aotBlocks[20129] = @Aot871124_4ddc
+aotBlocks[20135] = @Aot871124_4ddc
+aotBlocks[20138] = @Aot871124_4ddc
+aotBlocks[20142] = @Aot871124_4ddc
+aotBlocks[20143] = @Aot871124_4ddc
+aotBlocks[20151] = @Aot871124_4ddc
+aotBlocks[20159] = @Aot871124_4ddc
+aotBlocks[20165] = @Aot871124_4ddc
+aotBlocks[20171] = @Aot871124_4ddc
+aotBlocks[20174] = @Aot871124_4ddc
+aotBlocks[20180] = @Aot871124_4ddc
+aotBlocks[20184] = @Aot871124_4ddc
+aotBlocks[20185] = @Aot871124_4ddc
+aotBlocks[20192] = @Aot871124_4ddc
+aotBlocks[20196] = @Aot871124_4ddc
+aotBlocks[20204] = @Aot871124_4ddc
+aotBlocks[20210] = @Aot871124_4ddc
+aotBlocks[20213] = @Aot871124_4ddc
+aotBlocks[20219] = @Aot871124_4ddc
+aotBlocks[20227] = @Aot871124_4ddc
+aotBlocks[20230] = @Aot871124_4ddc
+aotBlocks[20233] = @Aot871124_4ddc
+aotBlocks[20242] = @Aot871124_4ddc
+aotBlocks[20250] = @Aot871124_4ddc
+aotBlocks[20253] = @Aot871124_4ddc
+aotBlocks[20259] = @Aot871124_4ddc
+aotBlocks[20264] = @Aot871124_4ddc
+aotBlocks[20293] = @Aot871124_4f32
+aotBlocks[20304] = @Aot871124_4f32
+aotBlocks[20307] = @Aot871124_4f32
+aotBlocks[20310] = @Aot871124_4f32
+aotBlocks[20318] = @Aot871124_4f32
+aotBlocks[20321] = @Aot871124_4f32
+aotBlocks[20327] = @Aot871124_4f32
+aotBlocks[20330] = @Aot871124_4f32
+aotBlocks[20333] = @Aot871124_4f32
+aotBlocks[20337] = @Aot871124_4f32
+aotBlocks[20340] = @Aot871124_4f32
+aotBlocks[20343] = @Aot871124_4f32
+aotBlocks[20345] = @Aot871124_4f32
+aotBlocks[20346] = @Aot871124_4f32
+aotBlocks[20350] = @Aot871124_4f32
+aotBlocks[20353] = @Aot871124_4f32
+aotBlocks[20358] = @Aot871124_4f32
+aotBlocks[20361] = @Aot871124_4f32
+aotBlocks[20364] = @Aot871124_4f32
+aotBlocks[20370] = @Aot871124_4f32
+aotBlocks[20373] = @Aot871124_4f32
+aotBlocks[20376] = @Aot871124_4f32
+aotBlocks[20379] = @Aot871124_4f32
+aotBlocks[20387] = @Aot871124_4f32
+aotBlocks[20390] = @Aot871124_4f32
+aotBlocks[20398] = @Aot871124_4f32
+aotBlocks[20411] = @Aot871124_4f32
+aotBlocks[20415] = @Aot871124_4f32
+aotBlocks[20418] = @Aot871124_4f32
+aotBlocks[20422] = @Aot871124_4f32
+aotBlocks[20426] = @Aot871124_4f32
+aotBlocks[20444] = @Aot871124_4f32
+aotBlocks[20450] = @Aot871124_4f32
+aotBlocks[20455] = @Aot871124_4f32
+aotBlocks[20456] = @Aot871124_4f32
+aotBlocks[20464] = @Aot871124_4f32
+aotBlocks[20468] = @Aot871124_4f32
+aotBlocks[20472] = @Aot871124_4f32
+aotBlocks[20479] = @Aot871124_4f32
+aotBlocks[20485] = @Aot871124_4f32
+aotBlocks[20507] = @Aot871124_4f32
+aotBlocks[20510] = @Aot871124_4f32
+aotBlocks[20513] = @Aot871124_4f32
+aotBlocks[20517] = @Aot871124_4f32
+aotBlocks[20522] = @Aot871124_4f32
+aotBlocks[20523] = @Aot871124_4f32
+aotBlocks[20526] = @Aot871124_4f32
+aotBlocks[20529] = @Aot871124_4f32
+aotBlocks[20537] = @Aot871124_4f32
+aotBlocks[20541] = @Aot871124_4f32
+aotBlocks[20547] = @Aot871124_4f32
+aotBlocks[20550] = @Aot871124_4f32
+aotBlocks[20563] = @Aot871124_4f32
+aotBlocks[20569] = @Aot871124_4f32
+aotBlocks[20572] = @Aot871124_4f32
+aotBlocks[20574] = @Aot871124_4f32
+aotBlocks[20581] = @Aot871124_4f32
+aotBlocks[20584] = @Aot871124_4f32
+aotBlocks[20587] = @Aot871124_4f32
+aotBlocks[20590] = @Aot871124_4f32
+aotBlocks[20596] = @Aot871124_4f32
+aotBlocks[20600] = @Aot871124_4f32
+aotBlocks[20607] = @Aot871124_4f32
+aotBlocks[20626] = @Aot871124_4f32
+aotBlocks[20628] = @Aot871124_4f32
+aotBlocks[20635] = @Aot871124_4f32
+aotBlocks[20638] = @Aot871124_4f32
+aotBlocks[20644] = @Aot871124_4f32
+aotBlocks[21003] = @Aot871124_5202
+aotBlocks[21011] = @Aot871124_5202
+aotBlocks[21019] = @Aot871124_5202
+aotBlocks[21020] = @Aot871124_5202
+aotBlocks[21024] = @Aot871124_5202
+aotBlocks[21032] = @Aot871124_5202
+aotBlocks[21033] = @Aot871124_5202
+aotBlocks[21037] = @Aot871124_5202
+aotBlocks[21045] = @Aot871124_5202
+aotBlocks[21057] = @Aot871124_5236
+aotBlocks[21061] = @Aot871124_5236
+aotBlocks[21065] = @Aot871124_5236
+aotBlocks[21069] = @Aot871124_5236
+aotBlocks[21072] = @Aot871124_5236
+aotBlocks[21079] = @Aot871124_5236
+aotBlocks[21082] = @Aot871124_5236
+aotBlocks[21089] = @Aot871124_5236
+aotBlocks[21092] = @Aot871124_5236
+aotBlocks[21096] = @Aot871124_5236
+aotBlocks[21100] = @Aot871124_5236
+aotBlocks[21104] = @Aot871124_5236
+aotBlocks[21108] = @Aot871124_5236
+aotBlocks[21112] = @Aot871124_5236
+aotBlocks[21116] = @Aot871124_5236
+aotBlocks[21122] = @Aot871124_5236
+aotBlocks[21126] = @Aot871124_5236
+aotBlocks[21132] = @Aot871124_5236
+aotBlocks[21135] = @Aot871124_5236
+aotBlocks[21143] = @Aot871124_5236
+aotBlocks[21148] = @Aot871124_5236
+aotBlocks[21157] = @Aot871124_529e
+aotBlocks[27947] = @Aot871124_6d16
+aotBlocks[27951] = @Aot871124_6d16
+aotBlocks[27955] = @Aot871124_6d16
+aotBlocks[27958] = @Aot871124_6d16
+aotBlocks[27967] = @Aot871124_6d16
+aotBlocks[27973] = @Aot871124_6d16
+aotBlocks[27976] = @Aot871124_6d16
+aotBlocks[27980] = @Aot871124_6d16
+aotBlocks[27984] = @Aot871124_6d16
+aotBlocks[27987] = @Aot871124_6d16
+aotBlocks[27990] = @Aot871124_6d16
+aotBlocks[27994] = @Aot871124_6d16
+aotBlocks[28004] = @Aot871124_6d16
+aotBlocks[28007] = @Aot871124_6d16
+aotBlocks[28010] = @Aot871124_6d16
+aotBlocks[28011] = @Aot871124_6d16
+aotBlocks[28015] = @Aot871124_6d16
+aotBlocks[28019] = @Aot871124_6d16
+aotBlocks[28025] = @Aot871124_6d16
+aotBlocks[28030] = @Aot871124_6d16
+aotBlocks[28035] = @Aot871124_6d16
+aotBlocks[28039] = @Aot871124_6d16
+aotBlocks[28043] = @Aot871124_6d16
+aotBlocks[28046] = @Aot871124_6d16
+aotBlocks[28050] = @Aot871124_6d16
+aotBlocks[28052] = @Aot871124_6d16
+aotBlocks[28053] = @Aot871124_6d16
+aotBlocks[28056] = @Aot871124_6d16
+aotBlocks[28062] = @Aot871124_6d16
+aotBlocks[28065] = @Aot871124_6d16
+aotBlocks[28068] = @Aot871124_6d16
+aotBlocks[28072] = @Aot871124_6d16
+aotBlocks[28075] = @Aot871124_6d16
+aotBlocks[28079] = @Aot871124_6d16
+aotBlocks[28087] = @Aot871124_6d16
+aotBlocks[28090] = @Aot871124_6d16
+aotBlocks[28093] = @Aot871124_6d16
+aotBlocks[28098] = @Aot871124_6d16
+aotBlocks[28101] = @Aot871124_6d16
+aotBlocks[28108] = @Aot871124_6d16
+aotBlocks[28113] = @Aot871124_6d16
+aotBlocks[28116] = @Aot871124_6d16
+aotBlocks[28120] = @Aot871124_6d16
+aotBlocks[28124] = @Aot871124_6d16
+aotBlocks[28128] = @Aot871124_6d16
+aotBlocks[28132] = @Aot871124_6d16
+aotBlocks[28135] = @Aot871124_6d16
+aotBlocks[28142] = @Aot871124_6d16
+aotBlocks[28145] = @Aot871124_6d16
+aotBlocks[28149] = @Aot871124_6d16
+aotBlocks[28152] = @Aot871124_6d16
+aotBlocks[28157] = @Aot871124_6d16
+aotBlocks[28161] = @Aot871124_6d16
+aotBlocks[28164] = @Aot871124_6d16
+aotBlocks[28172] = @Aot871124_6d16
+aotBlocks[28175] = @Aot871124_6d16
+aotBlocks[28179] = @Aot871124_6d16
+aotBlocks[28185] = @Aot871124_6d16
+aotBlocks[28188] = @Aot871124_6d16
+aotBlocks[28198] = @Aot871124_6d16
+aotBlocks[28200] = @Aot871124_6d16
+aotBlocks[28205] = @Aot871124_6d16
+aotBlocks[28311] = @Aot871124_6e94
+aotBlocks[28315] = @Aot871124_6e94
+aotBlocks[28319] = @Aot871124_6e94
+aotBlocks[28323] = @Aot871124_6e94
+aotBlocks[29823] = @Aot871124_7478
+aotBlocks[29827] = @Aot871124_7478
+aotBlocks[29833] = @Aot871124_7478
+aotBlocks[29842] = @Aot871124_7478
+aotBlocks[29846] = @Aot871124_7478
+aotBlocks[31351] = @Aot871124_7a70
+aotBlocks[31354] = @Aot871124_7a70
+aotBlocks[31358] = @Aot871124_7a70
+aotBlocks[31361] = @Aot871124_7a70
+aotBlocks[31365] = @Aot871124_7a70
+aotBlocks[31369] = @Aot871124_7a70
+aotBlocks[31375] = @Aot871124_7a70
+aotBlocks[31378] = @Aot871124_7a70
+aotBlocks[31384] = @Aot871124_7a70
+aotBlocks[31387] = @Aot871124_7a70
+aotBlocks[31393] = @Aot871124_7a70
+aotBlocks[31396] = @Aot871124_7a70
+aotBlocks[31403] = @Aot871124_7a70
+aotBlocks[31407] = @Aot871124_7a70
+aotBlocks[31413] = @Aot871124_7a70
+aotBlocks[31416] = @Aot871124_7a70
+AotStories["34.871124"] = aotBlocks
@@ -0,0 +1,162 @@
+// Compiled routine check.
+//
+// Plays the story twice with the same commands, once with the compiled routines from
+// `aot-compile.py` and once interpreting everything, and compares the memory, global
+// variables, call stack, and screen after each command.  Reports the first difference.
+
+import_code("logging.gs")
+import_code("loadstory.gs")
+import_code("zscii_unicode.gs")
+import_code("opcodes_list.gs")
+import_code("cache.gs")
+import_code("machine.gs")
+import_code("screen.gs")
+import_code("opcodes_v3.gs")
+import_code("opcodes_v4.gs")
+import_code("opcodes_v5.gs")
+import_code("opcodes_v7.gs")
+import_code("interpreter.gs")
+import_code("streams.gs")
+import_code("native.gs")
+import_code("gamedata.gs")
+import_code("aot_minizork.gs")
+
+CHECK_COMMANDS = [
+    "open mailbox", "read leaflet", "drop leaflet", "south", "east", "open window",
+    "enter", "take all", "west", "move rug", "open trap door", "turn on lamp",
+    "down", "north", "inventory", "look", "score", "verbose", "brief", "wait",
+]
+
+// Most instructions a single turn may run before the check gives up on it.
+CHECK_TURN_LIMIT = 1000000
+
+// scriptedNative A native that types the commands, and keeps the last screen as text.
+scriptedNative = function(commands)
+    ret = Native.New(80, 20)
+    ret.commands = commands
+    ret.commandIdx = 0
+    ret.screen = ""
+    ret.DrawScreen = function(formatLines)
+        lines = []
+        for fmtParts in formatLines
+            line = ""
+            for fmt in fmtParts
+                line = line + fmt.t
+            end for
+            lines.push(line)
+        end for
+        self.screen = lines.join(char(10))
+    end function
+    ret.PauseForScroll = function()
+    end function
+    ret.ReadLine = function(maxChars, cursorColumn, cursorRow)
+        text = "look"
+        if self.commandIdx < self.commands.len then text = self.commands[self.commandIdx]
+        self.commandIdx = self.commandIdx + 1
+        zscii = []
+        for ch in text.values
+            if zscii.len >= maxChars then break
+            zsciiCh = self.convertInputToZscii(ch)
+            if zsciiCh > 0 then zscii.push(zsciiCh)
+        end for
+        return [true, zscii, text]
+    end function
+    return ret
+end function
+
+// runTurn Run the interpreter until it reads the next command.
+//
+// Both runs seed the random numbers the same way, so the `random` opcode agrees.
+// Returns true if the story completed.
+runTurn = function(interpreter, seed)
+    counters = interpreter.machine.Counters
+    turn = counters.turnCount
+    start = counters.instructions
+    rnd(seed)
+    completed = false
+    while not completed and counters.turnCount == turn
+        if counters.instructions - start > CHECK_TURN_LIMIT then exit("Turn " + turn + " ran over " + CHECK_TURN_LIMIT + " instructions")
+        completed = interpreter.RunBatch(2000)
+    end while
+    return completed
+end function
+
+// diffMachines The first difference between the two machines, or null if they match.
+diffMachines = function(compiled, interpreted)
+    if compiled.dynamicMemory.len != interpreted.dynamicMemory.len then
+        return "memory: " + compiled.dynamicMemory.len + " changed bytes, interpreted " + interpreted.dynamicMemory.len
+    end if
+    for address in compiled.dynamicMemory.indexes
+        if not interpreted.dynamicMemory.hasIndex(address) then return "memory @" + address + ": only written by the compiled run"
+        if compiled.dynamicMemory[address] != interpreted.dynamicMemory[address] then
+            return "memory @" + address + ": " + compiled.dynamicMemory[address] + ", interpreted " + interpreted.dynamicMemory[address]
+        end if
+    end for
+    for idx in compiled.globals.indexes
+        if compiled.globals[idx] != interpreted.globals[idx] then
+            return "global " + (idx + 16) + ": " + compiled.globals[idx] + ", interpreted " + interpreted.globals[idx]
+        end if
+    end for
+    if compiled.callStack.len != interpreted.callStack.len then
+        return "call stack depth: " + compiled.callStack.len + ", interpreted " + interpreted.callStack.len
+    end if
+    for idx in compiled.callStack.indexes
+        a = compiled.callStack[idx]
+        b = interpreted.callStack[idx]
+        if a[0] != b[0] then return "frame " + idx + " pc: " + a[0] + ", interpreted " + b[0]
+        if a[1] != b[1] then return "frame " + idx + " stack: " + a[1] + ", interpreted " + b[1]
+        if a[2] != b[2] then return "frame " + idx + " returns to: " + a[2] + ", interpreted " + b[2]
+        if a[3:] != b[3:] then return "frame " + idx + " locals: " + a[3:] + ", interpreted " + b[3:]
+    end for
+    return null
+end function
+
+main = function(args)
+    if args.len < 1 then
+        print("Usage: aotcheck (location of story file) [commands file]")
+        print("Plays the story with and without the compiled routines, and compares them after each command.")
+        print("The commands file has one command per line, such as a recording from output stream 4 ($14);")
+        print("without it, a short scripted walk is used.")
+        exit
+    end if
+    storyFile = get_shell.host_computer.File(args[0])
+    if storyFile == null then storyFile = get_shell.host_computer.File(current_path + "/" + args[0])
+    if storyFile == null then exit("Could not find story file " + args[0])
+    story = FileLoader.A85Reader(storyFile.get_content)
+    if story == null then exit("Failed to decode Ascii85 encoded file " + storyFile.path)
+    commands = CHECK_COMMANDS
+    if args.len > 1 then
+        commands = ReadStreamLines(args[1])
+        if commands == null then exit("Could not find commands file " + args[1])
+    end if
+
+    compiledNative = scriptedNative(commands)
+    compiled = Interpreter.New(story, compiledNative)
+    if compiled.machine.Aot == null then exit("No compiled routines for story " + compiled.machine.ReleaseNumber + "." + compiled.machine.SerialNumber)
+    interpretedNative = scriptedNative(commands)
+    interpreted = Interpreter.New(story, interpretedNative)
+    interpreted.machine.Aot = null
+
+    // One more turn than commands, for the response to the last one.
+    for turn in range(0, commands.len)
+        doneA = runTurn(compiled, turn + 1)
+        doneB = runTurn(interpreted, turn + 1)
+        diff = diffMachines(compiled.machine, interpreted.machine)
+        if diff == null and compiledNative.screen != interpretedNative.screen then diff = "screen text"
+        if diff == null and doneA != doneB then diff = "story completed: " + doneA + ", interpreted " + doneB
+        if diff != null then
+            command = "(start)"
+            if turn > 0 then command = commands[turn - 1]
+            print("Turn " + turn + ", after '" + command + "': " + diff)
+            print("Compiled screen:" + char(10) + compiledNative.screen)
+            print("Interpreted screen:" + char(10) + interpretedNative.screen)
+            exit
+        end if
+        if doneA then break
+    end for
+    counters = compiled.machine.Counters
+    print("No differences in " + counters.turnCount + " turns.")
+    print("Compiled " + counters.compiledInstructions + " of " + counters.instructions + " instructions; interpreted run took " + interpreted.machine.Counters.instructions + ".")
+end function
+
+if locals == globals then main(params)
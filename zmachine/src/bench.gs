@@ -0,0 +1,96 @@
+// Interpreter benchmark.
+//
+// Runs the story with scripted commands and no screen output, and reports the time
+// per instruction.  Compare the `src` build against the `release-build.py` build
+// to see what the logging costs.
+
+import_code("logging.gs")
+import_code("loadstory.gs")
+import_code("zscii_unicode.gs")
+import_code("opcodes_list.gs")
+import_code("cache.gs")
+import_code("machine.gs")
+import_code("screen.gs")
+import_code("opcodes_v3.gs")
+import_code("opcodes_v4.gs")
+import_code("opcodes_v5.gs")
+import_code("opcodes_v7.gs")
+import_code("interpreter.gs")
+import_code("streams.gs")
+import_code("native.gs")
+import_code("gamedata.gs")
+import_code("aot_minizork.gs")
+
+BENCH_COMMANDS = [
+    "open mailbox", "read leaflet", "drop leaflet", "south", "east", "open window",
+    "enter", "take all", "west", "move rug", "open trap door", "turn on lamp",
+    "down", "north", "inventory", "look",
+]
+
+main = function(args)
+    if args.len < 1 then
+        print("Usage: bench (location of story file) [instruction count [--profile] [--no-aot] [--commands (file)]]")
+        print("Runs the story with scripted commands, and reports the time per instruction.")
+        print("Use --commands to play a command recording from output stream 4 ($14) instead.")
+        print("Use --profile to also time the instruction decoding separately from the execution,")
+        print("and count the calls to each routine for aot-compile.py.")
+        print("Use --no-aot to interpret the compiled routines too.")
+        exit
+    end if
+    storyFile = get_shell.host_computer.File(args[0])
+    if storyFile == null then storyFile = get_shell.host_computer.File(current_path + "/" + args[0])
+    if storyFile == null then exit("Could not find story file " + args[0])
+    story = FileLoader.A85Reader(storyFile.get_content)
+    if story == null then exit("Failed to decode Ascii85 encoded file " + storyFile.path)
+    maxCount = 200000
+    if args.len > 1 then maxCount = args[1].to_int
+    commands = BENCH_COMMANDS
+    commandsArg = args.indexOf("--commands")
+    if commandsArg != null then
+        if commandsArg + 1 >= args.len then exit("--commands requires a file name")
+        commands = ReadStreamLines(args[commandsArg + 1])
+        if commands == null then exit("Could not find commands file " + args[commandsArg + 1])
+    end if
+
+    native = Native.New(80, 20)
+    native.commands = commands
+    native.commandIdx = 0
+    native.DrawScreen = function(formatLines)
+    end function
+    native.PauseForScroll = function()
+    end function
+    native.ReadLine = function(maxChars, cursorColumn, cursorRow)
+        text = "look"
+        if self.commandIdx < self.commands.len then text = self.commands[self.commandIdx]
+        self.commandIdx = self.commandIdx + 1
+        zscii = []
+        for ch in text.values
+            if zscii.len >= maxChars then break
+            zsciiCh = self.convertInputToZscii(ch)
+            if zsciiCh > 0 then zscii.push(zsciiCh)
+        end for
+        return [true, zscii, text]
+    end function
+
+    startLoad = time
+    interpreter = Interpreter.New(story, native)
+    loadTime = time - startLoad
+    counters = interpreter.machine.Counters
+    if args.indexOf("--profile") != null then counters.Profile = true
+    if args.indexOf("--no-aot") != null then interpreter.machine.Aot = null
+    completed = false
+    while not completed and counters.instructions < maxCount
+        budget = maxCount - counters.instructions
+        if budget > 2000 then budget = 2000
+        completed = interpreter.RunBatch(budget)
+    end while
+    print("Story load:   " + round(loadTime, 3) + " seconds")
+    print("Commands:     " + native.commandIdx)
+    print(counters.Summary().join(char(10)))
+    if counters.instructions > 0 then print("Per instruction: " + round(1000000 * counters.runTime / counters.instructions, 2) + " us")
+    res = native.SaveDebugFile("zmachine-bench.txt", counters.Dump())
+    if res == null then res = "Wrote the counters to ~/zmachine-bench.txt"
+    print(res)
+end function
+
+if locals == globals then main(params)
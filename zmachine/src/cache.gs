@@ -0,0 +1,102 @@
+// Bounded caches, for the decoded story data.
+//
+// Each cache holds up to its budget of characters, counting the text of each entry plus
+// CACHE_ENTRY_OVERHEAD for the entry itself.  Once it's over budget, it evicts the least
+// recently used ("lru") or least often used ("lfu") entries, down to 3/4 of the budget,
+// so that the eviction's sort runs now and then instead of on every new entry.
+//
+// `cache-sim.py` replays the string trace from a profiled counter dump through these
+// policies and budgets, to pick the defaults below.  The string lookups follow the
+// player from room to room, so lru keeps more of them than lfu; 64K characters holds
+// all of a small version 3 story's text, and bounds the larger stories.
+
+CACHE_ENTRY_OVERHEAD = 24
+
+// Budget for each machine cache, in characters.
+CACHE_BUDGETS = {
+    "strings": 65536,
+    "abbreviations": 8192,
+    "dictionaries": 65536,
+}
+CACHE_POLICY = "lru"
+
+BoundedCache = {}
+BoundedCache.New = function(name, budget = null, policy = null)
+    ret = new BoundedCache
+    ret.name = name
+    if budget == null then budget = CACHE_BUDGETS[name]
+    if policy == null then policy = CACHE_POLICY
+    ret.budget = budget
+    ret.policy = policy
+    // key -> [value, size, last use, use count]
+    ret.entries = {}
+    ret.size = 0
+    ret.peakSize = 0
+    ret.tick = 0
+    ret.hits = 0
+    ret.misses = 0
+    ret.evictions = 0
+    return ret
+end function
+
+// Get The cached value for the key, or null if it isn't cached.
+BoundedCache.Get = function(key)
+    if not self.entries.hasIndex(key) then
+        self.misses = self.misses + 1
+        return null
+    end if
+    self.hits = self.hits + 1
+    self.tick = self.tick + 1
+    entry = self.entries[key]
+    entry[2] = self.tick
+    entry[3] = entry[3] + 1
+    return entry[0]
+end function
+
+// Put Cache the value, which has size characters of content.
+//
+// Values larger than the whole budget aren't cached.
+BoundedCache.Put = function(key, value, size)
+    size = size + CACHE_ENTRY_OVERHEAD
+    if size > self.budget then return
+    if self.entries.hasIndex(key) then self.size = self.size - self.entries[key][1]
+    self.tick = self.tick + 1
+    self.entries[key] = [value, size, self.tick, 1]
+    self.size = self.size + size
+    if self.size > self.peakSize then self.peakSize = self.size
+    if self.size > self.budget then self.evict
+end function
+
+// evict Remove entries until the cache is down to 3/4 of its budget.
+BoundedCache.evict = function()
+    target = floor(self.budget * 3 / 4)
+    order = []
+    weight = 0
+    if self.policy == "lfu" then weight = self.tick + 1
+    for key in self.entries.indexes
+        entry = self.entries[key]
+        // lfu orders by use count, then last use; lru by last use alone.
+        order.push({"k": key, "o": (entry[3] * weight) + entry[2]})
+    end for
+    order.sort("o")
+    for item in order
+        if self.size <= target then break
+        self.size = self.size - self.entries[item.k][1]
+        self.entries.remove(item.k)
+        self.evictions = self.evictions + 1
+    end for
+end function
+
+// Clear Remove all the entries, keeping the counters.
+BoundedCache.Clear = function()
+    self.entries = {}
+    self.size = 0
+end function
+
+// Summary The cache counters, as one line.
+BoundedCache.Summary = function()
+    lookups = self.hits + self.misses
+    rate = 0
+    if lookups > 0 then rate = round(100 * self.hits / lookups, 1)
+    return self.name + ": " + self.entries.len + " entries, " + self.size + " / " + self.budget + " (peak " + self.peakSize + ", " + self.policy + "), " + self.hits + " hits, " + self.misses + " misses (" + rate + "% hit), " + self.evictions + " evictions"
+end function
@@ -7,34 +7,140 @@ Interpreter.New = function(storyData, native)
     ret.machine = MachineState.New(storyData, native)
     ret.FileVersion = ret.machine.FileVersion
     ret.machine.StartGame()
-    //for line in self.DumpStr()
-    //    ret.log.Debug(line)
-    //end for
+    ret.log.LogWith(Logger.DEBUG, @DumpMachineText, ret.machine)
     return ret
 end function
 
-// Run Interpret some of the game.
+// Run Interpret one instruction.
 //
+// This doesn't update the performance counters; RunBatch does.
 // Returns true if completed.
 Interpreter.Run = function()
-    self.log.Debug("Fetching next instruction")
+    if self.log.IsDebug then self.log.Debug("Fetching next instruction")
     instruction = self.machine.NextInstruction()
     if instruction == null then
-        self.log.Debug("null instruction fetched")
+        if self.log.IsDebug then self.log.Debug("null instruction fetched")
         return true
     end if
-    // Set the PC for this frame.  In most cases, that's the
-    // right behavior.  Calls will return to the instruction *after* this one.
-    // On return and jump opcodes, the opcode will explicitly change the PC.
-    self.machine.JumpToAddress(instruction[2])
-    return not self.HandleInstruction(instruction)
+    return not self.Execute(instruction)
+end function
+
+// RunBatch Interpret up to the budget of instructions, returning early after the game reads input.
+//
+// This is the same as calling Run up to budget times, but with the lookups kept in locals,
+// and with Execute written out in the loop.  Where the story has compiled routines (see
+// aot-compile.py), MachineState.EnterRoutine runs one when it's called, and this picks one
+// back up when the interpreter reaches one of its block starts, such as after a call to an
+// interpreted routine returns.
+// Returns true if completed.
+Interpreter.RunBatch = function(budget = 2000)
+    machine = self.machine
+    counters = machine.Counters
+    if counters.Profile then return self.runProfiled(budget)
+    aot = machine.Aot
+    opcodes = Opcodes
+    stdTable = STD_OPCODE_TABLE
+    extTable = EXT_OPCODE_TABLE
+    turn = counters.turnCount
+    completed = false
+    count = 0
+    counters.StartRun()
+    while count < budget
+        if machine.callStack.len <= 0 then exit("No call stack frame")
+        frame = machine.callStack[-1]
+        pc = frame[0]
+        if aot != null then
+            if aot.hasIndex(pc) then
+                compiled = @aot[pc]
+                machine.CompiledRan = machine.CompiledRan + compiled(machine, frame, pc)
+            end if
+            if machine.CompiledRan > 0 then
+                count = count + self.chargeCompiled(counters)
+                if counters.turnCount != turn then break
+                // Check the budget, and the call stack, again before going on.
+                continue
+            end if
+        end if
+        instruction = machine.instructionAt(pc, stdTable, extTable)
+        count = count + 1
+        if instruction == null then
+            completed = true
+            break
+        end if
+        // The rest is Execute.
+        frame[0] = instruction[2]
+        mnemonic = instruction[0]
+        if not opcodes.hasIndex(mnemonic) then
+            self.log.Error("Unsupported opcode " + mnemonic)
+            completed = true
+            break
+        end if
+        runner = @opcodes[mnemonic]
+        res = runner(machine, instruction[1], instruction[3], instruction[4])
+        if res != null and not res then
+            completed = true
+            break
+        end if
+        // After reading input, let the caller have a turn too.
+        if counters.turnCount != turn then break
+    end while
+    count = count + self.chargeCompiled(counters)
+    counters.instructions = counters.instructions + count
+    counters.StopRun()
+    return completed
+end function
+
+// runProfiled RunBatch, also timing the instruction decode separately from the execution.
+Interpreter.runProfiled = function(budget)
+    machine = self.machine
+    counters = machine.Counters
+    turn = counters.turnCount
+    completed = false
+    count = 0
+    counters.StartRun()
+    while count < budget and not completed
+        t0 = time
+        instruction = machine.NextInstruction()
+        t1 = time
+        counters.decodeTime = counters.decodeTime + t1 - t0
+        count = count + 1
+        if instruction == null then
+            completed = true
+            break
+        end if
+        inputTime = counters.inputTime
+        completed = not self.Execute(instruction)
+        // Don't count the time waiting on input.
+        counters.executeTime = counters.executeTime + time - t1 - (counters.inputTime - inputTime)
+        count = count + self.chargeCompiled(counters)
+        if counters.turnCount != turn then break
+    end while
+    counters.instructions = counters.instructions + count
+    counters.StopRun()
+    return completed
 end function
 
-// HandleInstruction Handle the instruction.
+// chargeCompiled Count the instructions the compiled routines ran since the last charge.
+//
+// Returns the number, for the batch to add to its instruction count.
+Interpreter.chargeCompiled = function(counters)
+    ran = self.machine.CompiledRan
+    if ran <= 0 then return 0
+    self.machine.CompiledRan = 0
+    counters.compiledInstructions = counters.compiledInstructions + ran
+    return ran
+end function
+
+// Execute Run the instruction, after moving the PC past it.
 //
 // instruction is the value returned by the machine state's instructionAt.
-Interpreter.HandleInstruction = function(instruction)
+// Returns false if the game is over, or the opcode isn't supported.
+Interpreter.Execute = function(instruction)
     if instruction == null then return false
+    // Set the PC for this frame.  In most cases, that's the
+    // right behavior.  Calls will return to the instruction *after* this one.
+    // On return and jump opcodes, the opcode will explicitly change the PC.
+    self.machine.callStack[-1][0] = instruction[2]
     mnemonic = instruction[0]
     if not Opcodes.hasIndex(mnemonic) then
         self.log.Error("Unsupported opcode " + mnemonic)
@@ -70,6 +176,11 @@ Interpreter.DumpStr = function()
     return DumpMachine(self.machine)
 end function
 
+// DumpMachineText The DumpMachine lines as one string, for Logger.LogWith.
+DumpMachineText = function(machine)
+    return char(10) + DumpMachine(machine).join(char(10))
+end function
+
 DumpMachine = function(machine)
     toHex = function(num, count=4)
         if num == null then return "(null)"
@@ -119,10 +230,19 @@ DumpMachine = function(machine)
         "    **** Abbreviations ****",
         "",
     ]
-    for index in machine.cachedAbbreviations.indexes
-        ret.push("[" + index + "] '" + machine.cachedAbbreviations[index] + "'")
+    abbreviations = machine.cachedAbbreviations.entries
+    for index in abbreviations.indexes
+        ret.push("[" + index + "] '" + abbreviations[index][0] + "'")
     end for
 
+    ret = ret + ["", "    **** Caches ****", ""]
+    for cache in [machine.cachedStrings, machine.cachedAbbreviations, machine.cachedDictionaries]
+        ret.push(cache.Summary())
+    end for
+
+    ret = ret + ["", "    **** Streams ****", ""]
+    ret = ret + machine.native.StreamSummary()
+
     ret = ret + ["", "    **** Story file default dictionary ****", ""]
     // self.log.Debug("Generating the dictionary at " + toHex(machine.DictionaryAddress))
     dict = machine.ParseDictionary(machine.DictionaryAddress).dict
@@ -9,10 +9,24 @@ Logger.ERROR = 5
 Logger.New = function(src)
     ret = new Logger
     ret.src = src
-    ret.level = Logger.WARNING
+    ret.SetLevel(Logger.WARNING)
     return ret
 end function
 
+// SetLevel Change the lowest level logged.
+//
+// Hot code paths check the Is* flags before building the message, so that
+// nothing is built when the level is off:
+//     if self.log.IsTrace then self.log.Trace("frame " + frame)
+// A message that takes more than an expression to build can be left to LogWith.
+Logger.SetLevel = function(level)
+    self.level = level
+    self.IsTrace = level <= Logger.TRACE
+    self.IsDebug = level <= Logger.DEBUG
+    self.IsVerbose = level <= Logger.VERBOSE
+    self.IsInfo = level <= Logger.INFO
+end function
+
 Logger.LEVELNAME = {
     Logger.TRACE:   "<color=#606060>[TRACE] ",
     Logger.DEBUG:   "<color=#808080>[DEBUG] ",
@@ -27,6 +41,17 @@ Logger.Log = function(level, msg)
     end if
 end function
 
+// LogWith Log the message built by calling format(arg), only if the level is logged.
+//
+// The format function isn't called when the level is off, so the message can be
+// expensive to build, such as a dump of the machine state.  This still costs a call,
+// so the per-instruction code uses the Is* flags instead.
+Logger.LogWith = function(level, format, arg)
+    if self.level <= level then
+        print(Logger.LEVELNAME[level] + format(arg))
+    end if
+end function
+
 Logger.Trace = function(msg)
     self.Log(Logger.TRACE, msg)
 end function
@@ -54,8 +79,141 @@ end function
 // OpCodeLogger Logger used by opcodes.
 OpCodeLogger = Logger.New("opcodes")
 
+// ====================================================================
+// Performance counters
+//
+// Collected by the machine and the interpreter's RunBatch.  A turn ends each time
+// the game reads a line of input; the time spent waiting on the input isn't counted.
+// Decode vs. execute time is only measured while Profile is on, because it costs two
+// extra `time` calls per instruction.
+
+PerfCounters = {}
+PerfCounters.New = function()
+    ret = new PerfCounters
+    ret.Profile = false
+    ret.instructions = 0
+    // Instructions run by compiled routines (see aot-compile.py); also in instructions.
+    ret.compiledInstructions = 0
+    ret.routineCalls = 0
+    // Calls to each routine, by routine address; only counted while profiling.
+    ret.routines = {}
+    // "address:length" of each static string looked up, for `cache-sim.py`; only recorded while profiling.
+    ret.stringTrace = []
+    ret.maxStringTrace = 20000
+    ret.stringDecodes = 0
+    ret.stringCacheHits = 0
+    ret.runTime = 0
+    ret.decodeTime = 0
+    ret.executeTime = 0
+    ret.inputTime = 0
+    // Start time of the current run, or null when not running.
+    ret.runStart = null
+    // Counter values at the start of the turn.
+    ret.turnMark = ret.values
+    // Per turn rows, in PerfCounters.COLUMNS order.
+    ret.turns = []
+    ret.turnCount = 0
+    ret.maxTurns = 500
+    return ret
+end function
+
+PerfCounters.COLUMNS = ["turn", "instructions", "routineCalls", "stringDecodes", "stringCacheHits", "runTime", "decodeTime", "executeTime"]
+
+PerfCounters.values = function()
+    return [self.instructions, self.routineCalls, self.stringDecodes, self.stringCacheHits, self.runTime, self.decodeTime, self.executeTime]
+end function
+
+// StartRun Start timing the instructions.
+PerfCounters.StartRun = function()
+    self.runStart = time
+end function
+
+// StopRun Stop timing the instructions.
+PerfCounters.StopRun = function()
+    if self.runStart != null then self.runTime = self.runTime + time - self.runStart
+    self.runStart = null
+end function
+
+// EndTurn Record the counters for the turn that just ended.
+PerfCounters.EndTurn = function()
+    self.StopRun
+    now = self.values
+    row = [self.turnCount]
+    for idx in now.indexes
+        row.push(now[idx] - self.turnMark[idx])
+    end for
+    self.turns.push(row)
+    if self.turns.len > self.maxTurns then self.turns.pull
+    self.turnMark = now
+    self.turnCount = self.turnCount + 1
+end function
+
+// TraceString Record a static string lookup, up to maxStringTrace of them.
+PerfCounters.TraceString = function(address, length)
+    if self.stringTrace.len < self.maxStringTrace then self.stringTrace.push(address + ":" + length)
+end function
+
+// Summary Human readable counter totals, as a list of lines.
+PerfCounters.Summary = function()
+    rate = 0
+    if self.runTime > 0 then rate = round(self.instructions / self.runTime)
+    turns = self.turnCount
+    if turns < 1 then turns = 1
+    ret = [
+        "Instructions:      " + self.instructions + " (" + rate + " per second)",
+        "Run time:          " + round(self.runTime, 3) + " seconds, waiting on input " + round(self.inputTime, 3) + " seconds",
+        "Turns:             " + self.turnCount,
+        "Compiled:          " + self.compiledInstructions + " instructions",
+        "Routine calls:     " + self.routineCalls + " (" + round(self.routineCalls / turns, 1) + " per turn)",
+        "String decodes:    " + self.stringDecodes + " (" + round(self.stringDecodes / turns, 1) + " per turn, " + self.stringCacheHits + " cache hits)",
+    ]
+    if self.Profile or self.decodeTime > 0 then
+        ret.push("Decode / execute:  " + round(self.decodeTime, 3) + " / " + round(self.executeTime, 3) + " seconds (profiling " + self.Profile + ")")
+    end if
+    if self.turns.len > 0 then
+        last = self.turns[-1]
+        ret.push("Last turn:         " + last[1] + " instructions, " + last[2] + " routine calls, " + last[3] + " string decodes, " + round(last[5], 3) + " seconds")
+    end if
+    return ret
+end function
+
+// Dump The counters as text, for `perf-report.py`.
+//
+// "key=value" total lines, then a "columns=" line, then one comma separated row per turn.
+PerfCounters.Dump = function()
+    ret = [
+        "# zmachine performance counters",
+        "instructions=" + self.instructions,
+        "compiledInstructions=" + self.compiledInstructions,
+        "routineCalls=" + self.routineCalls,
+        "stringDecodes=" + self.stringDecodes,
+        "stringCacheHits=" + self.stringCacheHits,
+        "runTime=" + self.runTime,
+        "decodeTime=" + self.decodeTime,
+        "executeTime=" + self.executeTime,
+        "inputTime=" + self.inputTime,
+        "turns=" + self.turnCount,
+    ]
+    // The routine call counts, for `aot-compile.py --profile`.
+    for address in self.routines.indexes.sort
+        ret.push("routine@" + address + "=" + self.routines[address])
+    end for
+    // The string lookups, for `cache-sim.py`.
+    if self.stringTrace.len > 0 then ret.push("stringTrace=" + self.stringTrace.join(","))
+    ret.push("columns=" + PerfCounters.COLUMNS.join(","))
+    for row in self.turns
+        ret.push(row.join(","))
+    end for
+    return ret.join(char(10))
+end function
+
 // ====================================================================
 // Deep level debug controls
+
+// Set to true along with enabling the MachineLog functions below.
+// The calls are guarded by this, so the log text isn't built when it's off.
+MACHINE_LOG = false
+
 //   == 0 - normal
 //   == 1 - don't clear the screen
 //   == 2 - draw the low-level text formatting
@@ -29,7 +29,7 @@ MachineState.New = function(storyData, native)
     ret.screen = Screen.New(native.ScreenWidth, native.ScreenHeight)
     ret.native = native
     ret.log = Logger.New("mcst")
-    ret.log.Debug("Loading " + storyData.len + " byte story.")
+    if ret.log.IsDebug then ret.log.Debug("Loading " + storyData.len + " byte story.")
 
     // storyData The original story.
     //
@@ -52,9 +52,15 @@ MachineState.New = function(storyData, native)
 
     // callStack The state of execution within the story.
     //
-    // The call stack is the "call..." references + initial game play.  It stores
-    // the stack ("stack") (accessed via variable number 0x00), the code pointer ("pc"),
-    // and local variables ("locals") (variable reference 0x01 to 0x0f).
+    // The call stack is the "call..." references + initial game play.  Each frame
+    // is a fixed slot list, [pc, stack, returnsRef, local 1, local 2, ...]:
+    //   [0] the code pointer;
+    //   [1] the stack (accessed via variable number 0x00);
+    //   [2] the variable reference that the routine's return value is stored in;
+    //   [3...] the local variables (variable reference 0x01 to 0x0f), so local
+    //      variable reference N is at frame[N + 2].
+    // Use NewFrame to create one.  A frame is 2 allocations (the frame and its
+    // stack), and each slot lookup is a list index; see frame-model.py.
     //
     // Current execution is the last item (callStack[-1]).
     //
@@ -66,6 +72,11 @@ MachineState.New = function(storyData, native)
     // the static memory address.
     ret.dynamicMemory = {}
 
+    // globals The 240 global variables (0x10 to 0xff), as words.
+    // This mirrors the global variables table in memory, so that the variable lookup
+    // is a list index.  Every memory write into the table updates it; see loadGlobals.
+    ret.globals = []
+
     // In Version 6, the Z-machine understands a "user stack",
     // which is a table of words in dynamic memory.  However, v6 isn't supported here.
 
@@ -188,6 +199,13 @@ MachineState.New = function(storyData, native)
         end if
     end for
 
+    // Compiled routines for this story (see aot-compile.py), by block start address, or null.
+    ret.Aot = null
+    storyId = ret.ReleaseNumber + "." + ret.SerialNumber
+    if globals.hasIndex("AotStories") and AotStories.hasIndex(storyId) then ret.Aot = AotStories[storyId]
+    // Instructions run by compiled routines entered from calls, not yet charged to a batch.
+    ret.CompiledRan = 0
+
     // AbbreviationsTableAddress Location of abbreviations table (byte address)
     ret.AbbreviationsTableAddress = (storyData[24] * 256) + storyData[25] // 0x18, 0x19
 
@@ -285,19 +303,23 @@ MachineState.New = function(storyData, native)
     // Stream 3 is a stack containing a map if {"address": 0, "buffer": []}
     ret.Stream3 = []
 
-    // Stream 4 is just user input.  It's pushed to the native handler.
+    // Stream 4 is just user input.  It's pushed to the native handler, which records
+    // it for input stream 1 to replay.
     ret.Stream4Active = false
 
-    // strings by memory address
-    ret.cachedStrings = {}
+    // [text, encoded length] by memory address; see cache.gs
+    ret.cachedStrings = BoundedCache.New("strings")
+
+    // Performance counters; see logging.gs
+    ret.Counters = PerfCounters.New()
 
     // parsed dictionary tables by memory address
     // Each value is map of { entry name: [address, index] }
-    ret.cachedDictionaries = {}
+    ret.cachedDictionaries = BoundedCache.New("dictionaries")
 
     // Initialize the zscii table, based on the current version information.
-    ret.log.Debug("Initializing the zscii alphabet table")
-    ret.cachedAbbreviations = {}
+    if ret.log.IsDebug then ret.log.Debug("Initializing the zscii alphabet table")
+    ret.cachedAbbreviations = BoundedCache.New("abbreviations")
     ret.zsciiAlphabetTableInit()
     native.SetZsciiUnicodeTable(ret.zsciiSpecialUnicode)
 
@@ -316,7 +338,7 @@ end function
 
 // UpdateScreenRef Update the machine state to reflect changes to the output screen.
 MachineState.UpdateScreenRef = function()
-    self.log.Debug("Updating the header screen values")
+    if self.log.IsDebug then self.log.Debug("Updating the header screen values")
 
     // This is using the screen object's width/height, not the native values.
     // The screen may have its own things between the game's view of the output
@@ -371,7 +393,7 @@ MachineState.GetVariableRef = function(variableRef)
     if variableRef >= 16 then return self.getGlobalVariable(variableRef)
     if variableRef == 0 then
         // get from the stack
-        stack = self.callStack[-1].stack
+        stack = self.callStack[-1][1]
         if stack.len > 0 then
             // self.log.Trace(":: Stack (" + stack[-1] + ")")
             return stack[-1]
@@ -379,11 +401,11 @@ MachineState.GetVariableRef = function(variableRef)
         self.log.Info("Getting variable reference from empty stack")
         return null
     end if
-    callLocals = self.callStack[-1].locals
-    // variableRef will reference index - 1
-    self.log.Trace(" - Getting from local variables " + callLocals)
-    if callLocals.len < variableRef then return 0
-    return callLocals[variableRef - 1]
+    frame = self.callStack[-1]
+    // variableRef will reference index + 2
+    if self.log.IsTrace then self.log.Trace(" - Getting from local variables " + frame[3:])
+    if frame.len < variableRef + 3 then return 0
+    return frame[variableRef + 2]
 end function
 
 // SetVariableRef Set the variable reference value.
@@ -392,41 +414,27 @@ MachineState.SetVariableRef = function(variableRef, value)
     // should this check that the value is in range?
     if variableRef == 0 then
         // push onto the stack
-        self.log.Trace(":: Stack <- " + value)
-        MachineLogln("  [stack <- " + value + "]")
-        self.callStack[-1].stack.push(value)
+        if self.log.IsTrace then self.log.Trace(":: Stack <- " + value)
+        if MACHINE_LOG then MachineLogln("  [stack <- " + value + "]")
+        self.callStack[-1][1].push(value)
         return
     end if
-    callLocals = self.callStack[-1].locals
-    // variableRef will reference index - 1
+    frame = self.callStack[-1]
+    // variableRef will reference index + 2
     // Really, the variable size is set in the routine header, so this
     // should cause a failure if the variable ref > size.
-    while callLocals.len < variableRef
-        callLocals.push(0)
+    while frame.len < variableRef + 3
+        frame.push(0)
     end while
-    self.log.Trace(":: Local " + (variableRef - 1) + " <- " + value)
-    MachineLogln("  [local " + (variableRef - 1) + " <- " + value + "]")
-    callLocals[variableRef - 1] = value
+    if self.log.IsTrace then self.log.Trace(":: Local " + (variableRef - 1) + " <- " + value)
+    if MACHINE_LOG then MachineLogln("  [local " + (variableRef - 1) + " <- " + value + "]")
+    frame[variableRef + 2] = value
 end function
 
 // getGlobalVariable Get the global variable as the opcode references it (number between 0x10 and 0xff)
 MachineState.getGlobalVariable = function(variable)
     if variable < 16 or variable > 255 then exit("Invalid variable reference " + variable)
-
-    address = self.GlobalVariablesTableAddress + ((variable - 16) * 2)  // 0x10
-    // self.log.Trace("Getting global variable " + variable + " @" + address)
-    hi = self.storyData[address]
-    if self.dynamicMemory.hasIndex(address) then
-        hi = self.dynamicMemory[address]
-    end if
-    address = address + 1
-    lo = self.storyData[address]
-    if self.dynamicMemory.hasIndex(address) then
-        lo = self.dynamicMemory[address]
-    end if
-    ret = (hi * 256) + lo
-    // self.log.Trace(" -> " + ret)
-    return ret
+    return self.globals[variable - 16]
 end function
 
 // setGlobalVariable Set the global variable as the opcode references it (number between 0x10 and 0xff)
@@ -435,11 +443,31 @@ MachineState.setGlobalVariable = function(variable, value)
     if value < 0 or value > 65535 then exit("Invalid variable value " + value)
     // Set the changed value store.
     address = self.GlobalVariablesTableAddress + ((variable - 16) * 2)  // 0x10
-    MachineLogln("  [global " + (variable - 16) + " <- " + value + "]")
-    self.log.Trace(":: Global @" + address + " <- " + (floor(value / 256) % 256))
+    if MACHINE_LOG then MachineLogln("  [global " + (variable - 16) + " <- " + value + "]")
+    if self.log.IsTrace then self.log.Trace(":: Global @" + address + " <- " + (floor(value / 256) % 256))
     self.dynamicMemory[address] = floor(value / 256) % 256  // modulo shouldn't be necessary.
-    self.log.Trace(":: Global @" + (address + 1) + " <- " + (value % 256))
+    if self.log.IsTrace then self.log.Trace(":: Global @" + (address + 1) + " <- " + (value % 256))
     self.dynamicMemory[address + 1] = value % 256
+    self.globals[variable - 16] = value
+end function
+
+// loadGlobals Rebuild the global variable list from memory.
+//
+// Must be called whenever the dynamic memory is replaced (start, restart, restore).
+// Writes after that keep it up to date; setGlobalVariable sets it directly, and
+// SetByte refreshes the word for writes into the global variables table.
+MachineState.loadGlobals = function()
+    self.globals = []
+    address = self.GlobalVariablesTableAddress
+    lastAddress = address + 480  // 240 words
+    while address < lastAddress
+        hi = self.storyData[address]
+        if self.dynamicMemory.hasIndex(address) then hi = self.dynamicMemory[address]
+        lo = self.storyData[address + 1]
+        if self.dynamicMemory.hasIndex(address + 1) then lo = self.dynamicMemory[address + 1]
+        self.globals.push((hi * 256) + lo)
+        address = address + 2
+    end while
 end function
 
 // FromByteAddress Convert a byte address to a physical address
@@ -500,7 +528,7 @@ end function
 // SetWord Game accessible memory write
 MachineState.SetWord = function(physAddress, value)
     // Because of the frequency of this call, it should be optimized.
-    MachineLogln("  [mem @" + physAddress + " <- word " + value + "]")
+    if MACHINE_LOG then MachineLogln("  [mem @" + physAddress + " <- word " + value + "]")
     if self.WordSize == 2 then
         self.SetByte(physAddress, floor(value / 256) % 256)
         self.SetByte(physAddress + 1, value % 256)
@@ -518,18 +546,23 @@ MachineState.SetByte = function(physAddress, value)
     if physAddress < 0 or physAddress >= self.StaticMemoryBaseAddress then exit("Illegal address: " + physAddress)
     if value < 0 or value > 255 then exit("Illegal value: " + value)
 
-    MachineLogln("  [mem @" + physAddress + " <- byte " + value + "]")
+    if MACHINE_LOG then MachineLogln("  [mem @" + physAddress + " <- byte " + value + "]")
 
-    // flags 2 bits 7-0
+    // Flags 2 is a word; its bits 15-8 are at 0x10, and bits 7-0 at 0x11.
     if physAddress == 16 then  // 0x10
+        // Only version 6 uses these (bit 8, menus).
+        self.headerData[physAddress] = value
+        return
+    end if
+    if physAddress == 17 then  // 0x11
         // Bit 0: set to 1 when transcripting is turned on.
         //    The game + interpreter can set this whenever.
         if value % 2 == 1 then
             // Turn on file transcript.
-            if self.native.EnableTranscript() then
+            if not self.Stream2Active and self.native.EnableTranscript() then
                 self.Stream2Active = true
             end if
-        else
+        else if self.Stream2Active then
             // Turn off stream 2, but don't change the filename.
             self.native.DisableTranscript()
             self.Stream2Active = false
@@ -540,8 +573,10 @@ MachineState.SetByte = function(physAddress, value)
         // In version 6, if bit 2 is cleared, then that means the game has
         // redrawn the screen.
 
-        // Ignore any changes the game makes to the other bits.
-
+        // Keep the other bits, so the game reads back what it wrote, but bit 0
+        // reads back whether the transcript is on; the player can cancel it.
+        value = bitAnd(value, 254)  // 0xfe
+        if self.Stream2Active then value = value + 1
         self.headerData[physAddress] = value
 
         return
@@ -554,6 +589,13 @@ MachineState.SetByte = function(physAddress, value)
 
     // Else it's dynamic memory
     self.dynamicMemory[physAddress] = value
+
+    // Keep the global variable list in step with the global variables table.
+    offset = physAddress - self.GlobalVariablesTableAddress
+    if offset >= 0 and offset < 480 then
+        wordAddress = physAddress - (offset % 2)
+        self.globals[floor(offset / 2)] = (self.ReadByte(wordAddress) * 256) + self.ReadByte(wordAddress + 1)
+    end if
 end function
 
 // SetOutputStreamState Set the output stream (1, 2, 3, 4) state and optional table (for stream 3).
@@ -566,12 +608,13 @@ MachineState.SetOutputStreamState = function(streamNumber, enabled, tableAddress
     else if streamNumber == 2 then
         // This must also change the transcript bit in flags 2
 
-        flag2 = self.ReadByte(16)  // 0x10
+        // That's bit 0 of the word, so the low byte, at 0x11.
+        flag2 = self.ReadByte(17)  // 0x11
         flag2flip = bitAnd(flag2, 254)  // 0xfe, 0b11111110
         if enabled then flag2flip = flag2flip + 1
         if flag2flip != flag2 then
             // This should trigger the native state change.
-            self.SetByte(16, flag2flip)  // 0x10
+            self.SetByte(17, flag2flip)  // 0x11
         end if
     else if streamNumber == 3 then
         // Special stream stack.
@@ -589,9 +632,10 @@ MachineState.SetOutputStreamState = function(streamNumber, enabled, tableAddress
     else if streamNumber == 4 then
         // Stream 4 is just user input
         if enabled then
-            self.native.EnableUserInputCapture()
+            self.Stream4Active = self.native.EnableUserInputCapture()
         else
             self.native.DisableUserInputCapture()
+            self.Stream4Active = false
         end if
     else if streamNumber != 0 then
         // enable stream 0 is ignored.
@@ -625,14 +669,53 @@ end function
 // Returns [was CR terminated?, zscii text, raw user input text]
 MachineState.ReadInputLine = function(maxCharCount)
     cursor = self.screen.GetActiveCursor()
+    counters = self.Counters
+    counters.EndTurn()
+    inputStart = time
     userInput = self.native.ReadLine(maxCharCount, cursor[0], cursor[1])
+    counters.inputTime = counters.inputTime + time - inputStart
+    counters.StartRun()
+    // Debugging Input Handlers
     if userInput[2] == "$10" then
-        // Debugging Input Handler
         print(DumpMachine(self).join(char(10)))
         user_input("[MORE]")
         return [true, [], ""]
     end if
-    // TODO send this to output stream 4.
+    if userInput[2] == "$11" then
+        print(counters.Summary().join(char(10)))
+        user_input("[MORE]")
+        return [true, [], ""]
+    end if
+    if userInput[2] == "$12" then
+        res = self.native.SaveDebugFile("zmachine-perf.txt", counters.Dump())
+        if res == null then res = "Wrote the performance counters to ~/zmachine-perf.txt"
+        user_input(res + "  [MORE]")
+        return [true, [], ""]
+    end if
+    if userInput[2] == "$13" then
+        counters.Profile = not counters.Profile
+        user_input("Decode / execute profiling: " + counters.Profile + "  [MORE]")
+        return [true, [], ""]
+    end if
+    if userInput[2] == "$14" then
+        self.SetOutputStreamState(4, not self.Stream4Active)
+        user_input("Command recording: " + self.Stream4Active + "  [MORE]")
+        return [true, [], ""]
+    end if
+    if userInput[2] == "$15" then
+        self.native.SelectInputStream(1)
+        return [true, [], ""]
+    end if
+    // Output stream 4 records what the user typed.
+    if self.Stream4Active then self.native.CaptureUserInput(userInput[2])
+    // The transcript gets the command too; in Version 6 the game prints it (spec 7.1.1.1).
+    if self.Stream2Active and self.FileVersion <= 5 then
+        echo = []
+        for code in userInput[1]
+            if code != 13 then echo.push(char(code))
+        end for
+        self.native.PrintTranscript(echo.join("") + char(13))
+    end if
     self.screen.AddUserInput(userInput[2], userInput[0])
     self.native.DrawScreen(self.screen.Render())
     return userInput
@@ -682,7 +765,7 @@ MachineState.GetObjectPropertyDefault = function(propertyIndex)
     if propertyIndex > 63 or propertyIndex < 0 then return null
 
     address = self.ObjectTableAddress + (propertyIndex * self.WordSize)
-    MachineLogln(" ; prop " + propertyIndex + " default read " + self.ReadWord(address))
+    if MACHINE_LOG then MachineLogln(" ; prop " + propertyIndex + " default read " + self.ReadWord(address))
     return self.ReadWord(address)
 end function
 
@@ -962,15 +1045,15 @@ end function
 MachineState.GetObjectPropertyWord = function(objectValues, propertyId)
     propertyAddressInfo = self.GetObjectProperty(objectValues, propertyId)
 
-    if propertyAddressInfo == null then self.log.Debug("Getting default property for " + propertyId)
+    if propertyAddressInfo == null and self.log.IsDebug then self.log.Debug("Getting default property for " + propertyId)
     if propertyAddressInfo == null then return self.GetObjectPropertyDefault(propertyId)
 
     // If the property has length 1, the value is
     // only that byte. If it has length 2, the first two bytes of the property
     // are taken as a word value. It is illegal for the opcode to be used if the
     // property has length greater than 2, and the result is unspecified.
-    self.log.Debug("Getting " + propertyAddressInfo[1] + " byte length value for property " + propertyId)
-    MachineLogln(" ; prop " + propertyId + " @" + propertyAddressInfo[2] + ", " + propertyAddressInfo[1] + " bytes")
+    if self.log.IsDebug then self.log.Debug("Getting " + propertyAddressInfo[1] + " byte length value for property " + propertyId)
+    if MACHINE_LOG then MachineLogln(" ; prop " + propertyId + " @" + propertyAddressInfo[2] + ", " + propertyAddressInfo[1] + " bytes")
     if propertyAddressInfo[1] == 1 then return self.ReadByte(propertyAddressInfo[2])
     if propertyAddressInfo[1] == 2 then return self.ReadWord(propertyAddressInfo[2])
     // Invalid state.
@@ -982,7 +1065,7 @@ MachineState.SetObjectPropertyWord = function(objectValues, propertyId, value)
     propertyAddressInfo = self.GetObjectProperty(objectValues, propertyId)
 
     if propertyAddressInfo == null then
-        self.log.Debug("Getting default property for " + propertyId)
+        if self.log.IsDebug then self.log.Debug("Getting default property for " + propertyId)
         return self.GetObjectPropertyDefault(propertyId)
     end if
 
@@ -1070,7 +1153,7 @@ MachineState.PerformLexicalAnalysis = function(zsciiText, dictionaryAddress = nu
         ch = zsciiText[pos]
         asStr = char(ch)
         // outputting the 0 character leads to cut-n-paste problems.
-        if ch != 0 then MachineLogln(" ; parsing '" + asStr + "' (" + ch + ")")
+        if MACHINE_LOG and ch != 0 then MachineLogln(" ; parsing '" + asStr + "' (" + ch + ")")
         cond = 0  // normal letter
         if ch == 32 or ch == 0 then cond = 1  // whitespace and zero terminator
         if wordSeparators.indexOf(ch) != null then cond = 2  // word separator
@@ -1080,7 +1163,7 @@ MachineState.PerformLexicalAnalysis = function(zsciiText, dictionaryAddress = nu
             entryAddress = 0
             if word.len > maxWordLen then word = word[:maxWordLen]
             if dictEntries.hasIndex(word) then entryAddress = dictEntries[word][0]
-            MachineLogln(" ; inserting word '" + word + "' @" + entryAddress + " " + (pos - start) + " characters")
+            if MACHINE_LOG then MachineLogln(" ; inserting word '" + word + "' @" + entryAddress + " " + (pos - start) + " characters")
             ret.push([
                 entryAddress,  // dictionary entry address
                 pos - start,  // letter count
@@ -1095,7 +1178,7 @@ MachineState.PerformLexicalAnalysis = function(zsciiText, dictionaryAddress = nu
             // Word separator is inserted as its own word.
             if not dictEntries.hasIndex(asStr) then exit("Bad story file: has word separator '" + asStr + "' without dictionary entry")
             entry = dictEntries[asStr]
-            MachineLogln(" ; inserting word-separator '" + asStr + "' @" + entryAddress + " 1 character")
+            if MACHINE_LOG then MachineLogln(" ; inserting word-separator '" + asStr + "' @" + entryAddress + " 1 character")
             ret.push([
                 entry[0],  // dictionary entry address
                 1,  // word separators always have a word length of 1
@@ -1130,7 +1213,8 @@ end function
 // Normally, this is just done for the static dictionary,
 // however, the tokenize opcode can use any table.
 MachineState.ParseDictionary = function(physAddress)
-    if self.cachedDictionaries.hasIndex(physAddress) then return self.cachedDictionaries[physAddress]
+    cached = self.cachedDictionaries.Get(physAddress)
+    if cached != null then return cached
     dictAddress = physAddress
     // Get the header.
     inputCodeCount = self.ReadByte(physAddress)
@@ -1178,7 +1262,7 @@ MachineState.ParseDictionary = function(physAddress)
     }
 
     // Only cache static dictionaries.
-    if dictAddress >= self.StaticMemoryBaseAddress then self.cachedDictionaries[dictAddress] = ret
+    if dictAddress >= self.StaticMemoryBaseAddress then self.cachedDictionaries.Put(dictAddress, ret, entryCount * charCount)
     return ret
 end function
 
@@ -1274,7 +1358,16 @@ end function
 
 // readStringLen Read a physical address, up to the char count, of text.  Returns the text + encoded length
 MachineState.readStringLen = function(physAddress, maxLen = null)
-    if self.cachedStrings.hasIndex(physAddress) then return self.cachedStrings[physAddress]
+    // Truncated reads, such as the dictionary entries, aren't cached; they'd only push out the printed text.
+    cached = null
+    if maxLen == null then cached = self.cachedStrings.Get(physAddress)
+    if cached != null then
+        counters = self.Counters
+        counters.stringCacheHits = counters.stringCacheHits + 1
+        if counters.Profile then counters.TraceString(physAddress, cached[0].len)
+        return cached
+    end if
+    self.Counters.stringDecodes = self.Counters.stringDecodes + 1
     stringAddress = physAddress
 
     // Start by loading the zscii bytes.
@@ -1316,21 +1409,23 @@ MachineState.readStringLen = function(physAddress, maxLen = null)
             // If z is the first Z-character (1, 2 or 3) and x the subsequent one, then
             // the interpreter must look up entry 32(z-1)+x in the abbreviations table
             // and print the string at that word address.
-            // The abbreviations are cached at start time, so they can be just looked up.
+            // The abbreviations are cached once read, so they can usually be just looked up.
             // self.log.Debug("Looked up abbreviation " + abbrevBuff + " index " + ch)
             abbrevIdx = ((abbrevBuff - 1) * 32) + ch
-            if not self.cachedAbbreviations.hasIndex(abbrevIdx) then
+            abbrev = self.cachedAbbreviations.Get(abbrevIdx)
+            if abbrev == null then
                 abbrevLookupAddress = self.AbbreviationsTableAddress + (abbrevIdx * 2)
                 // Should this look in dynamic data?
                 wordAddress = self.ReadWord(abbrevLookupAddress)
                 physAddress = wordAddress * self.WordSize
                 // self.log.Debug("Loading abbreviation " + abbrevIdx + " @ptr " + abbrevLookupAddress + " -> " + physAddress)
     
-                self.cachedAbbreviations[abbrevIdx] = self.ReadString(physAddress)
-                // self.log.Debug(" -> " + self.cachedAbbreviations[abbrevIdx])
+                abbrev = self.ReadString(physAddress)
+                self.cachedAbbreviations.Put(abbrevIdx, abbrev, abbrev.len)
+                // self.log.Debug(" -> " + abbrev)
             end if
 
-            retStr = retStr + self.cachedAbbreviations[abbrevIdx]
+            retStr = retStr + abbrev
             abbrevBuff = 0
             continue
 
@@ -1438,7 +1533,10 @@ MachineState.readStringLen = function(physAddress, maxLen = null)
     end for
     ret = [retStr, retLen]
     // Only cache static strings.
-    if stringAddress >= self.StaticMemoryBaseAddress then self.cachedStrings[stringAddress] = ret
+    if maxLen == null and stringAddress >= self.StaticMemoryBaseAddress then
+        self.cachedStrings.Put(stringAddress, ret, retStr.len)
+        if self.Counters.Profile then self.Counters.TraceString(stringAddress, retStr.len)
+    end if
     return ret
 end function
 
@@ -1451,16 +1549,18 @@ MachineState.StartGame = function()
     // For the header, only the flag 2 can be changed.
     // The only pieces of information surviving from the previous state are the
     // "transcribing to printer" bit (bit 0 of ’Flags 2′ in the header, at
-    // address 0x10) and the "use fixed pitch font" bit (bit 1 of 'Flags 2').
+    // address 0x11) and the "use fixed pitch font" bit (bit 1 of 'Flags 2').
 
     self.headerData[16] = 0  // 0x10
     self.headerData[17] = 0  // 0x11
     if self.UsesColors then
-        self.headerData[16] = 64
+        // Bit 6 of Flags 2, in the low byte.
+        self.headerData[17] = 64
     end if
     self.headerExtensionData = {}
     self.callStack = []
     self.dynamicMemory = {}
+    self.loadGlobals()
 
     // Reset streams
     // Stream 1 == screen
@@ -1491,12 +1591,7 @@ MachineState.StartGame = function()
         self.EnterRoutine(self.StartPC, [], -1)
     else
         // It's just a position, not considered a routine.
-        self.callStack.push({
-            "stack": [],
-            "pc": self.StartPC,
-            "locals": [],
-            "returnsRef": -1,
-        })
+        self.callStack.push(NewFrame(self.StartPC, -1))
     end if
 end function
 
@@ -1534,14 +1629,27 @@ MachineState.RestoreGame = function()
     if data == null then return false
     self.headerData = data.header
     self.headerExtensionData = data.ext
-    self.callStack = data.stack
+    self.callStack = []
+    for frame in data.stack
+        // Saves from before the list frames stored each frame as a map.
+        if frame isa map then frame = [frame.pc, frame.stack, frame.returnsRef] + frame.locals
+        self.callStack.push(frame)
+    end for
     self.dynamicMemory = data.dyn
+    self.loadGlobals()
     // TODO Should have header flag 2 retained...
     return true
 end function
 
 // ====================================================================
 
+// NewFrame Create a call stack frame with no local variables, [pc, stack, returnsRef].
+//
+// The local variables are pushed onto the end of the frame.
+NewFrame = function(pc, returnsRef)
+    return [pc, [], returnsRef]
+end function
+
 // GetStackFrame Get the current stack frame (the index)
 //
 // Used by the "catch" opcode.
@@ -1568,7 +1676,7 @@ MachineState.PopStackFrame = function(returnValue)
         prev = self.callStack.pop()
         // Now, store the return value to the value.
         // If the returns reference is < 0, then nothing is stored.
-        if prev.returnsRef >= 0 then self.SetVariableRef(prev.returnsRef, returnValue)
+        if prev[2] >= 0 then self.SetVariableRef(prev[2], returnValue)
     end if
 end function
 
@@ -1588,11 +1696,16 @@ MachineState.EnterRoutine = function(routine, arguments, returnsRef)
     if address < self.StaticMemoryBaseAddress then exit("Tried calling routine in static memory area: " + address)
 
     variableCount = self.storyData[address]
-    self.log.Trace("Call routine " + routine + " @" + address + ", " + variableCount + " local variables")
-    MachineLog("[routine " + routine + " @" + address + ", frame " + self.callStack.len + ", " + variableCount + " locals")
+    counters = self.Counters
+    counters.routineCalls = counters.routineCalls + 1
+    if counters.Profile then
+        if counters.routines.hasIndex(address) then counters.routines[address] = counters.routines[address] + 1 else counters.routines[address] = 1
+    end if
+    if self.log.IsTrace then self.log.Trace("Call routine " + routine + " @" + address + ", " + variableCount + " local variables")
+    if MACHINE_LOG then MachineLog("[routine " + routine + " @" + address + ", frame " + self.callStack.len + ", " + variableCount + " locals")
     address = address + 1
-    // Initialize local variables
-    callLocals = []
+    // Initialize local variables; the frame's code pointer is set after reading them.
+    frame = NewFrame(0, returnsRef)
     // Seems like this happens.  Could be a bad opcode reader, though.
     // if variableCount < arguments.len then exit("Too few local variables (" + variableCount + ") for argument count (" + arguments.len + ")")
     if variableCount > 0 then
@@ -1605,7 +1718,7 @@ MachineState.EnterRoutine = function(routine, arguments, returnsRef)
                 address = address + 2
             end if
             // self.log.Trace(" - Default local value " + i + " = " + val)
-            callLocals.push(val)
+            frame.push(val)
         end for
     end if
 
@@ -1616,32 +1729,36 @@ MachineState.EnterRoutine = function(routine, arguments, returnsRef)
     if arguments.len > variableCount then argCount = variableCount
     if argCount > 0 then
         for i in range(0, argCount - 1)
-            callLocals[i] = arguments[i]
+            frame[i + 3] = arguments[i]
             // self.log.Trace(" - Setting local variable " + i + " to argument value " + arguments[i])
         end for
     end if
 
     // self.log.Trace(" - Adding to call stack @" + address)
-    self.callStack.push({
-        "stack": [],
-        "pc": address,
-        "locals": callLocals,
-        "returnsRef": returnsRef,
-    })
-    self.log.Trace(" :: frame " + (self.callStack.len - 1) + ", locals " + self.callStack[-1].locals)
-    MachineLogln(" == " + self.callStack[-1].locals + "]")
+    frame[0] = address
+    self.callStack.push(frame)
+    if self.log.IsTrace then self.log.Trace(" :: frame " + (self.callStack.len - 1) + ", locals " + frame[3:])
+    if MACHINE_LOG then MachineLogln(" == " + frame[3:] + "]")
+
+    // Run the compiled routine, if there is one.  It returns once the routine returns,
+    // or when it reaches something it leaves to the interpreter.  The running batch
+    // charges its instructions to the budget and the counters.
+    if self.Aot != null and self.Aot.hasIndex(address) then
+        compiled = @self.Aot[address]
+        self.CompiledRan = self.CompiledRan + compiled(self, frame, address)
+    end if
 end function
 
 // JumpToAddress Move the current stack frame's instruction pointer to the given address.
 MachineState.JumpToAddress = function(physAddress)
-    self.callStack[-1].pc = physAddress
+    self.callStack[-1][0] = physAddress
 end function
 
 // JumpByOffset Move the current stack frame's instruction pointer by the number of bytes.
 // Can be negative.
 MachineState.JumpByOffset = function(byteOffset)
     top = self.callStack[-1]
-    top.pc = top.pc + byteOffset
+    top[0] = top[0] + byteOffset
 end function
 
 // PerformBranch Perform the correct branching logic, based on the opcode branch value.
@@ -1654,15 +1771,15 @@ MachineState.PerformBranch = function(branch, condition)
         // self.log.Trace("Branching on " + branch.t)
         if branch.t == "a" then
             // Jump to an address
-            MachineLogln(" ; branch base offset ? ; jump to " + branch.a)
+            if MACHINE_LOG then MachineLogln(" ; branch base offset ? ; jump to " + branch.a)
             self.JumpToAddress(branch.a)
             return
         end if
-        MachineLogln(" ; branch returning " + branch.r + " ; jumping")
+        if MACHINE_LOG then MachineLogln(" ; branch returning " + branch.r + " ; jumping")
         // t == r, so return.
         self.PopStackFrame(branch.r)
     else
-        MachineLogln(" ; branch base offset ? ; no jump")
+        if MACHINE_LOG then MachineLogln(" ; branch base offset ? ; no jump")
         // self.log.Trace("No branching - condition failed.")
     end if
 end function
@@ -1687,15 +1804,15 @@ end function
 // Does not advance the current instruction pointer.
 MachineState.NextInstruction = function()
     if self.callStack.len <= 0 then exit("No call stack frame")
-    return self.instructionAt(self.callStack[-1].pc, STD_OPCODE_TABLE, EXT_OPCODE_TABLE)
+    return self.instructionAt(self.callStack[-1][0], STD_OPCODE_TABLE, EXT_OPCODE_TABLE)
 end function
 
 // AdvanceToInstructionAfterString Gets the string at the current PC, returns it, and advances the PC after the string.
 // Very special instruction for supporting some operands.
 MachineState.AdvanceToInstructionAfterString = function()
-    stack = self.callStack[-1]
-    strLen = self.readStringLen(stack.pc)
-    stack.pc = stack.pc + strLen[1]
+    frame = self.callStack[-1]
+    strLen = self.readStringLen(frame[0])
+    frame[0] = frame[0] + strLen[1]
     return strLen[0]
 end function
 
@@ -1716,7 +1833,7 @@ MachineState.instructionAt = function(physAddress, opcodeList, extendedOpcodeLis
     // Note: instructions should be only in static memory.
     // This gives us a touch of performance boost.
     if physAddress < self.StaticMemoryBaseAddress then exit("Tried to run instruction in dynamic memory " + physAddress)
-    MachineLog(str(physAddress) + " ")
+    if MACHINE_LOG then MachineLog(str(physAddress) + " ")
     // For debugging...
     instructionAddress = physAddress
 
@@ -1812,7 +1929,7 @@ MachineState.instructionAt = function(physAddress, opcodeList, extendedOpcodeLis
         if operandTypeCode == 2 then
             // Variable reference; 1 byte operand.
             opVal = self.storyData[physAddress]
-            MachineLog(" [@" + physAddress + " var " + opVal + "] ")
+            if MACHINE_LOG then MachineLog(" [@" + physAddress + " var " + opVal + "] ")
             operands.push({"t": "v", "s": 2, "v": opVal, "c": self.GetVariableRef(opVal)})
 
             // self.log.Trace("  - operand variable @" + physAddress + " reference " + operands[-1].v + " == " + operands[-1].c)
@@ -1890,20 +2007,22 @@ MachineState.instructionAt = function(physAddress, opcodeList, extendedOpcodeLis
         end if
     end if
 
-    if opcodeMnemonic == "call_v1" then
-        DEBUG_MNEMONIC = "z_call_vs"
-    else
-        DEBUG_MNEMONIC = "z_" + opcodeMnemonic[:-3]
+    if MACHINE_LOG then
+        if opcodeMnemonic == "call_v1" then
+            DEBUG_MNEMONIC = "z_call_vs"
+        else
+            DEBUG_MNEMONIC = "z_" + opcodeMnemonic[:-3]
+        end if
+        MachineLog(DEBUG_MNEMONIC + " [")
+        DEBUG_PRE = ""
+        for DEBUG_OPER in operands
+            MachineLog(DEBUG_PRE + DEBUG_OPER.c)
+            DEBUG_PRE = ", "
+        end for
+        MachineLogln("]")
     end if
-    MachineLog(DEBUG_MNEMONIC + " [")
-    DEBUG_PRE = ""
-    for DEBUG_OPER in operands
-        MachineLog(DEBUG_PRE + DEBUG_OPER.c)
-        DEBUG_PRE = ", "
-    end for
-    MachineLogln("]")
 
-    self.log.Verbose(str(instructionAddress) + " " + opcodeMnemonic + " " + operands + " " + storesVariable + " " + branch)
+    if self.log.IsVerbose then self.log.Verbose(str(instructionAddress) + " " + opcodeMnemonic + " " + operands + " " + storesVariable + " " + branch)
     // [opcodeName, operandsList, nextInstructionAddress, storedValue (maybe null), branchValue (maybe null)]
     return [opcodeMnemonic, operands, physAddress, storesVariable, branch]
 end function
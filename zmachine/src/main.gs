@@ -4,6 +4,7 @@ import_code("logging.gs")
 import_code("loadstory.gs")
 import_code("zscii_unicode.gs")
 import_code("opcodes_list.gs")
+import_code("cache.gs")
 import_code("machine.gs")
 import_code("screen.gs")
 import_code("opcodes_v3.gs")
@@ -11,6 +12,7 @@ import_code("opcodes_v4.gs")
 import_code("opcodes_v5.gs")
 import_code("opcodes_v7.gs")
 import_code("interpreter.gs")
+import_code("streams.gs")
 import_code("native.gs")
 import_code("gamedata.gs")
 
@@ -48,8 +50,9 @@ main = function(args)
     interpreter = Interpreter.New(story, native)
     completed = false
     while not completed
-        completed = interpreter.Run()
+        completed = interpreter.RunBatch()
     end while
+    native.FlushStreams()
 end function
 
 if locals == globals then main(params)
@@ -19,12 +19,21 @@ Native.New = function(width, height)
     // Transcript file
     // Because it's designed for a printer, some games can activate it
     // rapidly.  So the filename should be kept after set the first time.
-    // It should also support buffering text (e.g. word wrapping), but we don't.
+    // The text is buffered (see streams.gs), but not word wrapped.
     ret.Stream2Filename = null
     ret.Stream2File = null
 
     // Output Stream 4
-    // Saves user input.  Not currently supported.
+    // Saves user input, one command per line, which input stream 1 can replay.
+    ret.Stream4Filename = null
+    ret.Stream4File = null
+
+    // The last stream write error shown to the user.
+    ret.streamError = null
+
+    // Commands read by input stream 1, and the next one to read.
+    ret.replayCommands = []
+    ret.replayIdx = 0
 
     // The active screen contents, useful when reading characters at a time.
     ret.screenContents = []
@@ -67,9 +76,14 @@ end function
 
 // Reset Set the internal settings as though a game "restart" happened.
 Native.Reset = function()
+    self.FlushStreams()
     self.Stream2Filename = null
     self.Stream2File = null
+    self.Stream4Filename = null
+    self.Stream4File = null
     self.inputStream = 0
+    self.replayCommands = []
+    self.replayIdx = 0
     self.cursorRow = -1
     self.cursorColumn = -1
     self.terminatingChars = [""]
@@ -118,6 +132,22 @@ Native.SaveGame = function(data)
     f.set_content(GameData.Archive(data))
 end function
 
+// SaveDebugFile Write the debugging text to the file in the home directory.
+//
+// Returns a string on error, null on success.
+Native.SaveDebugFile = function(name, text)
+    f = get_shell.host_computer.File(home_dir + "/" + name)
+    if f == null then
+        res = get_shell.host_computer.touch(home_dir, name)
+        if typeof(res) == "string" then return "Failed creating " + name + " (" + res + ")."
+        f = get_shell.host_computer.File(home_dir + "/" + name)
+        if f == null then return "Failed creating " + name + "."
+    end if
+    res = f.set_content(text)
+    if typeof(res) == "string" then return "Failed writing " + name + " (" + res + ")."
+    return null
+end function
+
 // LoadGame Loads a save file and returns a list of bytes (integers in range 0-255).
 //
 // On error or user canceling the action, returns null
@@ -138,10 +168,12 @@ end function
 // Returns 'true' if the user ok'd the enablement, 'false' if cancelled.
 Native.EnableTranscript = function()
     if self.Stream2Filename == null then
-        self.Stream2Filename = user_input("Please enter the transcript file name> ")
-        user_input("Sorry.  Transcript saving is not currently supported.  Press <enter> to continue.")
+        name = user_input("Please enter the transcript file name (just 'enter' to cancel)> ").trim
+        if name == "" then return false
+        self.Stream2Filename = name
     end if
-    return false
+    if self.Stream2File == null then self.Stream2File = StreamFile.New(self.Stream2Filename)
+    return true
 end function
 
 // DisableTranscript Turn off transcript saving.
@@ -149,22 +181,99 @@ end function
 // This shouldn't forget the file being saved to, so that re-enabling the
 // transcript will reuse the previous transcript.
 Native.DisableTranscript = function()
-    self.Stream2File = null
+    if self.Stream2File != null then self.reportStreamError(self.Stream2File.Flush())
 end function
 
 // PrintTranscript Send text to the transcript
+//
+// The text is in zscii, and is buffered until the next input or flush.
 Native.PrintTranscript = function(text)
-    // Currently ignored
+    if self.Stream2File == null then return
+    out = ""
+    for ch in text.values
+        code = ch.code
+        if code == 13 then
+            out = out + char(10)
+        else if self.unicodeFromZscii.hasIndex(code) then
+            out = out + self.unicodeFromZscii[code]
+        else
+            out = out + ch
+        end if
+    end for
+    self.Stream2File.Write(out)
 end function
 
 // EnableUserInputCapture Turn on stream 4 capturing, which is for user input.
+//
+// Returns 'true' if the user ok'd the enablement, 'false' if cancelled.
 Native.EnableUserInputCapture = function()
-    // Currently ignored
+    if self.Stream4Filename == null then
+        name = user_input("Please enter the command recording file name (just 'enter' to cancel)> ").trim
+        if name == "" then return false
+        self.Stream4Filename = name
+    end if
+    // A recording is replayed whole, so it starts a new file rather than adding to one
+    // from an earlier game.
+    if self.Stream4File == null then self.Stream4File = StreamFile.New(self.Stream4Filename, null, null, true)
+    return true
 end function
 
-// DisableUserInputCapture Turn on stream 4 capturing, which is for user input.
+// DisableUserInputCapture Turn off stream 4 capturing, which is for user input.
+//
+// Like the transcript, the file is kept for when it's turned back on.
 Native.DisableUserInputCapture = function()
-    // Currently ignored
+    if self.Stream4File != null then self.reportStreamError(self.Stream4File.Flush())
+end function
+
+// CaptureUserInput Send a line of user input to the stream 4 recording.
+Native.CaptureUserInput = function(text)
+    if self.Stream4File != null then self.Stream4File.Write(text + char(10))
+end function
+
+// FlushStreams Write the buffered transcript and command recording text to their files.
+//
+// Called when waiting on input, and when the game ends.
+Native.FlushStreams = function()
+    if self.Stream2File != null then self.reportStreamError(self.Stream2File.Flush())
+    if self.Stream4File != null then self.reportStreamError(self.Stream4File.Flush())
+end function
+
+// StreamSummary The transcript and command recording counters, one line each.
+Native.StreamSummary = function()
+    ret = []
+    if self.Stream2File != null then ret.push("Transcript " + self.Stream2File.Summary())
+    if self.Stream4File != null then ret.push("Commands " + self.Stream4File.Summary())
+    if self.inputStream == 1 then ret.push("Replaying command " + self.replayIdx + " of " + self.replayCommands.len)
+    return ret
+end function
+
+// reportStreamError Show a stream write error, once.
+Native.reportStreamError = function(err)
+    if err == null or err == self.streamError then return
+    self.streamError = err
+    user_input(err + "  Press <enter> to continue.")
+end function
+
+// SelectInputStream Read input from the keyboard (0) or a file of commands (1).
+//
+// Selecting the file asks for its name, if there are no commands left to replay.
+Native.SelectInputStream = function(number)
+    if number != 1 then
+        self.inputStream = 0
+        return
+    end if
+    if self.replayIdx >= self.replayCommands.len then
+        name = user_input("Please enter the command file name to replay (just 'enter' to cancel)> ").trim
+        if name == "" then return
+        commands = ReadStreamLines(name)
+        if commands == null then
+            user_input("Could not find " + name + ".  Press <enter> to continue.")
+            return
+        end if
+        self.replayCommands = commands
+        self.replayIdx = 0
+    end if
+    self.inputStream = 1
 end function
 
 // PauseForScroll Called by the screen when the scrolling can lose data to the user.
@@ -175,6 +284,7 @@ end function
 //
 // If reading from stream 1, then the system shouldn't pause.
 Native.PauseForScroll = function()
+    if self.inputStream == 1 then return
     user_input("[MORE]")
 end function
 
@@ -391,6 +501,16 @@ end function
 // In Versions 1 to 3, the status line is automatically redisplayed first.  The
 // caller this must ensure that's done.
 Native.ReadLine = function(maxChars, cursorColumn, cursorRow)
+    // Waiting on the user is the least noticeable time to write the files.
+    self.FlushStreams()
+    if self.inputStream == 1 then
+        if self.replayIdx < self.replayCommands.len then
+            self.replayIdx = self.replayIdx + 1
+            return self.inputLine(self.replayCommands[self.replayIdx - 1], maxChars)
+        end if
+        // Out of commands; back to the keyboard.
+        self.inputStream = 0
+    end if
     return self.ReadLineSimple(maxChars, cursorColumn, cursorRow)
 
     // This is closer to the real way to do it, but it's so slow.
@@ -433,8 +553,12 @@ Native.ReadLineSimple = function(maxChars, cursorColumn, cursorRow)
         print(display.join(char(10)), clearScreen)
     end if
 
+    return self.inputLine(user_input("(input here) "), maxChars)
+end function
+
+// inputLine The ReadLine result for the typed text.
+Native.inputLine = function(text, maxChars)
     zscii = []
-    text = user_input("(input here) ")
     for ch in text.values
         if zscii.len >= maxChars then break
         zsciiCh = self.convertInputToZscii(ch)
@@ -612,6 +736,7 @@ end function
 //
 // Called by the read_char opcode.  No timer is supported.
 Native.ReadKey = function()
+    self.FlushStreams()
     ch = user_input("", false, true)
     return self.convertInputToZscii(ch)
 end function
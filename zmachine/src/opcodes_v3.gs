@@ -51,7 +51,7 @@ OpV1_Call = function(machine, operands, storesVarRef, branch)
     for operand in operands[1:]
         arguments.push(operand.c)
     end for
-    OpCodeLogger.Trace("Calling routine " + routine + " with arguments " + arguments + "; stores return value in " + storesVarRef)
+    if OpCodeLogger.IsTrace then OpCodeLogger.Trace("Calling routine " + routine + " with arguments " + arguments + "; stores return value in " + storesVarRef)
     machine.EnterRoutine(routine, arguments, storesVarRef)
 end function
 Opcodes.call_v1 = @OpV1_Call
@@ -127,9 +127,9 @@ OpV1_GetChild = function(machine, operands, storesVarRef, branch)
     if storesVarRef == null then exit("Invalid opcode 'get_child': requires storesVarRef")
     if branch == null then exit("Invalid opcode 'get_child': requires branch label")
     object1 = machine.GetObjectData(operands[0].c)
-    OpCodeLogger.Debug("Getting child of " + operands[0].c + " " + object1)
+    if OpCodeLogger.IsDebug then OpCodeLogger.Debug("Getting child of " + operands[0].c + " " + object1)
     childId = machine.GetObjectId(machine.GetObjectChild(object1))
-    OpCodeLogger.Debug("Found child id " + childId + "; setting to " + storesVarRef)
+    if OpCodeLogger.IsDebug then OpCodeLogger.Debug("Found child id " + childId + "; setting to " + storesVarRef)
     machine.SetVariableRef(storesVarRef, childId)
     machine.PerformBranch(branch, childId != 0)
 end function
@@ -156,7 +156,7 @@ OpV1_GetProperty = function(machine, operands, storesVarRef, branch)
     if operands.len != 2 then exit("Invalid opcode 'get_prop': requires 2 arguments")
     if storesVarRef == null then exit("Invalid opcode 'get_prop': requires storesVarRef")
     object1 = machine.GetObjectData(operands[0].c)
-    OpCodeLogger.Debug("Getting property " + operands[1].c + " from object " + operands[0].c)
+    if OpCodeLogger.IsDebug then OpCodeLogger.Debug("Getting property " + operands[1].c + " from object " + operands[0].c)
     value = machine.GetObjectPropertyWord(object1, operands[1].c)
     if value == null then exit("Encountered null property and no default value")
     machine.SetVariableRef(storesVarRef, value)
@@ -172,7 +172,7 @@ OpV1_GetPropertyAddress = function(machine, operands, storesVarRef, branch)
     if operands.len != 2 then exit("Invalid opcode 'get_prop_addr': requires 2 arguments")
     if storesVarRef == null then exit("Invalid opcode 'get_prop_addr': requires storesVarRef")
     object1 = machine.GetObjectData(operands[0].c)
-    OpCodeLogger.Debug("Getting property " + operands[1].c + " from object " + operands[0].c)
+    if OpCodeLogger.IsDebug then OpCodeLogger.Debug("Getting property " + operands[1].c + " from object " + operands[0].c)
     value = machine.GetObjectProperty(object1, operands[1].c)
     if value == null then
         addr = 0
@@ -263,7 +263,7 @@ Opcodes.inc_chk_v1 = @OpV1_IncCheck
 // with it. (Initially O can be at any point in the object tree; it may legally have parent zero.)
 OpV1_InsertObject = function(machine, operands, storesVarRef, branch)
     if operands.len != 2 then exit("Invalid opcode 'insert_obj': requires 2 arguments")
-    OpCodeLogger.Debug("Moving object " + operands[0].c + " to first child of " + operands[1].c)
+    if OpCodeLogger.IsDebug then OpCodeLogger.Debug("Moving object " + operands[0].c + " to first child of " + operands[1].c)
     obj = machine.GetObjectData(operands[0].c)
     if obj == null then exit("Invalid opcode 'insert_obj': first argument is not an object")
     destId = operands[1].c
@@ -278,12 +278,12 @@ OpV1_InsertObject = function(machine, operands, storesVarRef, branch)
     objSiblingId = machine.GetObjectId(objSibling)  // could be 0, the null object.
     if objParent != null then
         // Reassign the parent links to remove obj from the existing tree.
-        OpCodeLogger.Trace("  removing as child of " + machine.GetObjectId(objParent))
+        if OpCodeLogger.IsTrace then OpCodeLogger.Trace("  removing as child of " + machine.GetObjectId(objParent))
 
         child = machine.GetObjectChild(objParent)
         if machine.GetObjectId(child) == objId then
             // Change the object's sibling to be the first child.
-            OpCodeLogger.Trace("  .. it was the first child.")
+            if OpCodeLogger.IsTrace then OpCodeLogger.Trace("  .. it was the first child.")
             machine.SetObjectChild(objParent, objSiblingId)
         else
             // Find what has obj as the sibling...
@@ -292,7 +292,7 @@ OpV1_InsertObject = function(machine, operands, storesVarRef, branch)
                 childSibling = machine.GetObjectSibling(child)
                 if machine.GetObjectId(childSibling) == objId then
                     // switch out the sibling to remove obj from the child chain.
-                    OpCodeLogger.Trace("  .. it was the sibling of " + machine.GetObjectId(child))
+                    if OpCodeLogger.IsTrace then OpCodeLogger.Trace("  .. it was the sibling of " + machine.GetObjectId(child))
                     machine.SetObjectSibling(child, objSiblingId)
                     break
                 end if
@@ -308,17 +308,27 @@ OpV1_InsertObject = function(machine, operands, storesVarRef, branch)
     end if
 
     // Insert the object into the new tree.
-    OpCodeLogger.Trace("  setting destination object " + destId + " as parent of " + objId)
+    if OpCodeLogger.IsTrace then OpCodeLogger.Trace("  setting destination object " + destId + " as parent of " + objId)
     machine.SetObjectParent(obj, destId)
     destChild = machine.GetObjectChild(dest)  // might be null
     destChildId = machine.GetObjectId(destChild)  // could be 0, the null object.
-    OpCodeLogger.Trace("  moving destination object " + destId + " first child " + destChildId + " to sibling of " + objId)
+    if OpCodeLogger.IsTrace then OpCodeLogger.Trace("  moving destination object " + destId + " first child " + destChildId + " to sibling of " + objId)
     machine.SetObjectSibling(obj, destChildId)
-    OpCodeLogger.Trace("  setting destination object " + destId + " first child to " + objId)
+    if OpCodeLogger.IsTrace then OpCodeLogger.Trace("  setting destination object " + destId + " first child to " + objId)
     machine.SetObjectChild(dest, objId)
 end function
 Opcodes.insert_obj_v1 = @OpV1_InsertObject
 
+// OpV1_InputStream
+//    input_stream number
+// Selects the current input stream: 0 is the keyboard, and 1 is a file of commands,
+// such as one recorded by output stream 4.
+OpV1_InputStream = function(machine, operands, storesVarRef, branch)
+    if operands.len != 1 then exit("Invalid opcode 'input_stream': requires 1 argument")
+    machine.native.SelectInputStream(operands[0].c)
+end function
+Opcodes.input_stream_v3 = @OpV1_InputStream
+
 // OpV1_JumpEqual Jump if equal
 //      je a b c d ?(label)
 // Jump if a is equal to any of the subsequent operands.
@@ -378,7 +388,7 @@ Opcodes.jl_v1 = @OpV1_JumpLess
 OpV1_Jump = function(machine, operands, storesVarRef, branch)
     if operands.len != 1 then exit("Invalid opcode 'jump': requires 1 argument")
     offset = MachineState.Signed16(operands[0].c) - 2
-    OpCodeLogger.Trace("Jumping " + offset + " bytes offset")
+    if OpCodeLogger.IsTrace then OpCodeLogger.Trace("Jumping " + offset + " bytes offset")
     machine.JumpByOffset(offset)
 end function
 Opcodes.jump_v1 = @OpV1_Jump
@@ -538,7 +548,7 @@ Opcodes.or_v1 = @OpV1_Or
 // actual text being stored at bytes table+2 onward. It is not the interpreter’s
 // responsibility to worry about the length of this table being overrun.
 OpV1_OutputStream = function(machine, operands, storesVarRef, branch)
-    if operands.len < 1 or operatnds.len > 2 then exit("Invalid opcode 'output_stream': requires 1 or 2 arguments")
+    if operands.len < 1 or operands.len > 2 then exit("Invalid opcode 'output_stream': requires 1 or 2 arguments")
 
     streamNumber = machine.Signed16(operands[0].c)
     if streamNumber == 0 then return
@@ -553,6 +563,7 @@ OpV1_OutputStream = function(machine, operands, storesVarRef, branch)
     end if
 end function
 Opcodes.output_stream_v1 = @OpV1_OutputStream
+Opcodes.output_stream_v3 = @OpV1_OutputStream
 
 // OpV1_Print
 //     print <literal-string>
@@ -569,9 +580,9 @@ Opcodes.print_v1 = @OpV1_Print
 OpV1_PrintAddr = function(machine, operands, storesVarRef, branch)
     if operands.len != 1 then exit("Invalid opcode 'print_paddr': requires 1 argument")
     address = operands[0].c
-    OpCodeLogger.Trace("Printing @" + address)
+    if OpCodeLogger.IsTrace then OpCodeLogger.Trace("Printing @" + address)
     text = machine.ReadString(address)
-    OpCodeLogger.Debug("Printing '" + text + "'")
+    if OpCodeLogger.IsDebug then OpCodeLogger.Debug("Printing '" + text + "'")
     machine.PrintZscii(text)
 end function
 Opcodes.print_addr_v1 = @OpV1_PrintAddr
@@ -584,7 +595,7 @@ Opcodes.print_addr_v1 = @OpV1_PrintAddr
 OpV1_PrintChar = function(machine, operands, storesVarRef, branch)
     if operands.len != 1 then exit("Invalid opcode 'print_char': requires 1 argument")
     v1 = char(operands[0].c)
-    OpCodeLogger.Debug("Printing char " + operands[0].c + " as '" + v1 + "'")
+    if OpCodeLogger.IsDebug then OpCodeLogger.Debug("Printing char " + operands[0].c + " as '" + v1 + "'")
     machine.PrintZscii(v1)
 end function
 Opcodes.print_char_v1 = @OpV1_PrintChar
@@ -595,7 +606,7 @@ Opcodes.print_char_v1 = @OpV1_PrintChar
 OpV1_PrintNum = function(machine, operands, storesVarRef, branch)
     if operands.len != 1 then exit("Invalid opcode 'print_num': requires 1 argument")
     v1 = machine.Signed16(operands[0].c)
-    OpCodeLogger.Debug("Printing number " + operands[0].c + " as '" + v1 + "'")
+    if OpCodeLogger.IsDebug then OpCodeLogger.Debug("Printing number " + operands[0].c + " as '" + v1 + "'")
     // assume zscii digits are 1-to-1 with unicode (they are)
     machine.PrintZscii(str(v1))
 end function
@@ -609,7 +620,7 @@ OpV1_PrintObject = function(machine, operands, storesVarRef, branch)
     objectId = operands[0].c
     object = machine.GetObjectData(objectId)
     name = machine.GetObjectName(object)
-    OpCodeLogger.Debug("Printing object " + objectId + ": '" + name + "'")
+    if OpCodeLogger.IsDebug then OpCodeLogger.Debug("Printing object " + objectId + ": '" + name + "'")
     machine.PrintZscii(name)
 end function
 Opcodes.print_obj_v1 = @OpV1_PrintObject
@@ -620,9 +631,9 @@ Opcodes.print_obj_v1 = @OpV1_PrintObject
 OpV1_PrintPAddr = function(machine, operands, storesVarRef, branch)
     if operands.len != 1 then exit("Invalid opcode 'print_paddr': requires 1 argument")
     address = machine.FromStringPackAddress(operands[0].c)
-    OpCodeLogger.Trace("Printing @" + address)
+    if OpCodeLogger.IsTrace then OpCodeLogger.Trace("Printing @" + address)
     text = machine.ReadString(address)
-    OpCodeLogger.Debug("Printing '" + text + "'")
+    if OpCodeLogger.IsDebug then OpCodeLogger.Debug("Printing '" + text + "'")
     machine.PrintZscii(text)
 end function
 Opcodes.print_paddr_v1 = @OpV1_PrintPAddr
@@ -674,7 +685,7 @@ OpV1_PutProperty = function(machine, operands, storesVarRef, branch)
     object1 = machine.GetObjectData(operands[0].c)
     propertyId = operands[1].c
     value = operands[2].c
-    OpCodeLogger.Debug("Putting value " + value + " into property " + propertyId + " for object " + operands[0].c)
+    if OpCodeLogger.IsDebug then OpCodeLogger.Debug("Putting value " + value + " into property " + propertyId + " for object " + operands[0].c)
     machine.SetObjectPropertyWord(object1, propertyId, value)
 end function
 Opcodes.put_prop_v1 = @OpV1_PutProperty
@@ -717,7 +728,7 @@ Opcodes.random_v1 = @OpV1_Random
 // has any parent. (Its children remain in its possession.)
 OpV1_RemoveObject = function(machine, operands, storesVarRef, branch)
     if operands.len != 1 then exit("Invalid opcode 'remove_obj': requires 1 arguments")
-    OpCodeLogger.Debug("Removing object " + operands[0].c)
+    if OpCodeLogger.IsDebug then OpCodeLogger.Debug("Removing object " + operands[0].c)
     obj = machine.GetObjectData(operands[0].c)
     if obj == null then exit("Invalid opcode 'remove_obj': argument is not an object")
 
@@ -731,12 +742,12 @@ OpV1_RemoveObject = function(machine, operands, storesVarRef, branch)
     objSiblingId = machine.GetObjectId(objSibling)  // could be 0, the null object.
     if objParent != null then
         // Reassign the parent links to remove obj from the existing tree.
-        OpCodeLogger.Trace("  removing as child of " + machine.GetObjectId(objParent))
+        if OpCodeLogger.IsTrace then OpCodeLogger.Trace("  removing as child of " + machine.GetObjectId(objParent))
 
         child = machine.GetObjectChild(objParent)
         if machine.GetObjectId(child) == objId then
             // Change the object's sibling to be the first child.
-            OpCodeLogger.Trace("  .. it was the first child.")
+            if OpCodeLogger.IsTrace then OpCodeLogger.Trace("  .. it was the first child.")
             machine.SetObjectChild(objParent, objSiblingId)
         else
             // Find what has obj as the sibling...
@@ -745,7 +756,7 @@ OpV1_RemoveObject = function(machine, operands, storesVarRef, branch)
                 childSibling = machine.GetObjectSibling(child)
                 if machine.GetObjectId(childSibling) == objId then
                     // switch out the sibling to remove obj from the child chain.
-                    OpCodeLogger.Trace("  .. it was the sibling of " + machine.GetObjectId(child))
+                    if OpCodeLogger.IsTrace then OpCodeLogger.Trace("  .. it was the sibling of " + machine.GetObjectId(child))
                     machine.SetObjectSibling(child, objSiblingId)
                     break
                 end if
@@ -761,7 +772,7 @@ OpV1_RemoveObject = function(machine, operands, storesVarRef, branch)
     end if
 
     // Set the object's parent as the null object.
-    OpCodeLogger.Trace("  setting null object as parent of " + objId)
+    if OpCodeLogger.IsTrace then OpCodeLogger.Trace("  setting null object as parent of " + objId)
     machine.SetObjectParent(obj, 0)
 end function
 Opcodes.remove_obj_v1 = @OpV1_RemoveObject
@@ -906,7 +917,7 @@ OpV1_SRead = function(machine, operands, storesVarRef, branch)
         // Insert back the number of read characters.
         machine.SetByte(text + textCountPos, maxInputChars)
     end if
-    MachineLogln(" ; inserting " + maxInputChars + " input characters")
+    if MACHINE_LOG then MachineLogln(" ; inserting " + maxInputChars + " input characters")
     for idx in range(0, maxInputChars - 1)
         machine.SetByte(text + textInsertPos + idx, input[idx])
     end for
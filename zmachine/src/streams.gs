@@ -0,0 +1,180 @@
+// Buffered stream files, for the transcript (output stream 2) and the command capture
+// (output stream 4).
+//
+// Grey Hack files can only be written whole, with `set_content`, so writing each printed
+// fragment would rewrite the whole file every time.  Instead, the text is kept in a buffer,
+// and written when the game waits for input, or once STREAM_FLUSH_SIZE characters are
+// waiting.  The file's text is kept too, so a write doesn't need to read the file first.
+//
+// Each write costs the size of the whole file, and Grey Hack limits files to 160,000
+// characters, so once a file would grow past STREAM_MAX_FILE_SIZE, it's renamed to the
+// next unused `(name).1`, `(name).2`, ... and a new file is started.  ReadStreamLines reads
+// the parts back in order.
+//
+// A transcript keeps adding to the file it finds.  A command recording is replayed as a
+// whole, so it starts fresh: the file and parts left by an earlier game are moved to
+// `(name).old`, `(name).old.1`, ..., replacing the ones there.
+
+STREAM_FLUSH_SIZE = 4096
+STREAM_MAX_FILE_SIZE = 65536
+
+StreamFile = {}
+
+// New A stream file at the path; a relative path is in the home directory.
+//
+// The file isn't touched until the first write.  If fresh is true, the first write moves
+// the existing file away rather than adding to it.
+StreamFile.New = function(path, flushSize = null, maxFileSize = null, fresh = false)
+    ret = new StreamFile
+    if path.len <= 0 or path[0] != "/" then path = home_dir + "/" + path
+    if flushSize == null then flushSize = STREAM_FLUSH_SIZE
+    if maxFileSize == null then maxFileSize = STREAM_MAX_FILE_SIZE
+    ret.path = path
+    ret.flushSize = flushSize
+    ret.maxFileSize = maxFileSize
+    ret.fresh = fresh
+    ret.buffer = []
+    ret.bufferSize = 0
+    // The text written to the current file, or null before it's opened.
+    ret.content = null
+    ret.file = null
+    ret.error = null
+    ret.written = 0
+    ret.flushes = 0
+    ret.rotations = 0
+    return ret
+end function
+
+// Write Add the text to the stream, writing the file if the buffer is full.
+StreamFile.Write = function(text)
+    self.buffer.push(text)
+    self.bufferSize = self.bufferSize + text.len
+    if self.bufferSize >= self.flushSize then self.Flush
+end function
+
+// Flush Write the buffered text to the file.
+//
+// Returns a string on error, null on success.  After an error, the text is dropped and
+// the stream stops writing, so a full disk doesn't stop the game.
+StreamFile.Flush = function()
+    if self.bufferSize <= 0 then return self.error
+    text = self.buffer.join("")
+    self.buffer = []
+    self.bufferSize = 0
+    if self.error != null then return self.error
+    if self.content == null then
+        self.error = self.open
+        if self.error != null then return self.error
+    end if
+    if self.content.len > 0 and self.content.len + text.len > self.maxFileSize then
+        self.error = self.rotate
+        if self.error != null then return self.error
+    end if
+    self.content = self.content + text
+    res = self.file.set_content(self.content)
+    if typeof(res) == "string" then
+        self.error = "Failed writing " + self.path + " (" + res + ")."
+        return self.error
+    end if
+    self.written = self.written + text.len
+    self.flushes = self.flushes + 1
+    return null
+end function
+
+// open Find or create the file, keeping its current text, unless it's a fresh stream.
+StreamFile.open = function()
+    if self.fresh then
+        self.fresh = false
+        err = self.retire
+        if err != null then return err
+    end if
+    computer = get_shell.host_computer
+    self.file = computer.File(self.path)
+    if self.file == null then
+        parts = self.path.split("/")
+        name = parts.pop
+        res = computer.touch(parts.join("/"), name)
+        if typeof(res) == "string" then return "Failed creating " + self.path + " (" + res + ")."
+        self.file = computer.File(self.path)
+        if self.file == null then return "Failed creating " + self.path + "."
+    end if
+    self.content = self.file.get_content
+    if self.content == null then self.content = ""
+    return null
+end function
+
+// rotate Rename the full file to the next unused part number, and start a new file.
+StreamFile.rotate = function()
+    computer = get_shell.host_computer
+    name = self.path.split("/")[-1]
+    part = 1
+    while computer.File(self.path + "." + part) != null
+        part = part + 1
+    end while
+    res = self.file.rename(name + "." + part)
+    if typeof(res) == "string" and res.len > 0 then return "Failed renaming " + self.path + " (" + res + ")."
+    self.file = null
+    self.content = ""
+    self.rotations = self.rotations + 1
+    return self.open
+end function
+
+// retire Move the file and its parts to "(name).old", replacing the earlier ones there.
+StreamFile.retire = function()
+    computer = get_shell.host_computer
+    for path in StreamPartPaths(self.path + ".old")
+        res = computer.File(path).delete
+        if typeof(res) == "string" and res.len > 0 then return "Failed removing " + path + " (" + res + ")."
+    end for
+    name = self.path.split("/")[-1]
+    for path in StreamPartPaths(self.path)
+        res = computer.File(path).rename(name + ".old" + path[self.path.len:])
+        if typeof(res) == "string" and res.len > 0 then return "Failed renaming " + path + " (" + res + ")."
+    end for
+    return null
+end function
+
+// Summary The stream counters, as one line.
+StreamFile.Summary = function()
+    ret = self.path + ": " + self.written + " written in " + self.flushes + " writes, " + self.bufferSize + " buffered, " + self.rotations + " rotations"
+    if self.error != null then ret = ret + "; " + self.error
+    return ret
+end function
+
+// ReadStreamLines The lines of a stream file and its rotated parts, oldest first.
+//
+// A relative path is in the current directory, or else the home directory.  Each part
+// ends with a newline, which doesn't start another line; blank lines are kept, as
+// they're commands too.  Returns null if there is no such file.
+ReadStreamLines = function(path)
+    computer = get_shell.host_computer
+    if path.len <= 0 or path[0] != "/" then
+        name = path
+        path = current_path + "/" + name
+        if computer.File(path) == null and computer.File(path + ".1") == null then path = home_dir + "/" + name
+    end if
+    paths = StreamPartPaths(path)
+    if paths.len <= 0 then return null
+    ret = []
+    for part in paths
+        content = computer.File(part).get_content
+        if content == null or content.len <= 0 then continue
+        if content[-1] == char(10) then content = content[:-1]
+        ret = ret + content.split(char(10))
+    end for
+    return ret
+end function
+
+// StreamPartPaths The paths of the existing rotated parts of a stream file, oldest first,
+// then the path itself if it exists.
+StreamPartPaths = function(path)
+    computer = get_shell.host_computer
+    ret = []
+    part = 1
+    while computer.File(path + "." + part) != null
+        ret.push(path + "." + part)
+        part = part + 1
+    end while
+    if computer.File(path) != null then ret.push(path)
+    return ret
+end function